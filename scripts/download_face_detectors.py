@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Download the CNN face detector models (YuNet, RFB-320) into models/."""
+
+import argparse
+import sys
+import urllib.request
+from pathlib import Path
+
+# Backend name -> (model file, source URL)
+MODELS = {
+    'yunet': (
+        'face_detection_yunet_2023mar.onnx',
+        'https://github.com/opencv/opencv_zoo/raw/main/models/face_detection_yunet/'
+        'face_detection_yunet_2023mar.onnx'
+    ),
+    'onnx': (
+        'version-RFB-320.onnx',
+        'https://github.com/Linzaer/Ultra-Light-Fast-Generic-Face-Detector-1MB/raw/master/models/onnx/'
+        'version-RFB-320.onnx'
+    ),
+}
+
+MODELS_DIR = Path(__file__).resolve().parent.parent / 'models'
+
+
+def download_model(name, force=False):
+    """Download one backend's model; returns True if the file is in place."""
+    filename, url = MODELS[name]
+    target = MODELS_DIR / filename
+    if target.exists() and not force:
+        print(f"{name}: {target} already exists")
+        return True
+
+    print(f"{name}: downloading {url}")
+    partial = target.with_suffix(target.suffix + '.part')
+    try:
+        MODELS_DIR.mkdir(parents=True, exist_ok=True)
+        urllib.request.urlretrieve(url, partial)
+        partial.replace(target)
+    except Exception as e:
+        print(f"Error downloading {name} model: {e}")
+        partial.unlink(missing_ok=True)
+        return False
+
+    print(f"{name}: saved {target} ({target.stat().st_size / 2**20:.1f} MB)")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'backends', nargs='*', metavar='BACKEND',
+        help=f"Backends to download ({', '.join(sorted(MODELS))}; default: all)"
+    )
+    parser.add_argument('--force', action='store_true', help="Download even if the file exists")
+    args = parser.parse_args()
+
+    # Checked here: argparse rejects an empty list against choices
+    unknown = sorted(set(args.backends) - set(MODELS))
+    if unknown:
+        parser.error(f"unknown backend(s): {', '.join(unknown)} (choose from {', '.join(sorted(MODELS))})")
+
+    backends = args.backends or sorted(MODELS)
+    ok = all([download_model(name, args.force) for name in backends])
+    if 'onnx' in backends:
+        print("\nNote: the onnx backend also needs onnxruntime (pip install onnxruntime)")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
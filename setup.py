@@ -40,6 +40,9 @@ setup(
     entry_points={
         "console_scripts": [
             "facial-detection=src.main:main",
+            "facial-detection-analytics=src.analytics.cli:main",
+            "facial-detection-benchmark=src.benchmarks.cli:main",
+            "facial-detection-headless=src.headless:main",
         ],
     },
 )
@@ -0,0 +1,21 @@
+"""Offline analytics over recorded sessions."""
+
+from .session_stats import (
+    SessionColumns,
+    SessionSummary,
+    load_session_columns,
+    summarize_columns,
+    summarize_session,
+    summarize_sessions,
+    merge_summaries
+)
+
+__all__ = [
+    "SessionColumns",
+    "SessionSummary",
+    "load_session_columns",
+    "summarize_columns",
+    "summarize_session",
+    "summarize_sessions",
+    "merge_summaries"
+]
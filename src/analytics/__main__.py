@@ -0,0 +1,6 @@
+"""Allow running the analytics CLI with ``python -m src.analytics``."""
+
+from .cli import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Command-line entry point for session analytics."""
+
+import argparse
+import glob
+import json
+import os
+import sys
+from typing import List, Optional
+
+from .session_stats import summarize_sessions, merge_summaries, DEFAULT_MAX_GAP_S
+
+
+def _expand_paths(patterns: List[str]) -> List[str]:
+    """Expand files, directories and glob patterns into session file paths."""
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths.extend(sorted(
+                os.path.join(pattern, name) for name in os.listdir(pattern)
+                if name.startswith('session_')
+            ))
+        else:
+            matches = sorted(glob.glob(pattern))
+            paths.extend(matches if matches else [pattern])
+    return paths
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the analytics CLI."""
+    parser = argparse.ArgumentParser(
+        description="Aggregate statistics over recorded detection sessions"
+    )
+    parser.add_argument(
+        "sessions", nargs="+",
+        help="Session files, directories or glob patterns (JSON or columnar, optionally .enc)"
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=None,
+        help="Worker processes (default: CPU count, 1 = no pool)"
+    )
+    parser.add_argument(
+        "--max-gap", type=float, default=DEFAULT_MAX_GAP_S,
+        help="Longest interval (seconds) between observations counted as dwell time"
+    )
+    parser.add_argument(
+        "--per-session", action="store_true",
+        help="Include per-session (and per-face) breakdowns in the report"
+    )
+    parser.add_argument("-o", "--output", help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    paths = _expand_paths(args.sessions)
+    if not paths:
+        print("No session files found", file=sys.stderr)
+        return 1
+
+    summaries = summarize_sessions(paths, workers=args.workers, max_gap_s=args.max_gap)
+    report = {"total": merge_summaries(summaries).to_dict()}
+    if args.per_session:
+        report["sessions"] = {
+            path: summary.to_dict() for path, summary in zip(paths, summaries)
+        }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+        print(f"Report written to: {args.output}")
+    else:
+        print(output)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
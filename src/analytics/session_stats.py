@@ -0,0 +1,398 @@
+"""Vectorized aggregate statistics over recorded sessions."""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+import os
+
+import numpy as np
+
+from ..data.columnar import DEFAULT_EMOTIONS, FLAG_DECEPTIVE, UNKNOWN_EMOTION
+from ..data.logger import SessionLogger
+
+PERCENTILES = (50, 90, 95, 99)
+
+# Gaps longer than this between two observations of a face are not counted
+# as dwell time or transitions (the face was lost or monitoring was paused)
+DEFAULT_MAX_GAP_S = 2.0
+
+
+@dataclass
+class SessionColumns:
+    """One session loaded as flat numpy columns."""
+    session_id: str
+    emotions: List[str]
+    frame_number: np.ndarray
+    frame_timestamp: np.ndarray
+    processing_time_ms: np.ndarray
+    face_count: np.ndarray
+    face_frame_number: np.ndarray
+    face_timestamp: np.ndarray
+    face_id: np.ndarray
+    emotion: np.ndarray
+    confidence: np.ndarray
+    deceptive: np.ndarray
+
+
+@dataclass
+class SessionSummary:
+    """Aggregates for one session, or several merged together."""
+    emotions: List[str]
+    sessions: int = 0
+    frames: int = 0
+    face_observations: int = 0
+    duration_s: float = 0.0
+    deception_events: int = 0
+    dwell_s: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    transitions: np.ndarray = field(default_factory=lambda: np.zeros((0, 0), dtype=np.int64))
+    face_count_hist: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    processing_time_ms: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float32))
+    per_face_dwell_s: Dict[int, np.ndarray] = field(default_factory=dict)
+    per_face_deception_events: Dict[int, int] = field(default_factory=dict)
+
+    def aligned(self, emotions: List[str]) -> "SessionSummary":
+        """Re-index emotion axes onto a (superset) vocabulary."""
+        if emotions == self.emotions:
+            return self
+        index = np.array([emotions.index(e) for e in self.emotions], dtype=np.int64)
+        size = len(emotions)
+
+        dwell = np.zeros(size)
+        dwell[index] = self.dwell_s
+        transitions = np.zeros((size, size), dtype=np.int64)
+        transitions[np.ix_(index, index)] = self.transitions
+        per_face = {}
+        for face_id, values in self.per_face_dwell_s.items():
+            per_face[face_id] = np.zeros(size)
+            per_face[face_id][index] = values
+
+        return SessionSummary(
+            emotions=list(emotions),
+            sessions=self.sessions,
+            frames=self.frames,
+            face_observations=self.face_observations,
+            duration_s=self.duration_s,
+            deception_events=self.deception_events,
+            dwell_s=dwell,
+            transitions=transitions,
+            face_count_hist=self.face_count_hist,
+            processing_time_ms=self.processing_time_ms,
+            per_face_dwell_s=per_face,
+            per_face_deception_events=dict(self.per_face_deception_events)
+        )
+
+    def merge(self, other: "SessionSummary") -> "SessionSummary":
+        """
+        Combine two summaries.
+
+        Per-face breakdowns are dropped because face IDs are only meaningful
+        within a single session.
+        """
+        emotions = list(self.emotions) + [e for e in other.emotions if e not in self.emotions]
+        a = self.aligned(emotions)
+        b = other.aligned(emotions)
+
+        hist_len = max(len(a.face_count_hist), len(b.face_count_hist))
+        hist = np.zeros(hist_len, dtype=np.int64)
+        hist[:len(a.face_count_hist)] += a.face_count_hist
+        hist[:len(b.face_count_hist)] += b.face_count_hist
+
+        return SessionSummary(
+            emotions=emotions,
+            sessions=a.sessions + b.sessions,
+            frames=a.frames + b.frames,
+            face_observations=a.face_observations + b.face_observations,
+            duration_s=a.duration_s + b.duration_s,
+            deception_events=a.deception_events + b.deception_events,
+            dwell_s=_add_padded(a.dwell_s, b.dwell_s, len(emotions)),
+            transitions=_add_padded_2d(a.transitions, b.transitions, len(emotions)),
+            face_count_hist=hist,
+            processing_time_ms=np.concatenate([a.processing_time_ms, b.processing_time_ms])
+        )
+
+    @property
+    def deception_rate_per_min(self) -> float:
+        """Deception events per minute of monitored time."""
+        if self.duration_s <= 0:
+            return 0.0
+        return self.deception_events / (self.duration_s / 60.0)
+
+    def processing_percentiles(self) -> Dict[str, float]:
+        """Processing time percentiles in milliseconds."""
+        if self.processing_time_ms.size == 0:
+            return {f"p{p}": 0.0 for p in PERCENTILES}
+        values = np.percentile(self.processing_time_ms, PERCENTILES)
+        return {f"p{p}": float(v) for p, v in zip(PERCENTILES, values)}
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable report."""
+        report = {
+            "sessions": self.sessions,
+            "frames": self.frames,
+            "face_observations": self.face_observations,
+            "duration_s": self.duration_s,
+            "deception_events": self.deception_events,
+            "deception_rate_per_min": self.deception_rate_per_min,
+            "processing_time_ms": self.processing_percentiles(),
+            "face_count_histogram": self.face_count_hist.tolist(),
+            "emotion_dwell_s": {
+                e: float(v) for e, v in zip(self.emotions, self.dwell_s) if v > 0
+            },
+            "transitions": {
+                "labels": self.emotions,
+                "counts": self.transitions.tolist()
+            },
+        }
+        if self.per_face_dwell_s:
+            report["faces"] = {
+                str(face_id): {
+                    "dwell_s": {e: float(v) for e, v in zip(self.emotions, dwell) if v > 0},
+                    "deception_events": self.per_face_deception_events.get(face_id, 0)
+                }
+                for face_id, dwell in sorted(self.per_face_dwell_s.items())
+            }
+        return report
+
+
+def _add_padded(a: np.ndarray, b: np.ndarray, size: int) -> np.ndarray:
+    """Add two 1-D arrays after zero-padding both to size."""
+    out = np.zeros(size)
+    out[:len(a)] += a
+    out[:len(b)] += b
+    return out
+
+
+def _add_padded_2d(a: np.ndarray, b: np.ndarray, size: int) -> np.ndarray:
+    """Add two square matrices after zero-padding both to size x size."""
+    out = np.zeros((size, size), dtype=np.int64)
+    out[:a.shape[0], :a.shape[1]] += a
+    out[:b.shape[0], :b.shape[1]] += b
+    return out
+
+
+def load_session_columns(file_path: str, logger: Optional[SessionLogger] = None) -> SessionColumns:
+    """
+    Load a JSON or columnar session (optionally encrypted) as flat columns.
+
+    Args:
+        file_path: Path to a session file
+        logger: SessionLogger used for decryption (default credentials if None)
+
+    Returns:
+        SessionColumns
+    """
+    if logger is None:
+        logger = SessionLogger({'logging': {'enabled': False, 'encrypt': True}})
+
+    data = logger.load_session(file_path)
+    session_id = (data.get('metadata') or {}).get('session_id') or os.path.basename(file_path)
+
+    if isinstance(data.get('frames'), dict):
+        return _columns_from_columnar(session_id, data)
+    return _columns_from_json(session_id, data)
+
+
+def _columns_from_columnar(session_id: str, data: dict) -> SessionColumns:
+    """Build SessionColumns from load_columnar output."""
+    frames = data['frames']
+    faces = data['faces']
+    n_faces = len(faces.get('face_id', []))
+
+    frame_numbers = frames.get('frame_number', np.empty(0, dtype=np.uint32)).astype(np.int64)
+    timestamps = frames.get('timestamp', np.empty(0))
+    face_frames = faces.get('frame_number', np.empty(0, dtype=np.uint32)).astype(np.int64)
+
+    # Frame numbers increase through a session, so faces join by binary search
+    if len(frame_numbers):
+        rows = np.clip(np.searchsorted(frame_numbers, face_frames), 0, len(frame_numbers) - 1)
+        face_timestamps = timestamps[rows]
+    else:
+        face_timestamps = np.zeros(n_faces)
+
+    flags = faces.get('flags')
+    return SessionColumns(
+        session_id=session_id,
+        emotions=list(data['emotions']),
+        frame_number=frame_numbers,
+        frame_timestamp=timestamps,
+        processing_time_ms=frames.get('processing_time_ms', np.empty(0, dtype=np.float32)),
+        face_count=frames.get('face_count', np.empty(0, dtype=np.uint16)).astype(np.int64),
+        face_frame_number=face_frames,
+        face_timestamp=face_timestamps,
+        face_id=faces.get('face_id', np.empty(0, dtype=np.int32)).astype(np.int64),
+        emotion=faces.get('emotion', np.full(n_faces, UNKNOWN_EMOTION, dtype=np.uint8)).astype(np.int64),
+        confidence=faces.get('confidence', np.zeros(n_faces)).astype(np.float32),
+        deceptive=(flags & FLAG_DECEPTIVE) != 0 if flags is not None else np.zeros(n_faces, dtype=bool)
+    )
+
+
+def _columns_from_json(session_id: str, data: dict) -> SessionColumns:
+    """Build SessionColumns from a JSON session log."""
+    frames = data.get('frames', [])
+    emotions = list(DEFAULT_EMOTIONS)
+    emotion_index = {e: i for i, e in enumerate(emotions)}
+
+    def parse_time(value) -> float:
+        return datetime.fromisoformat(value).timestamp() if value else 0.0
+
+    frame_number = np.fromiter((f.get('frame_number', 0) for f in frames), dtype=np.int64, count=len(frames))
+    frame_timestamp = np.fromiter((parse_time(f.get('timestamp')) for f in frames), dtype=np.float64, count=len(frames))
+    processing = np.fromiter((f.get('processing_time_ms', 0.0) for f in frames), dtype=np.float32, count=len(frames))
+    face_count = np.fromiter((len(f.get('faces', [])) for f in frames), dtype=np.int64, count=len(frames))
+
+    faces = [(i, face) for i, f in enumerate(frames) for face in f.get('faces', [])]
+    frame_rows = np.fromiter((i for i, _ in faces), dtype=np.int64, count=len(faces))
+
+    codes = []
+    for _, face in faces:
+        label = face.get('emotion')
+        if label is None:
+            codes.append(UNKNOWN_EMOTION)
+            continue
+        if label not in emotion_index:
+            emotion_index[label] = len(emotions)
+            emotions.append(label)
+        codes.append(emotion_index[label])
+
+    return SessionColumns(
+        session_id=session_id,
+        emotions=emotions,
+        frame_number=frame_number,
+        frame_timestamp=frame_timestamp,
+        processing_time_ms=processing,
+        face_count=face_count,
+        face_frame_number=frame_number[frame_rows] if len(frames) else frame_rows,
+        face_timestamp=frame_timestamp[frame_rows] if len(frames) else frame_rows.astype(np.float64),
+        face_id=np.fromiter((face.get('face_id', 0) for _, face in faces), dtype=np.int64, count=len(faces)),
+        emotion=np.asarray(codes, dtype=np.int64),
+        confidence=np.fromiter((face.get('confidence', 0.0) for _, face in faces), dtype=np.float32, count=len(faces)),
+        deceptive=np.fromiter(
+            ((face.get('deception') or {}).get('is_deceptive', False) for _, face in faces),
+            dtype=bool, count=len(faces)
+        )
+    )
+
+
+def summarize_columns(columns: SessionColumns, max_gap_s: float = DEFAULT_MAX_GAP_S) -> SessionSummary:
+    """
+    Compute aggregates for one session.
+
+    Args:
+        columns: Session columns
+        max_gap_s: Longest interval between observations counted as dwell time
+
+    Returns:
+        SessionSummary with per-face breakdowns
+    """
+    emotions = columns.emotions
+    n_emotions = len(emotions)
+
+    duration = 0.0
+    if columns.frame_timestamp.size > 1:
+        duration = float(columns.frame_timestamp.max() - columns.frame_timestamp.min())
+
+    summary = SessionSummary(
+        emotions=list(emotions),
+        sessions=1,
+        frames=int(columns.frame_number.size),
+        face_observations=int(columns.face_id.size),
+        duration_s=duration,
+        deception_events=int(columns.deceptive.sum()),
+        dwell_s=np.zeros(n_emotions),
+        transitions=np.zeros((n_emotions, n_emotions), dtype=np.int64),
+        face_count_hist=np.bincount(columns.face_count) if columns.face_count.size else np.zeros(1, dtype=np.int64),
+        processing_time_ms=columns.processing_time_ms.astype(np.float32)
+    )
+
+    if columns.face_id.size == 0:
+        return summary
+
+    # Order observations by face, then time
+    order = np.lexsort((columns.face_timestamp, columns.face_id))
+    face_ids = columns.face_id[order]
+    times = columns.face_timestamp[order]
+    codes = columns.emotion[order]
+    valid = codes < n_emotions
+
+    # Consecutive observations of the same face
+    same_face = face_ids[1:] == face_ids[:-1]
+    both_valid = valid[1:] & valid[:-1]
+    dt = np.diff(times)
+    counted = same_face & both_valid & (dt <= max_gap_s)
+
+    # Dwell: each interval is attributed to the emotion at its start
+    dwell_codes = codes[:-1][counted]
+    dwell_dt = dt[counted]
+    summary.dwell_s = np.bincount(dwell_codes, weights=dwell_dt, minlength=n_emotions)
+
+    # Transitions between consecutive (different) emotions of the same face
+    changed = counted & (codes[1:] != codes[:-1])
+    pairs = codes[:-1][changed] * n_emotions + codes[1:][changed]
+    summary.transitions = np.bincount(
+        pairs, minlength=n_emotions * n_emotions
+    ).reshape(n_emotions, n_emotions)
+
+    # Per-face breakdowns
+    unique_faces, face_index = np.unique(face_ids, return_inverse=True)
+    per_face = np.zeros((len(unique_faces), n_emotions))
+    np.add.at(per_face, (face_index[:-1][counted], dwell_codes), dwell_dt)
+    deception_counts = np.bincount(face_index, weights=columns.deceptive[order], minlength=len(unique_faces))
+
+    summary.per_face_dwell_s = {int(f): per_face[i] for i, f in enumerate(unique_faces)}
+    summary.per_face_deception_events = {
+        int(f): int(deception_counts[i]) for i, f in enumerate(unique_faces)
+    }
+
+    return summary
+
+
+def summarize_session(file_path: str, max_gap_s: float = DEFAULT_MAX_GAP_S) -> SessionSummary:
+    """Load and summarize a single session file."""
+    return summarize_columns(load_session_columns(file_path), max_gap_s=max_gap_s)
+
+
+def summarize_sessions(
+    file_paths: Iterable[str],
+    workers: Optional[int] = None,
+    max_gap_s: float = DEFAULT_MAX_GAP_S
+) -> List[SessionSummary]:
+    """
+    Summarize many sessions in parallel.
+
+    Args:
+        file_paths: Session files
+        workers: Worker processes (None = CPU count, 1 = in-process)
+        max_gap_s: Longest interval counted as dwell time
+
+    Returns:
+        Per-session summaries, in input order
+    """
+    file_paths = list(file_paths)
+    if workers == 1 or len(file_paths) <= 1:
+        return [summarize_session(p, max_gap_s) for p in file_paths]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(
+            summarize_session,
+            file_paths,
+            [max_gap_s] * len(file_paths),
+            chunksize=max(1, len(file_paths) // ((workers or os.cpu_count() or 1) * 4))
+        ))
+
+
+def merge_summaries(summaries: Iterable[SessionSummary]) -> SessionSummary:
+    """Merge per-session summaries into one aggregate."""
+    summaries = list(summaries)
+    if not summaries:
+        n_emotions = len(DEFAULT_EMOTIONS)
+        return SessionSummary(
+            emotions=list(DEFAULT_EMOTIONS),
+            dwell_s=np.zeros(n_emotions),
+            transitions=np.zeros((n_emotions, n_emotions), dtype=np.int64)
+        )
+
+    merged = summaries[0]
+    for summary in summaries[1:]:
+        merged = merged.merge(summary)
+    return merged
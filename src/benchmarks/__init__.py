@@ -0,0 +1,25 @@
+"""Reproducible offline benchmarks of the detection and emotion pipeline."""
+
+from .suite import (
+    BenchmarkResult,
+    RESOLUTIONS,
+    STAGES,
+    measure,
+    run_suite
+)
+from .regression import (
+    ComparisonReport,
+    compare_reports,
+    merge_reports
+)
+
+__all__ = [
+    "BenchmarkResult",
+    "RESOLUTIONS",
+    "STAGES",
+    "measure",
+    "run_suite",
+    "ComparisonReport",
+    "compare_reports",
+    "merge_reports"
+]
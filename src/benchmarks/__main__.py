@@ -0,0 +1,8 @@
+"""Allow running the benchmarks with ``python -m src.benchmarks``."""
+
+import sys
+
+from .cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
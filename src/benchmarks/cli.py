@@ -0,0 +1,192 @@
+"""Command-line entry point for the benchmark suite."""
+
+import argparse
+import contextlib
+import json
+import sys
+from typing import List, Optional
+
+from ..config import load_config
+from .suite import RESOLUTIONS, STAGES, DEFAULT_FACE_COUNTS, BenchmarkResult, run_suite
+from .regression import (
+    DEFAULT_GATED_STAGES,
+    DEFAULT_THRESHOLDS,
+    ComparisonReport,
+    compare_reports,
+    load_report,
+    merge_reports
+)
+
+
+def _csv(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    """One progress line per result (on stderr, so stdout stays JSON)."""
+    if result.skipped:
+        print(f"  {result.name:<40} skipped: {result.skipped}", file=sys.stderr)
+        return
+    latency = result.latency
+    print(
+        f"  {result.name:<40} {result.throughput:10.1f} {result.unit}s/s  "
+        f"p50 {latency['p50_ms']:8.2f}ms  p99 {latency['p99_ms']:8.2f}ms  "
+        f"peak RSS {result.peak_rss_bytes / 2**20:7.1f}MB",
+        file=sys.stderr
+    )
+
+
+def _threshold(value: str):
+    metric, _, fraction = value.partition("=")
+    if metric not in DEFAULT_THRESHOLDS or not fraction:
+        raise argparse.ArgumentTypeError(
+            f"expected METRIC=FRACTION with METRIC in {', '.join(DEFAULT_THRESHOLDS)}"
+        )
+    return metric, float(fraction)
+
+
+def _print_comparison(comparison: ComparisonReport) -> None:
+    """Human-readable gate summary (on stderr)."""
+    for warning in comparison.warnings:
+        print(f"WARNING: {warning}", file=sys.stderr)
+    for name in comparison.missing:
+        print(f"  missing from candidate: {name}", file=sys.stderr)
+    for label, items in (("REGRESSION", comparison.regressions), ("improved", comparison.improvements)):
+        for c in items:
+            print(
+                f"  {label:<10} {c.name:<40} {c.metric:<16} {c.baseline:12.4g} -> {c.candidate:12.4g} "
+                f"({c.change:+.1%}, 95% CI {c.ci_low:+.1%}..{c.ci_high:+.1%})",
+                file=sys.stderr
+            )
+    if comparison.passed:
+        verdict = "PASSED"
+    else:
+        missing = 0 if comparison.allow_missing else len(comparison.missing)
+        verdict = f"FAILED ({len(comparison.regressions)} regressions, {missing} missing)"
+    print(f"Regression gate {verdict}: {len(comparison.comparisons)} metrics compared", file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark CLI."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the detection pipeline on sample images and generated frames"
+    )
+    parser.add_argument(
+        "-r", "--resolutions", type=_csv, default=list(RESOLUTIONS),
+        help=f"Comma-separated resolutions (default: {','.join(RESOLUTIONS)})"
+    )
+    parser.add_argument(
+        "-f", "--faces", type=_csv, default=[str(n) for n in DEFAULT_FACE_COUNTS],
+        help="Comma-separated faces per generated frame (default: 1,4,8)"
+    )
+    parser.add_argument(
+        "-s", "--stages", type=_csv, default=list(STAGES),
+        help=f"Comma-separated stages (default: {','.join(STAGES)})"
+    )
+    parser.add_argument("-n", "--frames", type=int, default=30, help="Measured frames per scenario")
+    parser.add_argument("--warmup", type=int, default=3, help="Unmeasured frames per scenario")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for generated inputs")
+    parser.add_argument("-c", "--config", help="Settings file (default: config/settings.yaml)")
+    parser.add_argument("--repeat", type=int, default=1, help="Run the suite this many times (noise estimate)")
+    parser.add_argument("-o", "--output", help="Write the JSON report to this file")
+
+    gate = parser.add_argument_group("regression gate")
+    gate.add_argument("--baseline", help="Compare against this baseline report; exit 1 on regressions")
+    gate.add_argument(
+        "--compare", nargs="+", metavar="REPORT",
+        help="Compare existing reports with --baseline instead of running the suite"
+    )
+    gate.add_argument(
+        "--save-baseline", metavar="PATH",
+        help="Merge this run (or --compare reports) into a baseline file"
+    )
+    gate.add_argument(
+        "--threshold", type=_threshold, action="append", default=[],
+        help="Relative threshold per metric, e.g. p99_ms=0.3 (repeatable)"
+    )
+    gate.add_argument(
+        "--allow-missing", action="store_true",
+        help="Pass even if gated benchmarks are missing or skipped in this run"
+    )
+    gate.add_argument(
+        "--gate-stages", type=_csv, default=list(DEFAULT_GATED_STAGES),
+        help=f"Stage prefixes to gate (default: {','.join(DEFAULT_GATED_STAGES)})"
+    )
+    args = parser.parse_args(argv)
+    if args.compare and not (args.baseline or args.save_baseline):
+        parser.error("--compare requires --baseline or --save-baseline")
+
+    if args.compare:
+        report = merge_reports(load_report(path) for path in args.compare)
+        return _gate(args, report)
+
+    unknown = [r for r in args.resolutions if r not in RESOLUTIONS]
+    if unknown:
+        parser.error(f"unknown resolutions: {', '.join(unknown)}")
+    try:
+        face_counts = [int(n) for n in args.faces]
+    except ValueError:
+        parser.error("--faces takes integers")
+
+    config = load_config(args.config)
+
+    # Model initialization prints to stdout; keep stdout for the report
+    reports = []
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            for run in range(max(args.repeat, 1)):
+                if args.repeat > 1:
+                    print(f"Run {run + 1}/{args.repeat}", file=sys.stderr)
+                reports.append(run_suite(
+                    config,
+                    resolutions=args.resolutions,
+                    face_counts=face_counts,
+                    frames=args.frames,
+                    warmup=args.warmup,
+                    stages=args.stages,
+                    seed=args.seed,
+                    progress=_print_result
+                ))
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    report = reports[0] if len(reports) == 1 else merge_reports(reports)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+        print(f"Report written to: {args.output}", file=sys.stderr)
+    elif not (args.baseline or args.save_baseline):
+        print(output)
+    return _gate(args, report)
+
+
+def _gate(args, report: dict) -> int:
+    """Save and/or check the regression baseline; returns the exit code."""
+    if args.baseline:
+        try:
+            baseline = load_report(args.baseline)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: Cannot read baseline {args.baseline}: {e}", file=sys.stderr)
+            return 1
+        comparison = compare_reports(
+            baseline,
+            report,
+            thresholds=dict(args.threshold),
+            stages=args.gate_stages or None,
+            allow_missing=args.allow_missing
+        )
+        _print_comparison(comparison)
+        if not comparison.passed:
+            return 1
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(merge_reports([report]), f, indent=2)
+        print(f"Baseline written to: {args.save_baseline}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,318 @@
+"""Noise-aware comparison of benchmark reports against a stored baseline."""
+
+import json
+import math
+import statistics
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Gated metrics: (path in a result, True if higher is better)
+METRICS: Dict[str, Tuple[Tuple[str, ...], bool]] = {
+    "throughput_per_s": (("throughput_per_s",), True),
+    "p50_ms": (("latency", "p50_ms"), False),
+    "p95_ms": (("latency", "p95_ms"), False),
+    "p99_ms": (("latency", "p99_ms"), False),
+    # Memory the stage itself added (the process-wide peak depends on the
+    # stages that ran before it)
+    "rss_delta_bytes": (("rss_delta_bytes",), False),
+}
+
+# Stages gated by default (prefixes of result stage names)
+DEFAULT_GATED_STAGES = ("face_detector", "model.", "logger.")
+
+# Relative change (fraction) tolerated before a significant change is flagged
+DEFAULT_THRESHOLDS = {
+    "throughput_per_s": 0.10,
+    "p50_ms": 0.10,
+    "p95_ms": 0.15,
+    "p99_ms": 0.20,
+    "rss_delta_bytes": 0.10,
+}
+
+# Smallest baseline value changes are measured against, so metrics that are
+# often near zero (a stage that allocates little) are not flagged for noise
+MIN_SCALE = {
+    "rss_delta_bytes": 8 * 2**20,
+}
+
+# Two-sided 95% Student t critical values by degrees of freedom
+_T_CRITICAL = (
+    (1, 12.706), (2, 4.303), (3, 3.182), (4, 2.776), (5, 2.571), (6, 2.447),
+    (7, 2.365), (8, 2.306), (9, 2.262), (10, 2.228), (12, 2.179), (15, 2.131),
+    (20, 2.086), (30, 2.042), (60, 2.000),
+)
+
+
+def t_critical(df: float) -> float:
+    """95% two-sided t critical value (conservative: rounds df down)."""
+    if df > 120:
+        return 1.96
+    critical = _T_CRITICAL[0][1]
+    for table_df, value in _T_CRITICAL:
+        if df >= table_df:
+            critical = value
+    return critical
+
+
+def _metric_value(result: dict, path: Tuple[str, ...]) -> Optional[float]:
+    value = result
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return float(value)
+
+
+def merge_reports(reports: Iterable[dict]) -> dict:
+    """
+    Pool repeated runs into one report.
+
+    Each merged result keeps every run's value of the gated metrics under
+    ``samples``; its top-level metrics are the medians across runs.
+
+    Args:
+        reports: Reports from run_suite or earlier merges
+
+    Returns:
+        Merged report
+    """
+    reports = list(reports)
+    if not reports:
+        raise ValueError("No benchmark reports to merge")
+
+    merged: Dict[str, dict] = {}
+    samples: Dict[str, Dict[str, List[float]]] = {}
+    for report in reports:
+        for result in report.get("results", []):
+            if result.get("skipped"):
+                continue
+            name = result["name"]
+            merged.setdefault(name, json.loads(json.dumps(result)))
+            pooled = samples.setdefault(name, {metric: [] for metric in METRICS})
+            for metric, (path, _) in METRICS.items():
+                if "samples" in result:
+                    pooled[metric].extend(result["samples"].get(metric, []))
+                else:
+                    value = _metric_value(result, path)
+                    if value is not None:
+                        pooled[metric].append(value)
+
+    for name, result in merged.items():
+        result["samples"] = samples[name]
+        for metric, (path, _) in METRICS.items():
+            values = samples[name][metric]
+            if not values:
+                continue
+            target = result
+            for key in path[:-1]:
+                target = target.setdefault(key, {})
+            target[path[-1]] = statistics.median(values)
+
+    base = reports[0]
+    return {
+        "schema": base.get("schema"),
+        "created": base.get("created"),
+        "environment": base.get("environment", {}),
+        "parameters": base.get("parameters", {}),
+        "runs": sum(report.get("runs", 1) for report in reports),
+        "results": list(merged.values()),
+    }
+
+
+def load_report(path: str) -> dict:
+    """Load a benchmark report (JSON)."""
+    with open(path) as f:
+        return json.load(f)
+
+
+@dataclass
+class MetricComparison:
+    """Baseline vs candidate for one metric of one benchmark."""
+    name: str
+    metric: str
+    baseline: float
+    candidate: float
+    change: float  # Relative change of the means; positive = worse
+    ci_low: float  # 95% confidence interval of ``change`` (equal to it without samples)
+    ci_high: float
+    threshold: float
+    status: str  # 'regression', 'improvement' or 'unchanged'
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "name": self.name,
+            "metric": self.metric,
+            "baseline": self.baseline,
+            "candidate": self.candidate,
+            "change": self.change,
+            "ci": [self.ci_low, self.ci_high],
+            "threshold": self.threshold,
+            "status": self.status,
+        }
+
+
+@dataclass
+class ComparisonReport:
+    """Result of comparing a candidate report with a baseline."""
+    comparisons: List[MetricComparison] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)  # In the baseline only (or skipped)
+    added: List[str] = field(default_factory=list)  # In the candidate only
+    warnings: List[str] = field(default_factory=list)
+    allow_missing: bool = False
+
+    @property
+    def regressions(self) -> List[MetricComparison]:
+        return [c for c in self.comparisons if c.status == "regression"]
+
+    @property
+    def improvements(self) -> List[MetricComparison]:
+        return [c for c in self.comparisons if c.status == "improvement"]
+
+    @property
+    def passed(self) -> bool:
+        """Whether no metric regressed and (unless allowed) no benchmark went missing."""
+        return not self.regressions and (self.allow_missing or not self.missing)
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "passed": self.passed,
+            "regressions": [c.to_dict() for c in self.regressions],
+            "improvements": [c.to_dict() for c in self.improvements],
+            "comparisons": [c.to_dict() for c in self.comparisons],
+            "missing": self.missing,
+            "added": self.added,
+            "warnings": self.warnings,
+        }
+
+
+def compare_samples(
+    baseline: List[float],
+    candidate: List[float],
+    higher_is_better: bool,
+    min_scale: float = 0.0
+) -> Tuple[float, float, float]:
+    """
+    Relative change of the means with a 95% Welch confidence interval.
+
+    Args:
+        baseline: Baseline samples
+        candidate: Candidate samples
+        higher_is_better: Metric direction
+        min_scale: Smallest baseline magnitude changes are relative to
+
+    Returns:
+        (change, ci_low, ci_high) as fractions of the baseline mean,
+        signed so that positive means worse
+    """
+    base_mean = statistics.fmean(baseline)
+    cand_mean = statistics.fmean(candidate)
+    scale = max(abs(base_mean), min_scale)
+    if scale == 0:
+        return 0.0, 0.0, 0.0
+
+    sign = -1.0 if higher_is_better else 1.0
+    diff = sign * (cand_mean - base_mean)
+
+    base_var = statistics.variance(baseline) / len(baseline) if len(baseline) > 1 else 0.0
+    cand_var = statistics.variance(candidate) / len(candidate) if len(candidate) > 1 else 0.0
+    se = math.sqrt(base_var + cand_var)
+    margin = 0.0
+    if se > 0:
+        # Welch-Satterthwaite degrees of freedom
+        terms = [
+            var ** 2 / (len(samples) - 1)
+            for var, samples in ((base_var, baseline), (cand_var, candidate))
+            if len(samples) > 1
+        ]
+        df = (se ** 4) / sum(terms) if sum(terms) > 0 else 1.0
+        margin = t_critical(df) * se
+
+    return diff / scale, (diff - margin) / scale, (diff + margin) / scale
+
+
+def compare_reports(
+    baseline: dict,
+    candidate: dict,
+    thresholds: Optional[Dict[str, float]] = None,
+    stages: Optional[Iterable[str]] = DEFAULT_GATED_STAGES,
+    allow_missing: bool = False
+) -> ComparisonReport:
+    """
+    Compare a candidate report with a baseline, benchmark by benchmark.
+
+    A metric regresses when it is worse by more than its threshold and the
+    95% confidence interval of the change excludes zero, so run-to-run
+    noise measured by repeated runs does not fail the gate. Without
+    repeats (one sample per side) only the threshold applies. Gated
+    benchmarks missing (or skipped) in the candidate fail the gate, since
+    a broken stage produces no results at all.
+
+    Args:
+        baseline: Baseline report (merged or single run)
+        candidate: Candidate report (merged or single run)
+        thresholds: Relative thresholds per metric (default: DEFAULT_THRESHOLDS)
+        stages: Stage-name prefixes to gate (default: detector, models,
+            logger; None = every stage)
+        allow_missing: Pass even if gated benchmarks are missing
+
+    Returns:
+        ComparisonReport
+    """
+    thresholds = dict(DEFAULT_THRESHOLDS, **(thresholds or {}))
+    baseline = merge_reports([baseline])
+    candidate = merge_reports([candidate])
+    prefixes = tuple(stages) if stages else None
+
+    base_results = {r["name"]: r for r in baseline["results"]}
+    cand_results = {r["name"]: r for r in candidate["results"]}
+    if prefixes:
+        base_results = {n: r for n, r in base_results.items() if r["stage"].startswith(prefixes)}
+        cand_results = {n: r for n, r in cand_results.items() if r["stage"].startswith(prefixes)}
+
+    report = ComparisonReport(
+        missing=sorted(set(base_results) - set(cand_results)),
+        added=sorted(set(cand_results) - set(base_results)),
+        allow_missing=allow_missing
+    )
+
+    for key in ("machine", "cpu_count", "python"):
+        base_value = baseline["environment"].get(key)
+        cand_value = candidate["environment"].get(key)
+        if base_value != cand_value:
+            report.warnings.append(f"environment differs ({key}: {base_value} vs {cand_value})")
+    if baseline.get("runs", 1) < 2 or candidate.get("runs", 1) < 2:
+        report.warnings.append("single runs: no noise estimate, thresholds only (use --repeat)")
+
+    for name in sorted(set(base_results) & set(cand_results)):
+        for metric, (_, higher_is_better) in METRICS.items():
+            base_samples = base_results[name]["samples"][metric]
+            cand_samples = cand_results[name]["samples"][metric]
+            if not base_samples or not cand_samples:
+                continue
+
+            change, ci_low, ci_high = compare_samples(
+                base_samples, cand_samples, higher_is_better, MIN_SCALE.get(metric, 0.0)
+            )
+            threshold = thresholds[metric]
+            if change > threshold and ci_low > 0:
+                status = "regression"
+            elif change < -threshold and ci_high < 0:
+                status = "improvement"
+            else:
+                status = "unchanged"
+
+            report.comparisons.append(MetricComparison(
+                name=name,
+                metric=metric,
+                baseline=statistics.fmean(base_samples),
+                candidate=statistics.fmean(cand_samples),
+                change=change,
+                ci_low=ci_low,
+                ci_high=ci_high,
+                threshold=threshold,
+                status=status
+            ))
+
+    return report
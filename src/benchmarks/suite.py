@@ -0,0 +1,454 @@
+"""Offline pipeline benchmarks: throughput, latency percentiles and peak RSS per stage."""
+
+import os
+import platform
+import subprocess
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+import psutil
+
+from ..core.frame_sources import ImageDirectorySource, SyntheticSource
+from ..data.models import (
+    ActionUnit,
+    EmotionPrediction,
+    EMOTION_LABELS,
+    FaceAnalysis,
+    FaceRegion,
+    FrameAnalysis
+)
+from ..utils.instrumentation import LatencyHistogram
+
+# Bumped when the report layout changes incompatibly
+SCHEMA_VERSION = 1
+
+RESOLUTIONS: Dict[str, Tuple[int, int]] = {
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+    "4k": (3840, 2160),
+}
+DEFAULT_FACE_COUNTS = (1, 4, 8)
+STAGES = ("detector", "models", "ensemble", "deception", "logger")
+
+_TESTS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "tests")
+SAMPLES_DIR = os.path.normpath(os.path.join(_TESTS_DIR, "unsplash_samples"))
+SPRITES_DIR = os.path.normpath(os.path.join(_TESTS_DIR, "fer2013_samples"))
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one stage on one scenario."""
+    name: str  # Unique key "<stage>/<scenario>", used to compare runs
+    stage: str
+    scenario: str
+    faces: int = 0
+    items: int = 0  # Frames or faces processed, depending on the stage
+    unit: str = "frame"
+    elapsed_s: float = 0.0
+    latency: dict = field(default_factory=dict)  # Per call, LatencyHistogram.to_dict()
+    peak_rss_bytes: int = 0  # Process peak RSS while the stage ran
+    rss_delta_bytes: int = 0  # Peak RSS above the RSS before the stage
+    extra: dict = field(default_factory=dict)
+    skipped: Optional[str] = None
+
+    @property
+    def throughput(self) -> float:
+        """Items per second."""
+        return self.items / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dictionary."""
+        data = {
+            "name": self.name,
+            "stage": self.stage,
+            "scenario": self.scenario,
+            "faces": self.faces,
+        }
+        if self.skipped:
+            data["skipped"] = self.skipped
+            return data
+        data.update({
+            "unit": self.unit,
+            "items": self.items,
+            "elapsed_s": self.elapsed_s,
+            "throughput_per_s": self.throughput,
+            "latency": self.latency,
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "rss_delta_bytes": self.rss_delta_bytes,
+        })
+        data.update(self.extra)
+        return data
+
+
+class RssSampler:
+    """Polls the process RSS on a background thread to find its peak."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.process = psutil.Process()
+        self.baseline = 0
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        self.peak = max(self.peak, self.process.memory_info().rss)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        self.baseline = self.peak = self.process.memory_info().rss
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+
+def measure(
+    stage: str,
+    scenario: str,
+    call: Callable,
+    inputs: Iterable[tuple],
+    faces: int = 0,
+    unit: str = "frame",
+    items_per_call: int = 1,
+    warmup: int = 0
+) -> BenchmarkResult:
+    """
+    Time ``call(*args)`` over every input.
+
+    Input preparation (e.g. generating a frame) is not timed. The first
+    ``warmup`` calls are run but not recorded.
+
+    Args:
+        stage: Stage name
+        scenario: Scenario name
+        call: Function under test
+        inputs: Argument tuples, one per call
+        faces: Faces per frame in the scenario
+        unit: What an item is ('frame' or 'face')
+        items_per_call: Items each call processes (for throughput)
+        warmup: Unrecorded leading calls
+
+    Returns:
+        BenchmarkResult
+    """
+    result = BenchmarkResult(f"{stage}/{scenario}", stage, scenario, faces, unit=unit)
+    histogram = LatencyHistogram()
+
+    with RssSampler() as rss:
+        for i, args in enumerate(inputs):
+            start = time.perf_counter_ns()
+            call(*args)
+            elapsed = time.perf_counter_ns() - start
+            if i < warmup:
+                continue
+            histogram.record(elapsed)
+            result.items += items_per_call
+            result.elapsed_s += elapsed / 1e9
+
+    result.latency = histogram.to_dict()
+    result.peak_rss_bytes = rss.peak
+    result.rss_delta_bytes = rss.peak - rss.baseline
+    return result
+
+
+def _load_images(directory: str) -> List[np.ndarray]:
+    """Read every image of a directory (empty if it is missing)."""
+    if not os.path.isdir(directory):
+        return []
+    try:
+        source = ImageDirectorySource(directory)
+    except IOError:
+        return []
+    images = []
+    while True:
+        captured = source.read()
+        if captured is None:
+            return images
+        images.append(captured.image)
+
+
+def _synthetic_frames(
+    resolution: str,
+    faces: int,
+    frames: int,
+    sprites: Sequence[np.ndarray],
+    seed: int
+) -> Iterable[Tuple[np.ndarray, List[FaceRegion]]]:
+    """Generated frames with their ground-truth face regions."""
+    width, height = RESOLUTIONS[resolution]
+    source = SyntheticSource(
+        width=width,
+        height=height,
+        num_faces=faces,
+        face_size=max(height // 6, 48),
+        frames=frames,
+        sprites=sprites or None,
+        seed=seed
+    )
+    while True:
+        captured = source.read()
+        if captured is None:
+            return
+        regions = [FaceRegion(*box) for box in source.boxes_at(captured.index)]
+        yield captured.image, regions
+
+
+def _random_predictions(rng: np.random.Generator, model_names: Sequence[str]) -> List[EmotionPrediction]:
+    """One plausible prediction per model."""
+    predictions = []
+    for name in model_names:
+        scores = rng.dirichlet(np.ones(len(EMOTION_LABELS))).astype(np.float32)
+        dominant = int(scores.argmax())
+        predictions.append(EmotionPrediction(name, EMOTION_LABELS[dominant], float(scores[dominant]), scores))
+    return predictions
+
+
+def _random_faces(rng: np.random.Generator, faces: int, model_names: Sequence[str]) -> List[FaceAnalysis]:
+    """Fully populated face analyses, as produced by the emotion detector."""
+    analyses = []
+    for face_id in range(faces):
+        predictions = _random_predictions(rng, model_names)
+        top = max(predictions, key=lambda p: p.confidence)
+        analyses.append(FaceAnalysis(
+            face_id=face_id,
+            region=FaceRegion(int(rng.integers(0, 1600)), int(rng.integers(0, 900)), 160, 160),
+            emotion=top.emotion,
+            confidence=top.confidence,
+            model_predictions=predictions,
+            action_units=[
+                ActionUnit(au, float(rng.random()), bool(rng.random() > 0.5))
+                for au in (1, 2, 4, 6, 12, 15, 23, 24)
+            ]
+        ))
+    return analyses
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(__file__), capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def environment() -> dict:
+    """Describe the machine and library versions of a run."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "memory_bytes": psutil.virtual_memory().total,
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+        "commit": _git_commit(),
+    }
+
+
+def run_suite(
+    config: dict,
+    resolutions: Sequence[str] = tuple(RESOLUTIONS),
+    face_counts: Sequence[int] = DEFAULT_FACE_COUNTS,
+    frames: int = 30,
+    warmup: int = 3,
+    stages: Sequence[str] = STAGES,
+    seed: int = 0,
+    progress: Optional[Callable[[BenchmarkResult], None]] = None
+) -> dict:
+    """
+    Run the benchmark suite.
+
+    Detection and emotion models run on generated frames (faces pasted from
+    tests/fer2013_samples) at each resolution and face count, and on the
+    bundled tests/unsplash_samples images. Ensemble voting, deception
+    scoring and session logging run on generated analyses per face count.
+    Every input is derived from ``seed``, so runs are comparable.
+
+    Args:
+        config: Application configuration (models, ensemble, deception)
+        resolutions: Keys of RESOLUTIONS to run
+        face_counts: Faces per generated frame
+        frames: Measured frames per scenario
+        warmup: Unmeasured frames before each scenario
+        stages: Subset of STAGES to run
+        seed: Seed for generated frames and analyses
+        progress: Called with each result as it completes
+
+    Returns:
+        JSON-serializable report
+    """
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise ValueError(f"Unknown benchmark stages: {sorted(unknown)}")
+
+    results: List[BenchmarkResult] = []
+
+    def add(result: BenchmarkResult) -> None:
+        results.append(result)
+        if progress:
+            progress(result)
+
+    sprites = _load_images(SPRITES_DIR)
+    samples = _load_images(SAMPLES_DIR)
+    total = warmup + frames
+
+    # Image scenarios: (name, faces, frames with regions)
+    scenarios = [
+        (f"{resolution}/{faces}faces", faces,
+         lambda r=resolution, n=faces: _synthetic_frames(r, n, total, sprites, seed))
+        for resolution in resolutions for faces in face_counts
+    ]
+
+    detector = None
+    if "detector" in stages or "models" in stages:
+        from ..core.face_detector import FaceDetector
+        detector = FaceDetector(method="opencv")
+        if not detector.initialize():
+            detector = None
+
+    if samples and detector is not None:
+        sample_regions = [detector.detect_faces(image) for image in samples]
+        scenarios.append((
+            "samples", int(np.mean([len(r) for r in sample_regions])),
+            lambda: ((samples[i % len(samples)], sample_regions[i % len(samples)]) for i in range(total))
+        ))
+
+    if "detector" in stages:
+        for scenario, faces, inputs in scenarios:
+            if detector is None:
+                add(BenchmarkResult(f"face_detector/{scenario}", "face_detector", scenario, faces,
+                                    skipped="face detector unavailable"))
+                continue
+            add(measure(
+                "face_detector", scenario,
+                detector.detect_faces,
+                ((image,) for image, _ in inputs()),
+                faces=faces, warmup=warmup
+            ))
+
+    model_names = ["DeepFace", "FER", "MediaPipe", "OpenCV"]
+    if "models" in stages:
+        from ..detection.emotion_detector import EmotionDetector
+        emotion_detector = EmotionDetector(config)
+        if not emotion_detector.initialize():
+            add(BenchmarkResult("models", "models", "all", skipped="no emotion model available"))
+        else:
+            model_names = [model.model_name for model in emotion_detector.models]
+            for model in emotion_detector.models:
+                for scenario, faces, inputs in scenarios:
+                    # One call per face; warmup counted in frames
+                    calls = (
+                        (image, region)
+                        for image, regions in inputs() for region in regions
+                    )
+                    add(measure(
+                        f"model.{model.model_name}", scenario,
+                        model.predict_emotion,
+                        calls, faces=faces, unit="face", warmup=warmup * max(faces, 1)
+                    ))
+
+    for faces in face_counts:
+        scenario = f"{faces}faces"
+        rng = np.random.default_rng([seed, faces])
+        analyses = [_random_faces(rng, faces, model_names) for _ in range(total)]
+
+        if "ensemble" in stages:
+            from ..models import EnsembleVoter
+            ensemble_config = config.get('ensemble', {})
+            voter = EnsembleVoter(
+                method=ensemble_config.get('method', 'weighted_voting'),
+                min_models_required=1
+            )
+            weights = {name: 1.0 for name in model_names}
+
+            def vote(frame_faces):
+                for face in frame_faces:
+                    voter.vote(face.model_predictions, weights)
+
+            add(measure(
+                "ensemble", scenario, vote,
+                ((frame_faces,) for frame_faces in analyses),
+                faces=faces, unit="face", items_per_call=faces, warmup=warmup
+            ))
+
+        if "deception" in stages:
+            from ..detection.deception import DeceptionDetector
+            deception = DeceptionDetector(config)
+
+            def score(frame_faces):
+                for face in frame_faces:
+                    deception.analyze_for_deception(face.face_id, face)
+
+            add(measure(
+                "deception", scenario, score,
+                ((frame_faces,) for frame_faces in analyses),
+                faces=faces, unit="face", items_per_call=faces, warmup=warmup
+            ))
+
+        if "logger" in stages:
+            for log_format in ("json", "columnar"):
+                add(_measure_logger(config, log_format, scenario, faces, analyses, warmup))
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now().isoformat(),
+        "environment": environment(),
+        "parameters": {
+            "resolutions": list(resolutions),
+            "face_counts": list(face_counts),
+            "frames": frames,
+            "warmup": warmup,
+            "stages": list(stages),
+            "seed": seed,
+        },
+        "results": [result.to_dict() for result in results],
+    }
+
+
+def _measure_logger(
+    config: dict,
+    log_format: str,
+    scenario: str,
+    faces: int,
+    analyses: List[List[FaceAnalysis]],
+    warmup: int
+) -> BenchmarkResult:
+    """Time SessionLogger.log_frame per frame, plus the final save."""
+    from ..data.logger import SessionLogger
+
+    with tempfile.TemporaryDirectory() as directory:
+        logging_config = dict(config.get('logging', {}) or {}, enabled=True, format=log_format,
+                              directory=directory, encrypt=False)
+        logger = SessionLogger(dict(config, logging=logging_config))
+        logger.start_session("benchmark", {})
+
+        result = measure(
+            f"logger.{log_format}", scenario,
+            logger.log_frame,
+            ((FrameAnalysis(frame_number=i, faces=frame_faces, fps=10.0),)
+             for i, frame_faces in enumerate(analyses)),
+            faces=faces, warmup=warmup
+        )
+
+        start = time.perf_counter()
+        logger.save_session()
+        result.extra["save_s"] = time.perf_counter() - start
+        result.extra["file_bytes"] = os.path.getsize(logger.current_file_path)
+    return result
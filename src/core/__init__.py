@@ -2,8 +2,13 @@
 
 from .screen_capture import ScreenCapture
 from .face_detector import FaceDetector
+from .tracker import FaceTracker
+from .degradation import DegradationLadder, QualityState
 
 __all__ = [
     "ScreenCapture",
-    "FaceDetector"
+    "FaceDetector",
+    "FaceTracker",
+    "DegradationLadder",
+    "QualityState"
 ]
@@ -0,0 +1,93 @@
+"""Quality-of-service degradation ladder for the detection pipeline."""
+
+from dataclasses import dataclass, replace
+from typing import List, Optional, Tuple, Union
+
+# Walked in order as load rises, and back in reverse as headroom returns
+DEFAULT_LADDER = [
+    "disable_facs",
+    {"drop_model": "DeepFace"},
+    {"detection_scale": 0.5},
+    {"emotion_refresh": 3},
+]
+
+
+@dataclass(frozen=True)
+class QualityState:
+    """Pipeline settings in effect at a degradation level."""
+    facs_enabled: bool = True
+    dropped_models: Tuple[str, ...] = ()
+    detection_scale: float = 1.0
+    emotion_refresh: int = 1  # Run emotion models every N frames per track
+
+    def describe(self) -> str:
+        """Short human-readable summary."""
+        parts = [f"scale {self.detection_scale:.2f}"]
+        if not self.facs_enabled:
+            parts.append("FACS off")
+        if self.dropped_models:
+            parts.append("dropped " + ", ".join(self.dropped_models))
+        if self.emotion_refresh > 1:
+            parts.append(f"emotions every {self.emotion_refresh} frames")
+        return "; ".join(parts)
+
+
+def _apply_step(state: QualityState, action: str, value) -> QualityState:
+    """Apply one ladder step on top of a state."""
+    if action == "disable_facs":
+        return replace(state, facs_enabled=False)
+    if action == "drop_model":
+        return replace(state, dropped_models=state.dropped_models + (str(value),))
+    if action == "detection_scale":
+        return replace(state, detection_scale=min(state.detection_scale, float(value)))
+    if action == "emotion_refresh":
+        return replace(state, emotion_refresh=max(state.emotion_refresh, int(value)))
+    raise ValueError(f"Unknown degradation step: {action}")
+
+
+def _parse_step(step: Union[str, dict]) -> Tuple[str, object]:
+    """Normalize a step given as 'action' or {'action': value}."""
+    if isinstance(step, str):
+        return step, None
+    if isinstance(step, dict) and len(step) == 1:
+        return next(iter(step.items()))
+    raise ValueError(f"Invalid degradation step: {step!r}")
+
+
+class DegradationLadder:
+    """
+    Ordered list of quality reductions.
+
+    Level 0 is full quality; level N applies the first N steps cumulatively.
+    Steps are configured as a list of 'disable_facs', {'drop_model': name},
+    {'detection_scale': factor} and {'emotion_refresh': frames}.
+    """
+
+    def __init__(self, steps: Optional[List[Union[str, dict]]] = None):
+        """
+        Initialize ladder.
+
+        Args:
+            steps: Ladder steps (default: DEFAULT_LADDER)
+
+        Raises:
+            ValueError: If a step is malformed or unknown
+        """
+        self.steps = [_parse_step(step) for step in (DEFAULT_LADDER if steps is None else steps)]
+
+        # Precompute the cumulative state at every level (validates steps)
+        self._states = [QualityState()]
+        for action, value in self.steps:
+            self._states.append(_apply_step(self._states[-1], action, value))
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    @property
+    def max_level(self) -> int:
+        """Highest degradation level."""
+        return len(self.steps)
+
+    def state(self, level: int) -> QualityState:
+        """Settings in effect at a level (clamped to the ladder)."""
+        return self._states[min(max(level, 0), self.max_level)]
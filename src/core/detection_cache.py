@@ -0,0 +1,132 @@
+"""LRU cache of face detections keyed by image signatures."""
+
+import threading
+from collections import OrderedDict
+from typing import Hashable, List, Optional
+
+import cv2
+import numpy as np
+
+from ..data.models import FaceRegion
+
+
+class DetectionCache:
+    """
+    Reuses detections for images that look like ones seen recently.
+
+    The signature of an image is a small grayscale thumbnail computed from
+    a strided view, so it costs a fraction of any detector preprocessing.
+    Two signatures match when no thumbnail cell differs by more than
+    ``threshold`` gray levels: capture noise moves every cell a little, a
+    face appearing or moving moves a few cells a lot. Entries are grouped
+    by a context (frame shape, detection scale, tile position), each group
+    keeps its ``capacity`` most recently used entries, and an entry is
+    recomputed after ``max_reuse`` hits to bound staleness.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 8,
+        threshold: float = 8.0,
+        max_reuse: int = 30,
+        thumbnail_size: int = 32,
+        max_contexts: int = 256
+    ):
+        """
+        Initialize detection cache.
+
+        Args:
+            capacity: Entries kept per context (e.g. windows alt-tabbed between)
+            threshold: Largest per-cell gray-level difference for a match
+            max_reuse: Hits before an entry is dropped and recomputed
+            thumbnail_size: Signature thumbnail side in pixels
+            max_contexts: Contexts kept (least recently used dropped first)
+        """
+        self.capacity = capacity
+        self.threshold = threshold
+        self.max_reuse = max_reuse
+        self.thumbnail_size = thumbnail_size
+        self.max_contexts = max_contexts
+        self.hits = 0
+        self.misses = 0
+        # context -> entries [signature, faces, reuses], most recent first
+        self._entries: "OrderedDict[Hashable, List[list]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def signature(self, image: np.ndarray) -> np.ndarray:
+        """
+        Thumbnail signature of an image.
+
+        Args:
+            image: BGR or grayscale image
+
+        Returns:
+            (thumbnail_size, thumbnail_size) int16 gray levels
+        """
+        height, width = image.shape[:2]
+        # Subsample before resizing so the cost does not grow with resolution
+        step = max(min(height, width) // (self.thumbnail_size * 4), 1)
+        small = np.ascontiguousarray(image[::step, ::step])
+        small = cv2.resize(small, (self.thumbnail_size, self.thumbnail_size), interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return small.astype(np.int16)
+
+    def lookup(self, signature: np.ndarray, context: Hashable = None) -> Optional[List[FaceRegion]]:
+        """
+        Find detections for a matching signature.
+
+        Args:
+            signature: Signature from ``signature``
+            context: Key the entry was stored under
+
+        Returns:
+            Copies of the cached face regions, or None on a miss
+        """
+        with self._lock:
+            entries = self._entries.get(context)
+            if entries is not None:
+                self._entries.move_to_end(context)
+                for i, entry in enumerate(entries):
+                    if np.abs(entry[0] - signature).max() > self.threshold:
+                        continue
+                    entry[2] += 1
+                    if entry[2] > self.max_reuse:
+                        del entries[i]
+                        break
+                    entries.insert(0, entries.pop(i))
+                    self.hits += 1
+                    return [face.scaled(1.0) for face in entry[1]]
+            self.misses += 1
+            return None
+
+    def store(self, signature: np.ndarray, faces: List[FaceRegion], context: Hashable = None) -> None:
+        """
+        Remember detections for a signature.
+
+        Args:
+            signature: Signature from ``signature``
+            faces: Detected face regions
+            context: Key to store the entry under
+        """
+        with self._lock:
+            entries = self._entries.setdefault(context, [])
+            self._entries.move_to_end(context)
+            # Copies, so callers may modify the regions they were given
+            entries.insert(0, [signature, [face.scaled(1.0) for face in faces], 0])
+            del entries[self.capacity:]
+            while len(self._entries) > self.max_contexts:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that hit."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
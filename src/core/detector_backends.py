@@ -0,0 +1,304 @@
+"""Pluggable CNN face detector backends (CPU)."""
+
+import os
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+import cv2
+import numpy as np
+
+from ..data.models import FaceRegion
+from ..utils.box_ops import boxes_to_regions, nms
+
+# Registered backends by name (see register_backend)
+_BACKENDS: Dict[str, Type["DetectorBackend"]] = {}
+
+
+def register_backend(name: str) -> Callable[[Type["DetectorBackend"]], Type["DetectorBackend"]]:
+    """Class decorator registering a backend under ``name``."""
+    def decorator(cls: Type["DetectorBackend"]) -> Type["DetectorBackend"]:
+        cls.name = name
+        _BACKENDS[name] = cls
+        return cls
+    return decorator
+
+
+def available_backends() -> List[str]:
+    """Names of the registered backends."""
+    return sorted(_BACKENDS)
+
+
+def create_backend(name: str, options: Optional[dict] = None) -> Optional["DetectorBackend"]:
+    """
+    Create a registered backend.
+
+    Args:
+        name: Backend name
+        options: Keyword arguments for the backend
+
+    Returns:
+        Uninitialized backend, or None for an unknown name
+    """
+    cls = _BACKENDS.get(name)
+    if cls is None:
+        print(f"Unknown face detector backend: {name} (available: {', '.join(available_backends())})")
+        return None
+    return cls(**(options or {}))
+
+
+def find_model(filename: str) -> Optional[str]:
+    """Locate a model file in the project's or working directory's models/ folder."""
+    if os.path.isabs(filename) or os.path.dirname(filename):
+        return filename if os.path.exists(filename) else None
+    for directory in (
+        os.path.join(os.path.dirname(__file__), '..', '..', 'models'),
+        os.path.join(os.getcwd(), 'models'),
+    ):
+        path = os.path.join(directory, filename)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+class DetectorBackend(ABC):
+    """
+    A face detector model.
+
+    Backends return real detection confidences and, where the model
+    provides them, facial keypoints. ``detect_batch`` lets tiled detection
+    hand all tiles to the model at once.
+    """
+
+    name = "backend"
+
+    def __init__(
+        self,
+        model_path: Optional[str] = None,
+        input_size: Tuple[int, int] = (320, 320),
+        score_threshold: float = 0.6,
+        nms_threshold: float = 0.3
+    ):
+        """
+        Initialize backend.
+
+        Args:
+            model_path: Model file (default: the backend's file under models/)
+            input_size: Network input (width, height); frames are resized to fit
+            score_threshold: Smallest confidence reported
+            nms_threshold: IoU above which overlapping detections are merged
+        """
+        self.model_path = model_path
+        self.input_size = tuple(input_size)
+        self.score_threshold = score_threshold
+        self.nms_threshold = nms_threshold
+        self.is_initialized = False
+
+    @abstractmethod
+    def initialize(self) -> bool:
+        """
+        Load the model.
+
+        Returns:
+            True if initialization successful, False otherwise
+        """
+        pass
+
+    @abstractmethod
+    def detect(self, frame: np.ndarray) -> List[FaceRegion]:
+        """
+        Detect faces in a BGR frame.
+
+        Returns:
+            Face regions in frame coordinates
+        """
+        pass
+
+    def detect_batch(self, frames: Sequence[np.ndarray]) -> List[List[FaceRegion]]:
+        """Detect faces in several frames (e.g. tiles); one list per frame."""
+        return [self.detect(frame) for frame in frames]
+
+    def close(self) -> None:
+        """Release model resources."""
+        pass
+
+    def _fit_scale(self, frame: np.ndarray) -> float:
+        """Scale that fits the frame inside the input size, keeping its aspect ratio."""
+        height, width = frame.shape[:2]
+        return min(self.input_size[0] / width, self.input_size[1] / height)
+
+
+@register_backend("yunet")
+class YuNetBackend(DetectorBackend):
+    """OpenCV's YuNet CNN (cv2.FaceDetectorYN) with five facial keypoints."""
+
+    DEFAULT_MODEL = "face_detection_yunet_2023mar.onnx"
+
+    def __init__(self, top_k: int = 5000, **kwargs):
+        """
+        Initialize YuNet backend.
+
+        Args:
+            top_k: Candidates kept before NMS
+            **kwargs: See DetectorBackend
+        """
+        super().__init__(**kwargs)
+        self.top_k = top_k
+        self.detector = None
+
+    def initialize(self) -> bool:
+        """Load the YuNet model."""
+        try:
+            path = find_model(self.model_path or self.DEFAULT_MODEL)
+            if path is None:
+                print(f"YuNet model not found: {self.model_path or self.DEFAULT_MODEL} "
+                      "(run scripts/download_face_detectors.py yunet)")
+                return False
+            self.detector = cv2.FaceDetectorYN.create(
+                path, "", self.input_size, self.score_threshold, self.nms_threshold, self.top_k
+            )
+            self.is_initialized = True
+            return True
+        except Exception as e:
+            print(f"Failed to initialize YuNet face detector: {e}")
+            return False
+
+    def detect(self, frame: np.ndarray) -> List[FaceRegion]:
+        """Detect faces with YuNet at the configured input size."""
+        if not self.is_initialized:
+            return []
+
+        try:
+            scale = self._fit_scale(frame)
+            image = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            height, width = image.shape[:2]
+            self.detector.setInputSize((width, height))
+            _, faces = self.detector.detect(image)
+            if faces is None:
+                return []
+
+            # Rows: x, y, w, h, 5 (x, y) keypoints, score
+            faces = faces.astype(np.float64)
+            faces[:, :14] /= scale
+            return [
+                FaceRegion(
+                    x=int(round(row[0])),
+                    y=int(round(row[1])),
+                    width=int(round(row[2])),
+                    height=int(round(row[3])),
+                    confidence=float(row[14]),
+                    keypoints=row[4:14].reshape(5, 2).astype(np.float32)
+                )
+                for row in faces
+            ]
+
+        except Exception as e:
+            print(f"YuNet face detection error: {e}")
+            return []
+
+    def close(self) -> None:
+        """Release the model."""
+        self.detector = None
+        self.is_initialized = False
+
+
+@register_backend("onnx")
+class OnnxBackend(DetectorBackend):
+    """
+    Ultra-Light-Fast-Generic-Face-Detector (RFB-320) on ONNX Runtime.
+
+    The model emits per-anchor scores and normalized corner boxes, so one
+    session run handles a whole batch of tiles when the model was exported
+    with a dynamic batch axis; otherwise tiles run one by one.
+    """
+
+    DEFAULT_MODEL = "version-RFB-320.onnx"
+
+    def __init__(self, threads: Optional[int] = None, **kwargs):
+        """
+        Initialize ONNX backend.
+
+        Args:
+            threads: ONNX Runtime intra-op threads (default: runtime default)
+            **kwargs: See DetectorBackend
+        """
+        kwargs.setdefault('input_size', (320, 240))
+        super().__init__(**kwargs)
+        self.threads = threads
+        self.session = None
+        self.input_name = None
+        self.dynamic_batch = False
+
+    def initialize(self) -> bool:
+        """Load the model into an ONNX Runtime CPU session."""
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            print("onnxruntime not installed, ONNX face detector unavailable")
+            return False
+
+        try:
+            path = find_model(self.model_path or self.DEFAULT_MODEL)
+            if path is None:
+                print(f"ONNX face detector model not found: {self.model_path or self.DEFAULT_MODEL} "
+                      "(run scripts/download_face_detectors.py onnx)")
+                return False
+            options = ort.SessionOptions()
+            if self.threads:
+                options.intra_op_num_threads = self.threads
+            self.session = ort.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+            model_input = self.session.get_inputs()[0]
+            self.input_name = model_input.name
+            self.dynamic_batch = not isinstance(model_input.shape[0], int)
+            self.is_initialized = True
+            return True
+        except Exception as e:
+            print(f"Failed to initialize ONNX face detector: {e}")
+            return False
+
+    def _preprocess(self, frame: np.ndarray) -> np.ndarray:
+        """Resize to the input size, RGB, normalize, CHW."""
+        image = cv2.resize(frame, self.input_size, interpolation=cv2.INTER_AREA)
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB).astype(np.float32)
+        return ((image - 127.0) / 128.0).transpose(2, 0, 1)
+
+    def _decode(self, scores: np.ndarray, boxes: np.ndarray, frame: np.ndarray) -> List[FaceRegion]:
+        """Threshold, rescale and NMS one image's anchors."""
+        confidence = scores[:, 1]
+        keep = confidence > self.score_threshold
+        if not keep.any():
+            return []
+
+        height, width = frame.shape[:2]
+        corners = boxes[keep] * np.array([width, height, width, height], dtype=np.float32)
+        xywh = np.concatenate([corners[:, :2], corners[:, 2:] - corners[:, :2]], axis=1)
+        confidence = confidence[keep]
+        kept = nms(xywh, confidence, self.nms_threshold)
+        return boxes_to_regions(xywh[kept], confidence[kept])
+
+    def detect(self, frame: np.ndarray) -> List[FaceRegion]:
+        """Detect faces in one frame."""
+        return self.detect_batch([frame])[0]
+
+    def detect_batch(self, frames: Sequence[np.ndarray]) -> List[List[FaceRegion]]:
+        """Detect faces in several frames, in one session run when the model allows it."""
+        if not self.is_initialized or not frames:
+            return [[] for _ in frames]
+
+        try:
+            inputs = np.stack([self._preprocess(frame) for frame in frames])
+            if self.dynamic_batch:
+                scores, boxes = self.session.run(None, {self.input_name: inputs})
+            else:
+                outputs = [self.session.run(None, {self.input_name: x[None]}) for x in inputs]
+                scores = np.concatenate([o[0] for o in outputs])
+                boxes = np.concatenate([o[1] for o in outputs])
+            return [self._decode(scores[i], boxes[i], frame) for i, frame in enumerate(frames)]
+
+        except Exception as e:
+            print(f"ONNX face detection error: {e}")
+            return [[] for _ in frames]
+
+    def close(self) -> None:
+        """Release the session."""
+        self.session = None
+        self.is_initialized = False
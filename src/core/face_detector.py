@@ -2,24 +2,141 @@
 
 import cv2
 import numpy as np
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import os
+import threading
 
 from ..data.models import FaceRegion
+from ..utils.box_ops import iou_matrix, nms, regions_to_boxes
+from .detection_cache import DetectionCache
+from .detector_backends import DetectorBackend, available_backends, create_backend
+from .motion import MotionGate, grow_regions
+
+CASCADE_FILE = 'haarcascade_frontalface_default.xml'
+
+# Smallest face the Haar cascade finds (its minSize)
+MIN_CASCADE_FACE = 35
+
+# Tiles span this many expected face widths; neighbours overlap by
+# TILE_OVERLAP_FACES so a face up to that size lies whole in some tile
+TILE_FACES = 8
+TILE_OVERLAP_FACES = 1.5
+MIN_TILE_SIZE = 256
+
+# Faces up to this multiple of the expected size are searched for in tiles,
+# larger ones on the downscaled whole frame
+TILE_MAX_FACE_RATIO = 2.5
+
+# Tiles are upscaled (up to this factor) when expected faces are smaller
+# than twice the cascade's minimum
+MAX_TILE_UPSCALE = 3.0
+
+
+# Tile thread pools shared by every detector in the process (e.g. one per
+# monitor), keyed by thread count, so detectors do not each start a thread
+# per CPU
+_tile_pools: Dict[int, ThreadPoolExecutor] = {}
+_tile_pools_lock = threading.Lock()
+
+
+def shared_tile_pool(workers: int) -> ThreadPoolExecutor:
+    """
+    The process-wide tile pool with ``workers`` threads (created on first use).
+
+    Args:
+        workers: Thread count
+
+    Returns:
+        Shared thread pool
+    """
+    with _tile_pools_lock:
+        pool = _tile_pools.get(workers)
+        if pool is None:
+            pool = ThreadPoolExecutor(workers, thread_name_prefix="detect-tile")
+            _tile_pools[workers] = pool
+        return pool
+
+
+def plan_tiles(width: int, height: int, tile_size: int, overlap: int) -> List[Tuple[int, int, int, int]]:
+    """
+    Cover a frame with overlapping square tiles.
+
+    Args:
+        width: Frame width
+        height: Frame height
+        tile_size: Tile side in pixels
+        overlap: Pixels shared by neighbouring tiles
+
+    Returns:
+        (x, y, width, height) tiles, clipped to the frame
+    """
+    def starts(length: int) -> List[int]:
+        if length <= tile_size:
+            return [0]
+        step = max(tile_size - overlap, 1)
+        positions = list(range(0, length - tile_size, step))
+        positions.append(length - tile_size)  # Last tile flush with the edge
+        return positions
+
+    return [
+        (x, y, min(tile_size, width - x), min(tile_size, height - y))
+        for y in starts(height)
+        for x in starts(width)
+    ]
 
 
 class FaceDetector:
     """Detects faces in frames using multiple detection methods."""
 
-    def __init__(self, method: str = "opencv"):
+    def __init__(
+        self,
+        method: str = "opencv",
+        tiling: bool = False,
+        expected_face_size: int = 80,
+        tile_workers: Optional[int] = None,
+        backend_options: Optional[dict] = None,
+        cache_size: int = 8,
+        cache_threshold: float = 8.0,
+        cache_max_reuse: int = 30,
+        motion_gate: Optional[MotionGate] = None
+    ):
         """
         Initialize face detector.
 
         Args:
-            method: Detection method ('opencv', 'mediapipe', 'both')
+            method: Detection method ('opencv', 'mediapipe', 'both') or a
+                registered CNN backend ('yunet', 'onnx')
+            tiling: Detect on overlapping full-resolution tiles in parallel
+                (for many small faces in large frames)
+            expected_face_size: Typical face width in pixels; sets the tile
+                size, overlap and largest face searched for when tiling
+            tile_workers: Threads detecting tiles (default: CPU count); detectors
+                with the same count share one pool
+            backend_options: Options for a CNN backend (model_path,
+                input_size, score_threshold, nms_threshold)
+            cache_size: Recently seen frames (and tiles per position) whose
+                detections are reused; 0 disables the cache
+            cache_threshold: Largest signature difference (gray levels) for
+                a frame to count as already seen
+            cache_max_reuse: Cache hits before a frame is detected again
+            motion_gate: Limits detection to regions that changed since the
+                previous frame; faces elsewhere keep their last boxes
         """
         self.method = method
 
+        # CNN backend (when method names one)
+        self.backend_options = backend_options or {}
+        self.backend: Optional[DetectorBackend] = None
+
+        # Tiled detection
+        self.tiling = tiling
+        self.expected_face_size = expected_face_size
+        self.tile_workers = tile_workers or os.cpu_count() or 1
+        # Tile threads each load their own cascade; MediaPipe calls are serialized
+        self._thread_state = threading.local()
+        self._mp_lock = threading.Lock()
+
         # OpenCV face detection
         self.opencv_cascade = None
 
@@ -28,16 +145,33 @@ class FaceDetector:
 
         self.is_initialized = False
 
-        # Frame caching for consistent results on static images
-        self._prev_frame_small = None
-        self._prev_faces = []
+        # Detection runs on a frame downscaled by this factor (set by the
+        # adaptive controller under load); boxes are mapped back to full size
+        self.detection_scale = 1.0
+
+        # Detections of recently seen frames and tiles, for all methods
+        self.cache: Optional[DetectionCache] = None
+        if cache_size > 0:
+            self.cache = DetectionCache(cache_size, cache_threshold, cache_max_reuse)
+
+        # Motion gating: faces of the last frame, carried over where nothing moved
+        self.motion_gate = motion_gate
+        self._gated_faces: List[FaceRegion] = []
 
     def initialize(self) -> bool:
         """Initialize face detection models."""
         try:
+            if self.method in available_backends():
+                self.backend = create_backend(self.method, self.backend_options)
+                if self.backend is None or not self.backend.initialize():
+                    print(f"Failed to initialize {self.method} face detector backend")
+                    return False
+                self.is_initialized = True
+                return True
+
             if self.method in ["opencv", "both"]:
                 # Load OpenCV Haar Cascade
-                cascade_path = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+                cascade_path = cv2.data.haarcascades + CASCADE_FILE
                 self.opencv_cascade = cv2.CascadeClassifier(cascade_path)
 
                 if self.opencv_cascade.empty():
@@ -98,6 +232,97 @@ class FaceDetector:
         if not self.is_initialized:
             return []
 
+        if self.motion_gate:
+            motion = self.motion_gate.update(frame)
+            if motion is not None:
+                self._gated_faces = self._detect_motion(frame, motion)
+                return [face.scaled(1.0) for face in self._gated_faces]
+
+        faces = self._detect_frame(frame)
+        if self.motion_gate:
+            # Copies, so callers may modify the regions they were given
+            self._gated_faces = [face.scaled(1.0) for face in faces]
+        return faces
+
+    def reset_motion(self) -> None:
+        """Make the next frame a full-frame pass (e.g. after the capture area moved)."""
+        if self.motion_gate:
+            self.motion_gate.reset()
+        self._gated_faces = []
+
+    def _detect_frame(self, frame: np.ndarray) -> List[FaceRegion]:
+        """Detect faces in a whole frame, through the cache."""
+        scale = self.detection_scale
+        if self.cache:
+            # Checked before any resizing or color conversion
+            context = (frame.shape, scale)
+            signature = self.cache.signature(frame)
+            faces = self.cache.lookup(signature, context)
+            if faces is not None:
+                return faces
+
+        faces = self._detect_scaled(frame)
+        if self.cache:
+            self.cache.store(signature, faces, context)
+        return faces
+
+    def _detect_scaled(self, image: np.ndarray) -> List[FaceRegion]:
+        """Detect at the current detection scale, in image coordinates."""
+        scale = self.detection_scale
+        if scale < 1.0:
+            small = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            return [f.scaled(1 / scale) for f in self._detect(small)]
+        return self._detect(image)
+
+    def _detect_motion(self, frame: np.ndarray, regions: List[Tuple[int, int, int, int]]) -> List[FaceRegion]:
+        """
+        Detect only in regions that changed.
+
+        Regions are first grown to contain the previous faces they touch
+        (a moving mouth re-detects the whole face). Faces of the previous
+        frame outside every region are kept as they were; the regions are
+        searched again, so faces that moved, appeared or left are updated.
+
+        Args:
+            frame: Image frame
+            regions: Changed regions from the motion gate (frame coordinates)
+
+        Returns:
+            Face regions in frame coordinates
+        """
+        if not regions:
+            return list(self._gated_faces)
+
+        kept = self._gated_faces
+        if kept:
+            height, width = frame.shape[:2]
+            regions = grow_regions(
+                regions, [face.to_tuple() for face in kept], self.motion_gate.padding, width, height
+            )
+            boxes, _ = regions_to_boxes(kept)
+            moved = iou_matrix(boxes, np.array(regions, dtype=np.float64)).max(axis=1) > 0
+            kept = [face for face, is_moved in zip(kept, moved.tolist()) if not is_moved]
+
+        found = []
+        for x, y, w, h in regions:
+            found += [f.scaled(1.0, (x, y)) for f in self._detect_scaled(frame[y:y + h, x:x + w])]
+        return kept + self._fuse_tiles(found)
+
+    def _detect(self, frame: np.ndarray) -> List[FaceRegion]:
+        """Run the configured detection method on a frame (tiled if enabled)."""
+        if self.tiling:
+            # Expected face size in this (possibly downscaled) frame
+            face_size = max(self.expected_face_size * self.detection_scale, 1.0)
+            tile_size = max(int(face_size * TILE_FACES), MIN_TILE_SIZE)
+            height, width = frame.shape[:2]
+            if width > tile_size or height > tile_size:
+                return self._detect_tiled(frame, face_size, tile_size)
+        return self._detect_whole(frame)
+
+    def _detect_whole(self, frame: np.ndarray) -> List[FaceRegion]:
+        """Run the configured detection method on a whole frame."""
+        if self.backend:
+            return self.backend.detect(frame)
         if self.method == "opencv":
             return self._detect_opencv(frame)
         elif self.method == "mediapipe":
@@ -110,95 +335,201 @@ class FaceDetector:
         else:
             return []
 
-    def _detect_opencv(self, frame: np.ndarray) -> List[FaceRegion]:
-        """Detect faces using OpenCV."""
-        if self.opencv_cascade is None:
-            return []
+    def _detect_tiled(self, frame: np.ndarray, face_size: float, tile_size: int) -> List[FaceRegion]:
+        """
+        Detect on overlapping tiles in parallel and fuse the results.
 
-        try:
-            # Convert to grayscale
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        Each tile only searches faces up to TILE_MAX_FACE_RATIO times the
+        expected size, which cuts the cascade's scale pyramid short; tiles
+        are upscaled when expected faces are near the cascade's minimum.
+        A CNN backend gets all tiles in one batch instead. Larger faces are
+        found by a pass over the downscaled whole frame. Tiles whose
+        content matches a cached tile at the same position reuse its faces,
+        so only the changed parts of a frame are detected again.
 
-            # Apply histogram equalization for better detection consistency
-            gray = cv2.equalizeHist(gray)
+        Args:
+            frame: Image frame
+            face_size: Expected face width in this frame
+            tile_size: Tile side in pixels
+
+        Returns:
+            Face regions in frame coordinates
+        """
+        height, width = frame.shape[:2]
+        tiles = plan_tiles(width, height, tile_size, int(face_size * TILE_OVERLAP_FACES))
+
+        # Tile faces are cached in frame coordinates, keyed by tile position
+        faces: List[FaceRegion] = []
+        pending = []
+        for tile in tiles:
+            x, y, w, h = tile
+            context = (tile, frame.shape, self.detection_scale)
+            signature = self.cache.signature(frame[y:y + h, x:x + w]) if self.cache else None
+            cached = self.cache.lookup(signature, context) if self.cache else None
+            if cached is None:
+                pending.append((tile, context, signature))
+            else:
+                faces += cached
+        if not pending:
+            results = []
+        elif self.backend:
+            results = self.backend.detect_batch([frame[y:y + h, x:x + w] for (x, y, w, h), _, _ in pending])
+            results = [[f.scaled(1.0, tile[:2]) for f in tile_faces] for (tile, _, _), tile_faces in zip(pending, results)]
+        else:
+            upscale = min(max(2 * MIN_CASCADE_FACE / face_size, 1.0), MAX_TILE_UPSCALE)
+            max_face = int(face_size * TILE_MAX_FACE_RATIO * upscale)
 
-            # Check if frame is similar to previous (for static image stability)
-            # Use downsampled comparison to tolerate minor screen capture variations
-            small = cv2.resize(gray, (32, 32))
-            if self._prev_frame_small is not None and self._prev_faces:
-                diff = cv2.absdiff(small, self._prev_frame_small)
-                if np.mean(diff) < 10:  # Similar frame (tolerate minor variations)
-                    return self._prev_faces
-
-            # Single-pass detection for consistent results
-            faces = self.opencv_cascade.detectMultiScale(
-                gray,
-                scaleFactor=1.02,
-                minNeighbors=15,
-                minSize=(35, 35),
-                flags=cv2.CASCADE_SCALE_IMAGE
+            results = shared_tile_pool(self.tile_workers).map(
+                lambda item: self._detect_tile(frame, item[0], upscale, max_face),
+                pending
             )
 
-            # Convert to FaceRegion objects with aspect ratio filtering
-            face_regions = []
-            for (x, y, w, h) in faces:
-                # Filter by aspect ratio - faces are roughly square (0.8 to 1.25)
-                aspect_ratio = w / h if h > 0 else 0
-                if 0.85 <= aspect_ratio <= 1.2:
-                    face_regions.append(FaceRegion(
-                        x=int(x),
-                        y=int(y),
-                        width=int(w),
-                        height=int(h),
-                        confidence=0.9  # OpenCV doesn't provide confidence
-                    ))
-
-            # Cache results for static image stability
-            self._prev_frame_small = small
-            self._prev_faces = face_regions
+        # Runs on this thread while the tile threads work
+        faces += self._detect_large(frame, face_size)
 
-            return face_regions
+        for (_, context, signature), tile_faces in zip(pending, results):
+            if self.cache:
+                self.cache.store(signature, tile_faces, context)
+            faces += tile_faces
+        return self._fuse_tiles(faces)
 
-        except Exception as e:
-            print(f"OpenCV face detection error: {e}")
-            return []
+    def _detect_large(self, frame: np.ndarray, face_size: float) -> List[FaceRegion]:
+        """
+        Detect faces too large for the tiles on a downscaled whole frame.
 
-    def _nms_faces(self, faces, overlap_threshold=0.3):
-        """Apply non-maximum suppression to raw face detections."""
-        if len(faces) == 0:
-            return []
+        The frame is shrunk so the smallest face the tiles skip (the tile
+        maxSize) is still twice the cascade's minimum; overlap with the
+        tile results is fused by the caller.
 
-        # Convert to list of tuples if numpy array
-        faces = [tuple(f) for f in faces]
+        Args:
+            frame: Image frame
+            face_size: Expected face width in this frame
 
-        # Sort by area (larger faces first)
-        faces = sorted(faces, key=lambda f: f[2] * f[3], reverse=True)
+        Returns:
+            Face regions in frame coordinates
+        """
+        shrink = min(2 * MIN_CASCADE_FACE / (face_size * TILE_MAX_FACE_RATIO), 1.0)
+        small = frame
+        if shrink < 1.0:
+            small = cv2.resize(frame, None, fx=shrink, fy=shrink, interpolation=cv2.INTER_AREA)
+
+        if self.cache:
+            context = ('large', frame.shape, self.detection_scale)
+            signature = self.cache.signature(small)
+            faces = self.cache.lookup(signature, context)
+            if faces is not None:
+                return faces
+
+        # Tile threads may be running MediaPipe
+        with self._mp_lock:
+            faces = [f.scaled(1 / shrink) for f in self._detect_whole(small)]
+        if self.cache:
+            self.cache.store(signature, faces, context)
+        return faces
+
+    @staticmethod
+    def _fuse_tiles(faces: List[FaceRegion]) -> List[FaceRegion]:
+        """Drop duplicates of faces found in several overlapping tiles."""
+        if not faces:
+            return []
+        boxes, scores = regions_to_boxes(faces)
+        return [faces[i] for i in nms(boxes, scores, iou_threshold=0.3).tolist()]
 
-        kept = []
-        for face in faces:
-            x1, y1, w1, h1 = face
-            is_duplicate = False
+    def _detect_tile(
+        self,
+        frame: np.ndarray,
+        tile: Tuple[int, int, int, int],
+        upscale: float,
+        max_face: int
+    ) -> List[FaceRegion]:
+        """Detect faces in one tile (runs on a tile thread)."""
+        x, y, w, h = tile
+        image = frame[y:y + h, x:x + w]
+        if upscale > 1.0:
+            image = cv2.resize(image, None, fx=upscale, fy=upscale, interpolation=cv2.INTER_LINEAR)
+
+        faces: List[FaceRegion] = []
+        if self.method in ("opencv", "both") and self.opencv_cascade is not None:
+            faces += self._cascade_faces(self._thread_cascade(), image, max_face)
+        if self.method in ("mediapipe", "both"):
+            with self._mp_lock:
+                faces += self._detect_mediapipe(image)
+
+        return [f.scaled(1 / upscale, (x, y)) for f in faces]
+
+    def _thread_cascade(self):
+        """This thread's cascade (classifiers are not shared across threads)."""
+        cascade = getattr(self._thread_state, 'cascade', None)
+        if cascade is None:
+            cascade = cv2.CascadeClassifier(cv2.data.haarcascades + CASCADE_FILE)
+            self._thread_state.cascade = cascade
+        return cascade
+
+    @staticmethod
+    def _cascade_faces(
+        cascade,
+        frame: np.ndarray,
+        max_face: Optional[int] = None,
+        gray: Optional[np.ndarray] = None
+    ) -> List[FaceRegion]:
+        """
+        Run the Haar cascade and keep roughly square detections.
 
-            for kept_face in kept:
-                x2, y2, w2, h2 = kept_face
+        Args:
+            cascade: Loaded cascade classifier
+            frame: BGR image
+            max_face: Largest face side searched for (None = unbounded)
+            gray: Equalized grayscale image, if already computed
 
-                # Calculate IoU
-                xi1 = max(x1, x2)
-                yi1 = max(y1, y2)
-                xi2 = min(x1 + w1, x2 + w2)
-                yi2 = min(y1 + h1, y2 + h2)
+        Returns:
+            Face regions
+        """
+        if gray is None:
+            gray = cv2.equalizeHist(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
+
+        # Single-pass detection for consistent results
+        options = {'maxSize': (max_face, max_face)} if max_face else {}
+        faces = cascade.detectMultiScale(
+            gray,
+            scaleFactor=1.02,
+            minNeighbors=15,
+            minSize=(MIN_CASCADE_FACE, MIN_CASCADE_FACE),
+            flags=cv2.CASCADE_SCALE_IMAGE,
+            **options
+        )
+
+        # Convert to FaceRegion objects with aspect ratio filtering
+        face_regions = []
+        for (x, y, w, h) in faces:
+            # Filter by aspect ratio - faces are roughly square (0.8 to 1.25)
+            aspect_ratio = w / h if h > 0 else 0
+            if 0.85 <= aspect_ratio <= 1.2:
+                face_regions.append(FaceRegion(
+                    x=int(x),
+                    y=int(y),
+                    width=int(w),
+                    height=int(h),
+                    confidence=0.9  # OpenCV doesn't provide confidence
+                ))
+        return face_regions
 
-                inter_area = max(0, xi2 - xi1) * max(0, yi2 - yi1)
-                union_area = w1 * h1 + w2 * h2 - inter_area
+    def _detect_opencv(self, frame: np.ndarray) -> List[FaceRegion]:
+        """Detect faces using OpenCV."""
+        if self.opencv_cascade is None:
+            return []
 
-                if union_area > 0 and inter_area / union_area > overlap_threshold:
-                    is_duplicate = True
-                    break
+        try:
+            # Convert to grayscale
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 
-            if not is_duplicate:
-                kept.append(face)
+            # Apply histogram equalization for better detection consistency
+            gray = cv2.equalizeHist(gray)
 
-        return kept
+            return self._cascade_faces(self.opencv_cascade, frame, gray=gray)
+
+        except Exception as e:
+            print(f"OpenCV face detection error: {e}")
+            return []
 
     def _detect_mediapipe(self, frame: np.ndarray) -> List[FaceRegion]:
         """Detect faces using MediaPipe tasks API."""
@@ -239,12 +570,20 @@ class FaceDetector:
                 width = min(width, w - x)
                 height = min(height, h - y)
 
+                # BlazeFace keypoints are normalized to the image
+                keypoints = None
+                if detection.keypoints:
+                    keypoints = np.array(
+                        [(kp.x * w, kp.y * h) for kp in detection.keypoints], dtype=np.float32
+                    )
+
                 face_regions.append(FaceRegion(
                     x=x,
                     y=y,
                     width=width,
                     height=height,
-                    confidence=detection.categories[0].score if detection.categories else 0.9
+                    confidence=detection.categories[0].score if detection.categories else 0.9,
+                    keypoints=keypoints
                 ))
 
             return face_regions
@@ -268,54 +607,59 @@ class FaceDetector:
             iou_threshold: IoU threshold for considering faces as duplicates
 
         Returns:
-            Merged list of face regions
+            Merged list of face regions, by descending confidence
         """
         all_faces = faces1 + faces2
-
-        if len(all_faces) == 0:
+        if not all_faces:
             return []
 
-        # Sort by confidence
-        all_faces.sort(key=lambda f: f.confidence, reverse=True)
-
-        # Non-maximum suppression
-        kept_faces = []
-
-        for face in all_faces:
-            # Check if this face overlaps significantly with any kept face
-            is_duplicate = False
-            for kept_face in kept_faces:
-                iou = self._calculate_iou(face, kept_face)
-                if iou > iou_threshold:
-                    is_duplicate = True
-                    break
-
-            if not is_duplicate:
-                kept_faces.append(face)
-
-        return kept_faces
-
-    def _calculate_iou(self, face1: FaceRegion, face2: FaceRegion) -> float:
-        """Calculate Intersection over Union between two face regions."""
-        # Calculate intersection
-        x1 = max(face1.x, face2.x)
-        y1 = max(face1.y, face2.y)
-        x2 = min(face1.x + face1.width, face2.x + face2.width)
-        y2 = min(face1.y + face1.height, face2.y + face2.height)
-
-        intersection = max(0, x2 - x1) * max(0, y2 - y1)
-
-        # Calculate union
-        area1 = face1.width * face1.height
-        area2 = face2.width * face2.height
-        union = area1 + area2 - intersection
-
-        if union == 0:
-            return 0.0
-
-        return intersection / union
+        boxes, scores = regions_to_boxes(all_faces)
+        return [all_faces[i] for i in nms(boxes, scores, iou_threshold).tolist()]
 
     def shutdown(self) -> None:
         """Clean up resources."""
+        if self.backend:
+            self.backend.close()
         if self.mp_face_detector:
             self.mp_face_detector.close()
+        if self.cache:
+            self.cache.clear()
+        self.reset_motion()
+
+
+def create_face_detector(config: dict) -> FaceDetector:
+    """
+    Create the face detector described by the configuration.
+
+    Args:
+        config: Application configuration ('face_detection')
+
+    Returns:
+        Uninitialized FaceDetector
+    """
+    detection_config = config.get('face_detection', {}) or {}
+    tiling_config = detection_config.get('tiling', {}) or {}
+    backend_config = detection_config.get('backend', {}) or {}
+    cache_config = detection_config.get('cache', {}) or {}
+    motion_config = detection_config.get('motion_gating', {}) or {}
+    motion_gate = None
+    if motion_config.get('enabled', False):
+        motion_gate = MotionGate(
+            width=motion_config.get('width', 160),
+            threshold=motion_config.get('threshold', 20),
+            min_area=motion_config.get('min_area', 4),
+            padding=motion_config.get('padding') or tiling_config.get('expected_face_size', 80),
+            full_refresh_interval=motion_config.get('full_refresh_interval', 60),
+            max_motion_fraction=motion_config.get('max_motion_fraction', 0.4)
+        )
+    return FaceDetector(
+        method=detection_config.get('method', 'opencv'),
+        tiling=tiling_config.get('enabled', False),
+        expected_face_size=tiling_config.get('expected_face_size', 80),
+        tile_workers=tiling_config.get('workers'),
+        backend_options={key: value for key, value in backend_config.items() if value is not None},
+        cache_size=cache_config.get('size', 8) if cache_config.get('enabled', True) else 0,
+        cache_threshold=cache_config.get('threshold', 8.0),
+        cache_max_reuse=cache_config.get('max_reuse', 30),
+        motion_gate=motion_gate
+    )
@@ -0,0 +1,422 @@
+"""Frame source abstraction: screen, video files, image folders and synthetic frames."""
+
+import os
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".webp")
+
+
+@dataclass
+class CapturedFrame:
+    """A frame together with where and when it was captured."""
+    image: np.ndarray
+    index: int
+    timestamp_ns: int  # Monotonic capture time (comparable with time.monotonic_ns())
+    media_time_ns: int = 0  # Position within the source (0 = first frame)
+    origin: Tuple[int, int] = (0, 0)  # Top-left of the frame in screen coordinates
+
+
+class FrameSource(ABC):
+    """
+    Base class for everything the pipeline can read frames from.
+
+    ``read`` returns a CapturedFrame (or None when no frame is available);
+    finite sources set ``exhausted`` once they are done. Recorded sources
+    derive timestamps from the media position, so repeated runs over the
+    same footage see identical frame timing.
+    """
+
+    #: Live sources (screen) produce frames in real time; recorded ones on demand
+    is_live = False
+    #: Sources that can restrict capture to a region of interest (see set_roi)
+    supports_roi = False
+
+    def __init__(self):
+        self.exhausted = False
+        self.frame_index = 0
+        self._start_ns = time.monotonic_ns()
+
+    @abstractmethod
+    def read(self) -> Optional[CapturedFrame]:
+        """
+        Read the next frame.
+
+        Returns:
+            CapturedFrame, or None if no frame is available
+        """
+        pass
+
+    def capture_frame(self) -> Optional[np.ndarray]:
+        """Read the next frame's image only."""
+        captured = self.read()
+        return captured.image if captured is not None else None
+
+    @abstractmethod
+    def get_screen_dimensions(self) -> Tuple[int, int]:
+        """
+        Get dimensions of the frames.
+
+        Returns:
+            (width, height) tuple
+        """
+        pass
+
+    def set_roi(self, region: Optional[Tuple[int, int, int, int]]) -> None:
+        """
+        Restrict subsequent frames to a region of interest.
+
+        Sources without ``supports_roi`` always return full frames.
+
+        Args:
+            region: (x, y, width, height) in screen coordinates, or None for
+                the full capture area
+        """
+        pass
+
+    def close(self) -> None:
+        """Release source resources."""
+        pass
+
+    def _recorded_frame(self, image: np.ndarray, media_time_ns: int) -> CapturedFrame:
+        """Wrap a recorded frame, timing it by its media position."""
+        captured = CapturedFrame(
+            image=image,
+            index=self.frame_index,
+            timestamp_ns=self._start_ns + media_time_ns,
+            media_time_ns=media_time_ns
+        )
+        self.frame_index += 1
+        return captured
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
+class VideoFileSource(FrameSource):
+    """
+    Reads a video file with cv2.VideoCapture.
+
+    Decoding runs on a background thread that keeps up to ``prefetch``
+    frames queued, so decode time overlaps with frame processing.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        loop: bool = False,
+        prefetch: int = 8,
+        start_frame: int = 0,
+        stride: int = 1
+    ):
+        """
+        Initialize video source.
+
+        Args:
+            path: Video file path
+            loop: Restart from the beginning at the end of the file
+            prefetch: Frames decoded ahead (0 = decode on the calling thread)
+            start_frame: First file frame to read
+            stride: Read every stride-th frame (skipped frames are not decoded)
+
+        Raises:
+            IOError: If the file cannot be opened
+        """
+        super().__init__()
+        self.path = path
+        self.loop = loop
+        self.capture = cv2.VideoCapture(path)
+        if not self.capture.isOpened():
+            raise IOError(f"Cannot open video: {path}")
+
+        self.fps = float(self.capture.get(cv2.CAP_PROP_FPS) or 0.0)
+        self.frame_count = max(int(self.capture.get(cv2.CAP_PROP_FRAME_COUNT)), 0)
+        self.stride = max(int(stride), 1)
+        if start_frame > 0:
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+        self._loop_offset_ns = 0
+        self._last_media_ns = 0
+        self._decoded = 0
+
+        self._queue: Optional[queue.Queue] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if prefetch > 0:
+            self._queue = queue.Queue(maxsize=prefetch)
+            self._thread = threading.Thread(target=self._decode_loop, name="video-decode", daemon=True)
+            self._thread.start()
+
+    def _decode(self) -> Optional[Tuple[np.ndarray, int]]:
+        """Decode the next frame and its media time (None at the end)."""
+        if self._decoded:
+            for _ in range(self.stride - 1):
+                if not self.capture.grab():
+                    break
+        self._decoded += 1
+        ok, image = self.capture.read()
+        if not ok and self.loop:
+            self._loop_offset_ns = self._last_media_ns + self._frame_duration_ns()
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, image = self.capture.read()
+        if not ok:
+            return None
+
+        position_ms = self.capture.get(cv2.CAP_PROP_POS_MSEC)
+        if position_ms and position_ms > 0:
+            media_ns = int(position_ms * 1e6)
+        else:
+            position = max(int(self.capture.get(cv2.CAP_PROP_POS_FRAMES)) - 1, 0)
+            media_ns = position * self._frame_duration_ns()
+        self._last_media_ns = self._loop_offset_ns + media_ns
+        return image, self._last_media_ns
+
+    def _frame_duration_ns(self) -> int:
+        return int(1e9 / self.fps) if self.fps > 0 else int(1e9 / 30)
+
+    def _decode_loop(self) -> None:
+        """Prefetch thread: decode until the end of the file or close()."""
+        while not self._stop.is_set():
+            item = self._decode()
+            while not self._stop.is_set():
+                try:
+                    self._queue.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if item is None:
+                return
+
+    def read(self) -> Optional[CapturedFrame]:
+        if self.exhausted:
+            return None
+
+        if self._queue is not None:
+            item = self._queue.get()
+        else:
+            item = self._decode()
+
+        if item is None:
+            self.exhausted = True
+            return None
+        image, media_ns = item
+        return self._recorded_frame(image, media_ns)
+
+    def get_screen_dimensions(self) -> Tuple[int, int]:
+        return (
+            int(self.capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            int(self.capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        )
+
+    def close(self) -> None:
+        """Stop decoding and release the file."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self.capture.release()
+
+
+class ImageDirectorySource(FrameSource):
+    """Reads the images of a directory (e.g. tests/unsplash_samples) in name order."""
+
+    def __init__(self, directory: str, loop: bool = False, fps: float = 30.0):
+        """
+        Initialize image directory source.
+
+        Args:
+            directory: Directory containing images
+            loop: Restart from the first image after the last
+            fps: Nominal rate used to derive frame timestamps
+
+        Raises:
+            IOError: If the directory contains no images
+        """
+        super().__init__()
+        self.directory = directory
+        self.loop = loop
+        self.fps = fps
+        self.paths: List[str] = sorted(
+            os.path.join(directory, name) for name in os.listdir(directory)
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        )
+        if not self.paths:
+            raise IOError(f"No images found in: {directory}")
+        self.position = 0
+        self._dimensions: Optional[Tuple[int, int]] = None
+
+    def read(self) -> Optional[CapturedFrame]:
+        for _ in range(len(self.paths) + 1):
+            if self.exhausted:
+                return None
+            if self.position >= len(self.paths):
+                if not self.loop:
+                    self.exhausted = True
+                    return None
+                self.position = 0
+
+            path = self.paths[self.position]
+            self.position += 1
+            image = cv2.imread(path, cv2.IMREAD_COLOR)
+            if image is None:
+                print(f"Skipping unreadable image: {path}")
+                continue
+            self._dimensions = (image.shape[1], image.shape[0])
+            return self._recorded_frame(image, int(self.frame_index * 1e9 / self.fps))
+
+        # Every image is unreadable
+        self.exhausted = True
+        return None
+
+    def get_screen_dimensions(self) -> Tuple[int, int]:
+        """(width, height) of the last image read."""
+        return self._dimensions or (0, 0)
+
+
+class SyntheticSource(FrameSource):
+    """
+    Deterministic generated frames with moving faces.
+
+    Faces are drawn as simple cartoon faces, or pasted from ``sprites``
+    (e.g. crops from tests/fer2013_samples), moving on fixed trajectories.
+    The same seed always yields the same frames, and ``boxes_at`` gives the
+    ground-truth face boxes of any frame.
+    """
+
+    def __init__(
+        self,
+        width: int = 1280,
+        height: int = 720,
+        num_faces: int = 3,
+        face_size: int = 160,
+        frames: Optional[int] = None,
+        fps: float = 30.0,
+        sprites: Optional[Sequence[np.ndarray]] = None,
+        seed: int = 0
+    ):
+        """
+        Initialize synthetic source.
+
+        Args:
+            width: Frame width
+            height: Frame height
+            num_faces: Number of moving faces
+            face_size: Face box size in pixels
+            frames: Number of frames before the source is exhausted (None = endless)
+            fps: Nominal rate used to derive frame timestamps and motion
+            sprites: Optional face images to paste instead of drawn faces
+            seed: Seed for trajectories and background noise
+        """
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.face_size = face_size
+        self.frames = frames
+        self.fps = fps
+
+        rng = np.random.default_rng(seed)
+        span = np.maximum([width - face_size, height - face_size], 1).astype(np.float64)
+        self._start = rng.uniform(0, 1, size=(num_faces, 2)) * span
+        self._velocity = rng.uniform(-120, 120, size=(num_faces, 2))  # pixels per second
+        self._span = span
+        self._background = rng.integers(40, 90, size=(height, width, 3), dtype=np.uint8)
+        self._sprites = [
+            cv2.resize(sprite, (face_size, face_size), interpolation=cv2.INTER_AREA)
+            for sprite in (sprites or [])
+        ]
+
+    def boxes_at(self, index: int) -> List[Tuple[int, int, int, int]]:
+        """Ground-truth (x, y, w, h) face boxes of a frame."""
+        t = index / self.fps
+        position = self._start + self._velocity * t
+        # Bounce inside the frame: reflect positions into [0, span]
+        period = 2 * self._span
+        position = position % period
+        position = np.where(position > self._span, period - position, position)
+        return [(int(x), int(y), self.face_size, self.face_size) for x, y in position]
+
+    def _draw_face(self, image: np.ndarray, box: Tuple[int, int, int, int], face_index: int) -> None:
+        x, y, w, h = box
+        if self._sprites:
+            image[y:y + h, x:x + w] = self._sprites[face_index % len(self._sprites)]
+            return
+        center = (x + w // 2, y + h // 2)
+        cv2.ellipse(image, center, (w * 2 // 5, h // 2), 0, 0, 360, (150, 180, 220), -1)
+        for dx in (-w // 6, w // 6):
+            cv2.circle(image, (center[0] + dx, center[1] - h // 8), max(w // 20, 2), (40, 40, 40), -1)
+        cv2.ellipse(image, (center[0], center[1] + h // 5), (w // 6, h // 14), 0, 0, 180, (60, 60, 140), 2)
+
+    def read(self) -> Optional[CapturedFrame]:
+        if self.exhausted:
+            return None
+        if self.frames is not None and self.frame_index >= self.frames:
+            self.exhausted = True
+            return None
+
+        image = self._background.copy()
+        for i, box in enumerate(self.boxes_at(self.frame_index)):
+            self._draw_face(image, box, i)
+        return self._recorded_frame(image, int(self.frame_index * 1e9 / self.fps))
+
+    def get_screen_dimensions(self) -> Tuple[int, int]:
+        return (self.width, self.height)
+
+
+def create_frame_source(config: dict) -> FrameSource:
+    """
+    Create the frame source described by the configuration.
+
+    Args:
+        config: Application configuration ('frame_source' and 'screen_capture')
+
+    Returns:
+        FrameSource (screen capture unless configured otherwise)
+
+    Raises:
+        ValueError: For an unknown source type
+    """
+    source_config = config.get('frame_source') or {}
+    source_type = source_config.get('type', 'screen')
+
+    if source_type == 'screen':
+        from .screen_capture import ScreenCapture
+        screen_config = config.get('screen_capture', {})
+        return ScreenCapture(
+            monitor_index=screen_config.get('monitor', 0),
+            region=screen_config.get('region'),
+            window_title=screen_config.get('window_title'),
+            window_poll_interval=screen_config.get('window_poll_interval', 1.0)
+        )
+    if source_type == 'video':
+        return VideoFileSource(
+            source_config['path'],
+            loop=source_config.get('loop', False),
+            prefetch=source_config.get('prefetch', 8)
+        )
+    if source_type == 'images':
+        return ImageDirectorySource(
+            source_config['path'],
+            loop=source_config.get('loop', False),
+            fps=source_config.get('fps', 30.0)
+        )
+    if source_type == 'synthetic':
+        return SyntheticSource(
+            width=source_config.get('width', 1280),
+            height=source_config.get('height', 720),
+            num_faces=source_config.get('num_faces', 3),
+            frames=source_config.get('frames'),
+            fps=source_config.get('fps', 30.0),
+            seed=source_config.get('seed', 0)
+        )
+    raise ValueError(f"Unknown frame source type: {source_type}")
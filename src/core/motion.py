@@ -0,0 +1,201 @@
+"""Frame-difference motion gating for face detection."""
+
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+Region = Tuple[int, int, int, int]  # x, y, width, height in frame coordinates
+
+
+def merge_regions(regions: List[Region]) -> List[Region]:
+    """
+    Merge overlapping regions into their bounding boxes.
+
+    Args:
+        regions: Regions, possibly overlapping
+
+    Returns:
+        Pairwise disjoint regions covering the input
+    """
+    merged = [list(r) for r in regions]
+    changed = True
+    while changed:
+        changed = False
+        for i in range(len(merged)):
+            for j in range(len(merged) - 1, i, -1):
+                ax, ay, aw, ah = merged[i]
+                bx, by, bw, bh = merged[j]
+                if ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah:
+                    x0, y0 = min(ax, bx), min(ay, by)
+                    x1, y1 = max(ax + aw, bx + bw), max(ay + ah, by + bh)
+                    merged[i] = [x0, y0, x1 - x0, y1 - y0]
+                    del merged[j]
+                    changed = True
+    return [tuple(r) for r in merged]
+
+
+def grow_regions(
+    regions: List[Region],
+    boxes: List[Region],
+    padding: int,
+    width: int,
+    height: int
+) -> List[Region]:
+    """
+    Grow regions to contain every box they touch, padded.
+
+    A region that catches part of a face (e.g. a moving mouth) is widened
+    to the whole face, so detection in it can find the face again.
+
+    Args:
+        regions: Disjoint regions (e.g. from MotionGate.update)
+        boxes: Boxes to include when a region overlaps them (e.g. last faces)
+        padding: Pixels added around each included box
+        width: Frame width (regions are clipped to the frame)
+        height: Frame height
+
+    Returns:
+        Disjoint regions
+    """
+    padded = [
+        (max(x - padding, 0), max(y - padding, 0), min(x + w + padding, width), min(y + h + padding, height))
+        for x, y, w, h in boxes
+    ]
+    changed = True
+    while changed:
+        changed = False
+        grown = []
+        for rx, ry, rw, rh in regions:
+            x0, y0, x1, y1 = rx, ry, rx + rw, ry + rh
+            for bx0, by0, bx1, by1 in padded:
+                touches = bx0 < x1 and x0 < bx1 and by0 < y1 and y0 < by1
+                if touches and not (x0 <= bx0 and y0 <= by0 and bx1 <= x1 and by1 <= y1):
+                    x0, y0, x1, y1 = min(x0, bx0), min(y0, by0), max(x1, bx1), max(y1, by1)
+                    changed = True
+            grown.append((x0, y0, x1 - x0, y1 - y0))
+        regions = merge_regions(grown)
+    return regions
+
+
+class MotionGate:
+    """
+    Finds where a frame changed since the previous one.
+
+    Frames are reduced to a small blurred grayscale image; pixels whose
+    level changed by more than ``threshold`` form a motion mask, and its
+    connected blobs, padded by ``padding`` frame pixels, are the regions
+    worth detecting faces in. Every ``full_refresh_interval`` frames, and
+    whenever the frame size changes, the gate asks for a full-frame pass
+    instead so faces that appeared without motion (or were missed) are
+    still found.
+    """
+
+    def __init__(
+        self,
+        width: int = 160,
+        threshold: int = 20,
+        min_area: int = 4,
+        padding: int = 64,
+        full_refresh_interval: int = 60,
+        max_motion_fraction: float = 0.4
+    ):
+        """
+        Initialize motion gate.
+
+        Args:
+            width: Width of the difference image in pixels
+            threshold: Gray-level change that counts as motion
+            min_area: Smallest motion blob, in difference-image pixels
+            padding: Frame pixels added around each motion blob
+            full_refresh_interval: Frames between full-frame passes
+            max_motion_fraction: Fraction of the frame in motion regions
+                above which a full-frame pass is cheaper
+        """
+        self.width = width
+        self.threshold = threshold
+        self.min_area = min_area
+        self.padding = padding
+        self.full_refresh_interval = max(int(full_refresh_interval), 1)
+        self.max_motion_fraction = max_motion_fraction
+        self.full_refreshes = 0
+        self.gated_frames = 0
+        self.idle_frames = 0
+        self._previous: Optional[np.ndarray] = None
+        self._frame_shape: Optional[tuple] = None
+        self._frames_since_refresh = 0
+
+    def _small_gray(self, frame: np.ndarray) -> np.ndarray:
+        """Small blurred grayscale copy of a frame."""
+        height, width = frame.shape[:2]
+        # Subsample before resizing so the cost does not grow with resolution
+        step = max(width // (self.width * 2), 1)
+        small = np.ascontiguousarray(frame[::step, ::step])
+        small_height = max(int(round(height * self.width / width)), 1)
+        small = cv2.resize(small, (self.width, small_height), interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return cv2.GaussianBlur(small, (5, 5), 0)
+
+    def update(self, frame: np.ndarray) -> Optional[List[Region]]:
+        """
+        Compare a frame with the previous one.
+
+        Args:
+            frame: BGR or grayscale frame
+
+        Returns:
+            Regions that changed (empty if nothing moved), or None when the
+            whole frame should be searched
+        """
+        small = self._small_gray(frame)
+        previous, self._previous = self._previous, small
+        self._frames_since_refresh += 1
+        if (
+            previous is None
+            or frame.shape != self._frame_shape
+            or self._frames_since_refresh >= self.full_refresh_interval
+        ):
+            return self._full_refresh(frame)
+
+        diff = cv2.absdiff(small, previous)
+        _, mask = cv2.threshold(diff, self.threshold, 255, cv2.THRESH_BINARY)
+        if not mask.any():
+            self.idle_frames += 1
+            return []
+
+        mask = cv2.dilate(mask, np.ones((3, 3), np.uint8))
+        count, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+        height, width = frame.shape[:2]
+        scale = width / small.shape[1]
+        regions = []
+        for x, y, w, h, area in stats[1:count].tolist():
+            if area < self.min_area:
+                continue
+            x0 = max(int(x * scale) - self.padding, 0)
+            y0 = max(int(y * scale) - self.padding, 0)
+            x1 = min(int((x + w) * scale) + self.padding, width)
+            y1 = min(int((y + h) * scale) + self.padding, height)
+            regions.append((x0, y0, x1 - x0, y1 - y0))
+
+        regions = merge_regions(regions)
+        if sum(w * h for _, _, w, h in regions) > self.max_motion_fraction * width * height:
+            return self._full_refresh(frame)
+        if regions:
+            self.gated_frames += 1
+        else:
+            self.idle_frames += 1
+        return regions
+
+    def _full_refresh(self, frame: np.ndarray) -> Optional[List[Region]]:
+        """Restart the refresh interval at a full-frame pass; returns None for update()."""
+        self._frame_shape = frame.shape
+        self._frames_since_refresh = 0
+        self.full_refreshes += 1
+        return None
+
+    def reset(self) -> None:
+        """Forget the previous frame; the next frame gets a full-frame pass."""
+        self._previous = None
+        self._frame_shape = None
+        self._frames_since_refresh = 0
@@ -0,0 +1,161 @@
+"""Parallel per-monitor screen capture and face detection."""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from ..data.models import FaceRegion
+from .face_detector import FaceDetector
+from .frame_sources import CapturedFrame, FrameSource
+
+
+@dataclass
+class MonitorView:
+    """One monitor's frame with the faces detected in it (frame coordinates)."""
+    captured: CapturedFrame
+    regions: List[FaceRegion]
+
+
+def list_monitors() -> List[int]:
+    """Indices of the physical monitors (0 = primary), as used by ScreenCapture."""
+    import mss
+
+    with mss.mss() as sct:
+        return list(range(len(sct.monitors) - 1))
+
+
+def screen_source(monitor_index: int) -> FrameSource:
+    """Screen capture of one monitor."""
+    from .screen_capture import ScreenCapture
+    return ScreenCapture(monitor_index=monitor_index)
+
+
+class MonitorWorker:
+    """
+    Captures and detects faces on one monitor, always on the same thread.
+
+    The capture handle is created on the worker thread (mss handles must
+    stay on the thread that opened them) and the worker owns its detector,
+    whose detection cache is per monitor.
+    """
+
+    def __init__(
+        self,
+        monitor_index: int,
+        detector: FaceDetector,
+        source_factory: Callable[[int], FrameSource] = screen_source
+    ):
+        """
+        Initialize monitor worker.
+
+        Args:
+            monitor_index: Monitor to capture (0 = primary)
+            detector: Initialized face detector used only by this worker
+            source_factory: Opens the monitor's frame source (on the worker thread)
+        """
+        self.monitor_index = monitor_index
+        self.detector = detector
+        self.source_factory = source_factory
+        self.capture: Optional[FrameSource] = None
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"monitor-{monitor_index}")
+
+    def _step(self) -> Optional[MonitorView]:
+        """Capture one frame and detect its faces (on the worker thread; None if nothing was captured)."""
+        if self.capture is None:
+            self.capture = self.source_factory(self.monitor_index)
+        captured = self.capture.read()
+        if captured is None:
+            return None
+        return MonitorView(captured, self.detector.detect_faces(captured.image))
+
+    def submit(self):
+        """Capture and detect one frame on the worker thread (returns a Future)."""
+        return self.executor.submit(self._step)
+
+    def _close(self) -> None:
+        """Close the capture handle on the thread that opened it."""
+        if self.capture:
+            self.capture.close()
+            self.capture = None
+
+    def close(self) -> None:
+        """Release the capture handle and stop the worker thread."""
+        self.executor.submit(self._close)
+        self.executor.shutdown(wait=True)
+        self.detector.shutdown()
+
+
+class MultiMonitorCapture:
+    """
+    Captures every selected monitor separately and detects faces in parallel.
+
+    Each monitor has its own worker thread and detector, so detection works
+    on monitor-sized frames concurrently (OpenCV releases the GIL) instead
+    of on one combined desktop image. Frames keep their monitor's screen
+    origin for merging results in global coordinates.
+    """
+
+    def __init__(
+        self,
+        monitors: Optional[List[int]] = None,
+        detector_factory: Callable[[], FaceDetector] = lambda: FaceDetector(method="opencv"),
+        source_factory: Callable[[int], FrameSource] = screen_source
+    ):
+        """
+        Initialize multi-monitor capture.
+
+        Args:
+            monitors: Monitor indices (0 = primary); None = all monitors
+            detector_factory: Creates one uninitialized detector per monitor
+            source_factory: Opens one monitor's frame source (default: screen capture)
+        """
+        self.monitors = list(monitors) if monitors is not None else list_monitors()
+        self.detector_factory = detector_factory
+        self.source_factory = source_factory
+        self.workers: List[MonitorWorker] = []
+
+    def initialize(self) -> bool:
+        """
+        Create a detector and worker per monitor.
+
+        Returns:
+            True if every monitor's detector initialized
+        """
+        for index in self.monitors:
+            detector = self.detector_factory()
+            if not detector.initialize():
+                print(f"ERROR: Failed to initialize face detector for monitor {index}")
+                self.close()
+                return False
+            self.workers.append(MonitorWorker(index, detector, self.source_factory))
+        return bool(self.workers)
+
+    def read(self) -> List[MonitorView]:
+        """
+        Capture and detect on all monitors in parallel.
+
+        Returns:
+            Views of the monitors that captured successfully
+        """
+        futures = [worker.submit() for worker in self.workers]
+        views = []
+        for worker, future in zip(self.workers, futures):
+            try:
+                view = future.result()
+            except Exception as e:
+                print(f"Error on monitor {worker.monitor_index}: {e}")
+                continue
+            if view is not None:
+                views.append(view)
+        return views
+
+    def set_detection_scale(self, scale: float) -> None:
+        """Set the detection resolution scale of every monitor's detector."""
+        for worker in self.workers:
+            worker.detector.detection_scale = scale
+
+    def close(self) -> None:
+        """Stop all workers."""
+        for worker in self.workers:
+            worker.close()
+        self.workers = []
@@ -0,0 +1,187 @@
+"""Capture regions of interest: followed windows and face-driven auto-ROI."""
+
+import time
+from typing import Callable, List, Optional, Tuple
+
+from ..data.models import FaceRegion
+from ..utils.box_ops import regions_to_boxes
+
+try:
+    import pywinctl
+except ImportError:  # Window following is optional
+    pywinctl = None
+
+Region = Tuple[int, int, int, int]  # x, y, width, height in screen coordinates
+
+
+def intersect_regions(a: Region, b: Region) -> Optional[Region]:
+    """
+    Intersection of two regions.
+
+    Returns:
+        The overlapping region, or None if they do not overlap
+    """
+    x0, y0 = max(a[0], b[0]), max(a[1], b[1])
+    x1, y1 = min(a[0] + a[2], b[0] + b[2]), min(a[1] + a[3], b[1] + b[3])
+    if x1 <= x0 or y1 <= y0:
+        return None
+    return (x0, y0, x1 - x0, y1 - y0)
+
+
+def find_window(title: str) -> Optional[Region]:
+    """
+    Geometry of the first visible window whose title contains ``title``.
+
+    Args:
+        title: Case-insensitive title substring
+
+    Returns:
+        Window region, or None if no such window is visible (or pywinctl
+        is not installed)
+    """
+    if pywinctl is None:
+        return None
+    needle = title.lower()
+    for window in pywinctl.getAllWindows():
+        if needle not in (window.title or "").lower():
+            continue
+        if window.isMinimized or window.width <= 0 or window.height <= 0:
+            continue
+        return (window.left, window.top, window.width, window.height)
+    return None
+
+
+class WindowFollower:
+    """
+    Tracks a window's geometry, re-queried at a low rate.
+
+    Window lookups cost far more than a frame budget on some platforms, so
+    the geometry is cached for ``poll_interval`` seconds; window moves and
+    resizes are picked up within that delay.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        poll_interval: float = 1.0,
+        lookup: Callable[[str], Optional[Region]] = find_window
+    ):
+        """
+        Initialize window follower.
+
+        Args:
+            title: Case-insensitive title substring of the window to follow
+            poll_interval: Seconds between geometry queries
+            lookup: Returns a window region for a title (default: find_window)
+        """
+        if lookup is find_window and pywinctl is None:
+            print("Warning: pywinctl not installed, window following disabled")
+        self.title = title
+        self.poll_interval = poll_interval
+        self.lookup = lookup
+        self._geometry: Optional[Region] = None
+        self._queried_at: Optional[float] = None
+        self._found = True
+
+    def geometry(self, now: Optional[float] = None) -> Optional[Region]:
+        """
+        Current window region.
+
+        Args:
+            now: Current monotonic time (default: time.monotonic())
+
+        Returns:
+            Window region, or None while the window is not visible
+        """
+        now = time.monotonic() if now is None else now
+        if self._queried_at is None or now - self._queried_at >= self.poll_interval:
+            self._queried_at = now
+            self._geometry = self.lookup(self.title)
+            found = self._geometry is not None
+            if found != self._found:
+                print(f"Window '{self.title}' {'found' if found else 'not visible'}")
+                self._found = found
+        return self._geometry
+
+
+class AutoRoi:
+    """
+    Shrinks capture to the area around tracked faces.
+
+    Each frame the region becomes the union of the face boxes, each padded
+    by ``margin`` of its size. With no faces, and every
+    ``full_scan_interval`` frames, the region is cleared so the next frame
+    scans the full capture area for faces that appeared elsewhere. Moves
+    of every edge within ``tolerance`` pixels (detection jitter) keep the
+    previous region, so the capture area and frame size stay stable.
+    """
+
+    def __init__(
+        self,
+        margin: float = 0.5,
+        min_size: int = 160,
+        full_scan_interval: int = 30,
+        tolerance: int = 8
+    ):
+        """
+        Initialize auto-ROI.
+
+        Args:
+            margin: Padding around each face as a fraction of its size
+            min_size: Smallest region side in pixels
+            full_scan_interval: Frames between full-area scans
+            tolerance: Largest edge movement in pixels that keeps the region
+        """
+        self.margin = margin
+        self.min_size = min_size
+        self.full_scan_interval = max(int(full_scan_interval), 1)
+        self.tolerance = tolerance
+        self.region: Optional[Region] = None
+        self.full_scans = 0
+        self._frames_since_scan = 0
+
+    def update(self, regions: List[FaceRegion]) -> Optional[Region]:
+        """
+        Choose the region for the next frame.
+
+        Args:
+            regions: Faces found in the current frame, in screen coordinates
+
+        Returns:
+            Region to capture next, or None for the full capture area
+        """
+        self._frames_since_scan += 1
+        if not regions or self._frames_since_scan >= self.full_scan_interval:
+            self._frames_since_scan = 0
+            if self.region is not None:
+                self.full_scans += 1
+            self.region = None
+            return None
+
+        boxes, _ = regions_to_boxes(regions)
+        pad = boxes[:, 2:] * self.margin
+        x0, y0 = (boxes[:, :2] - pad).min(axis=0)
+        x1, y1 = (boxes[:, :2] + boxes[:, 2:] + pad).max(axis=0)
+
+        # Keep small regions centered on the faces
+        grow_x = max(self.min_size - (x1 - x0), 0) / 2
+        grow_y = max(self.min_size - (y1 - y0), 0) / 2
+        x0, x1 = x0 - grow_x, x1 + grow_x
+        y0, y1 = y0 - grow_y, y1 + grow_y
+
+        region = (int(x0), int(y0), int(x1 - x0 + 0.5), int(y1 - y0 + 0.5))
+        if self.region is None or self._moved(region):
+            self.region = region
+        return self.region
+
+    def _moved(self, region: Region) -> bool:
+        """Whether any edge of ``region`` is more than the tolerance from the current region's."""
+        x, y, w, h = self.region
+        nx, ny, nw, nh = region
+        edges = (nx - x, ny - y, nx + nw - x - w, ny + nh - y - h)
+        return max(abs(e) for e in edges) > self.tolerance
+
+    def reset(self) -> None:
+        """Return to full-area capture."""
+        self.region = None
+        self._frames_since_scan = 0
@@ -1,26 +1,50 @@
 """Screen capture functionality for cross-platform monitoring."""
 
+import time
 import numpy as np
 import mss
 import mss.tools
 from typing import Optional, Tuple
 import cv2
 
+from .frame_sources import FrameSource, CapturedFrame
+from .roi import WindowFollower, intersect_regions
 
-class ScreenCapture:
-    """Captures screen content for face detection."""
 
-    def __init__(self, monitor_index: int = 0, region: Optional[Tuple[int, int, int, int]] = None):
+class ScreenCapture(FrameSource):
+    """
+    Captures screen content for face detection.
+
+    The capture area is a followed window when ``window_title`` is set and
+    the window is visible, else the fixed ``region``, else the monitor. A
+    region of interest (``set_roi``) narrows each grab further.
+    """
+
+    is_live = True
+    supports_roi = True
+
+    def __init__(
+        self,
+        monitor_index: int = 0,
+        region: Optional[Tuple[int, int, int, int]] = None,
+        window_title: Optional[str] = None,
+        window_poll_interval: float = 1.0
+    ):
         """
         Initialize screen capture.
 
         Args:
             monitor_index: Monitor to capture (0 = primary, 1 = secondary, etc.)
             region: Optional region to capture as (x, y, width, height). None = full screen
+            window_title: Follow the first window whose title contains this text
+            window_poll_interval: Seconds between window geometry queries
         """
+        super().__init__()
         self.sct = mss.mss()
         self.monitor_index = monitor_index
         self.region = region
+        self.roi: Optional[Tuple[int, int, int, int]] = None
+        self.window = WindowFollower(window_title, window_poll_interval) if window_title else None
 
         # Get monitor info
         self.monitors = self.sct.monitors
@@ -32,22 +56,24 @@ class ScreenCapture:
 
         self.monitor = self.monitors[actual_index]
 
-    def capture_frame(self) -> Optional[np.ndarray]:
+    def read(self) -> Optional[CapturedFrame]:
         """
         Capture a single frame from the screen.
 
         Returns:
-            Frame as numpy array (BGR format) or None if capture fails
+            CapturedFrame (BGR image, capture time, screen origin) or None if
+            capture fails
         """
         try:
             # Determine capture region
-            if self.region:
-                x, y, w, h = self.region
-                capture_area = {"left": x, "top": y, "width": w, "height": h}
-            else:
-                capture_area = self.monitor
+            bounds = self.capture_bounds()
+            if self.roi:
+                bounds = intersect_regions(self.roi, bounds) or bounds
+            x, y, w, h = bounds
+            capture_area = {"left": x, "top": y, "width": w, "height": h}
 
             # Capture screen
+            timestamp_ns = time.monotonic_ns()
             screenshot = self.sct.grab(capture_area)
 
             # Convert to numpy array
@@ -56,12 +82,36 @@ class ScreenCapture:
             # Convert BGRA to BGR (remove alpha channel)
             frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
 
-            return frame
+            captured = CapturedFrame(
+                image=frame,
+                index=self.frame_index,
+                timestamp_ns=timestamp_ns,
+                media_time_ns=timestamp_ns - self._start_ns,
+                origin=(capture_area["left"], capture_area["top"])
+            )
+            self.frame_index += 1
+            return captured
 
         except Exception as e:
             print(f"Error capturing screen: {e}")
             return None
 
+    def capture_bounds(self) -> Tuple[int, int, int, int]:
+        """
+        Full capture area before any region of interest.
+
+        Returns:
+            (x, y, width, height) in screen coordinates
+        """
+        if self.window:
+            geometry = self.window.geometry()
+            if geometry:
+                return geometry
+        if self.region:
+            return tuple(self.region)
+        monitor = self.monitor
+        return (monitor["left"], monitor["top"], monitor["width"], monitor["height"])
+
     def get_screen_dimensions(self) -> Tuple[int, int]:
         """
         Get dimensions of the capture area.
@@ -69,10 +119,8 @@ class ScreenCapture:
         Returns:
             (width, height) tuple
         """
-        if self.region:
-            return (self.region[2], self.region[3])
-        else:
-            return (self.monitor["width"], self.monitor["height"])
+        _, _, width, height = self.capture_bounds()
+        return (width, height)
 
     def set_region(self, region: Optional[Tuple[int, int, int, int]]) -> None:
         """
@@ -83,15 +131,16 @@ class ScreenCapture:
         """
         self.region = region
 
+    def set_roi(self, region: Optional[Tuple[int, int, int, int]]) -> None:
+        """
+        Restrict grabs to a region of interest (clipped to the capture area).
+
+        Args:
+            region: (x, y, width, height) in screen coordinates, or None
+        """
+        self.roi = region
+
     def close(self) -> None:
         """Release screen capture resources."""
         if self.sct:
             self.sct.close()
-
-    def __enter__(self):
-        """Context manager entry."""
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.close()
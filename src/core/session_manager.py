@@ -2,45 +2,100 @@
 
 import time
 import uuid
-from datetime import datetime
-from typing import Optional
+from dataclasses import replace
+from typing import List, Optional
 import numpy as np
 
-from ..data.models import FrameAnalysis, FaceAnalysis
-from ..core.screen_capture import ScreenCapture
-from ..core.face_detector import FaceDetector
+from ..data.models import FrameAnalysis, FaceAnalysis, FaceRegion
+from ..data.batch import FrameBatch
+from ..core.frame_sources import FrameSource, create_frame_source
+from ..core.face_detector import FaceDetector, create_face_detector
+from ..core.tracker import FaceTracker
+from ..core.roi import AutoRoi
+from ..core.multi_monitor import MonitorView, MultiMonitorCapture
+from ..core.degradation import DegradationLadder, QualityState
 from ..detection.emotion_detector import EmotionDetector
 from ..detection.deception import DeceptionDetector
 from ..data.logger import SessionLogger
 from ..utils.performance import PerformanceMonitor
+from ..utils.instrumentation import get_instrumentation
+from ..utils.frame_clock import FrameClock
+from ..utils.metrics_server import MetricsServer, Metric, gauge, counter, add_histogram, DEFAULT_NAMESPACE
 
 
 class SessionManager:
     """Manages a detection session from start to finish."""
 
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, frame_source=None):
         """
         Initialize session manager.
 
         Args:
             config: Application configuration
+            frame_source: Optional FrameSource (e.g. a video file); defaults
+                to the source configured under 'frame_source' (screen capture)
         """
         self.config = config
         self.session_id = str(uuid.uuid4())[:8]
 
         # Components
-        self.screen_capture: Optional[ScreenCapture] = None
+        self.frame_source: Optional[FrameSource] = frame_source
+        self.multi_monitor: Optional[MultiMonitorCapture] = None
         self.face_detector: Optional[FaceDetector] = None
         self.emotion_detector: Optional[EmotionDetector] = None
         self.deception_detector: Optional[DeceptionDetector] = None
         self.logger: Optional[SessionLogger] = None
         self.performance: Optional[PerformanceMonitor] = None
+        self.metrics_server: Optional[MetricsServer] = None
 
         # Session state
         self.is_running = False
         self.is_initialized = False
         self.frame_count = 0
+        self.faces_detected = 0
+        self.deception_events = 0
         self.last_process_time = 0
+        self.degradation_level = 0
+        self.degradation_changes = {'up': 0, 'down': 0}
+
+        # Quality-of-service ladder walked by the adaptive controller
+        perf_config = config.get('performance', {})
+        self.ladder = DegradationLadder(perf_config.get('degradation_ladder'))
+        self.quality = QualityState()
+
+        # Stable face IDs across frames (also caches per-track analyses)
+        tracking_config = perf_config.get('tracking', {})
+        self.tracker = FaceTracker(
+            max_distance=tracking_config.get('max_distance', 100),
+            timeout=tracking_config.get('timeout', 30)
+        )
+
+        # Per-stage latency histograms (no-op unless performance.instrumentation)
+        self.instrumentation = get_instrumentation()
+        # The metrics endpoint exports the stage timers, so it turns them on too
+        self.metrics_config = config.get('metrics', {})
+        self.instrumentation.enabled = (
+            config.get('performance', {}).get('instrumentation', False)
+            or self.metrics_config.get('enabled', False)
+        )
+
+        # Shrink screen capture to the tracked faces (screen sources only)
+        roi_config = config.get('screen_capture', {}).get('auto_roi', {}) or {}
+        self.auto_roi: Optional[AutoRoi] = None
+        if roi_config.get('enabled', False):
+            self.auto_roi = AutoRoi(
+                margin=roi_config.get('margin', 0.5),
+                min_size=roi_config.get('min_size', 160),
+                full_scan_interval=roi_config.get('full_scan_interval', 30),
+                tolerance=roi_config.get('tolerance', 8)
+            )
+        self.capture_pixels = 0
+
+        # Carry per-frame results as a columnar FrameBatch instead of objects
+        self.use_frame_batch = config.get('performance', {}).get('frame_batch', False)
+
+        # Deadline scheduler for processing loops (follows the adaptive FPS)
+        self.frame_clock = FrameClock(self._frame_interval)
 
         # Frame callback for UI updates
         self.frame_callback = None
@@ -52,20 +107,36 @@ class SessionManager:
             print(f"Initializing Session: {self.session_id}")
             print(f"{'='*60}\n")
 
-            # Initialize screen capture
-            screen_config = self.config.get('screen_capture', {})
-            self.screen_capture = ScreenCapture(
-                monitor_index=screen_config.get('monitor', 0),
-                region=screen_config.get('region')
-            )
-            print("✓ Screen capture initialized")
-
-            # Initialize face detector (use OpenCV for small images)
-            self.face_detector = FaceDetector(method="opencv")
-            if not self.face_detector.initialize():
-                print("ERROR: Failed to initialize face detector")
-                return False
-            print("✓ Face detector initialized")
+            # Initialize frame source
+            monitors = self.config.get('screen_capture', {}).get('monitors')
+            if self.frame_source is None and monitors:
+                self.multi_monitor = MultiMonitorCapture(
+                    None if monitors == 'all' else monitors,
+                    detector_factory=lambda: create_face_detector(self.config)
+                )
+                if not self.multi_monitor.initialize():
+                    print("ERROR: Failed to initialize multi-monitor capture")
+                    return False
+                print(f"✓ Multi-monitor capture initialized (monitors {self.multi_monitor.monitors})")
+                if self.auto_roi:
+                    print("Auto-ROI not supported with multi-monitor capture, capturing full monitors")
+                    self.auto_roi = None
+            else:
+                if self.frame_source is None:
+                    self.frame_source = create_frame_source(self.config)
+                print(f"✓ Frame source initialized ({type(self.frame_source).__name__})")
+                if self.auto_roi and not self.frame_source.supports_roi:
+                    print("Auto-ROI not supported by this frame source, capturing full frames")
+                    self.auto_roi = None
+
+            # Initialize face detector (OpenCV unless configured otherwise);
+            # with several monitors each worker has its own
+            if not self.multi_monitor:
+                self.face_detector = create_face_detector(self.config)
+                if not self.face_detector.initialize():
+                    print("ERROR: Failed to initialize face detector")
+                    return False
+                print("✓ Face detector initialized")
 
             # Initialize emotion detector
             self.emotion_detector = EmotionDetector(self.config)
@@ -79,11 +150,22 @@ class SessionManager:
 
             # Initialize performance monitor
             perf_config = self.config.get('performance', {})
+            controller_config = perf_config.get('controller', {})
             self.performance = PerformanceMonitor(
                 initial_fps=perf_config.get('initial_fps', 10),
                 min_fps=perf_config.get('min_fps', 5),
                 max_fps=perf_config.get('max_fps', 30),
-                target_cpu_percent=perf_config.get('target_cpu_percent', 70)
+                target_cpu_percent=perf_config.get('target_cpu_percent', 70),
+                instrumentation=self.instrumentation,
+                target_utilization=controller_config.get('target_utilization', 0.8),
+                control_interval=controller_config.get('control_interval', 0.5),
+                cpu_sample_interval=controller_config.get('cpu_sample_interval', 1.0),
+                smoothing=controller_config.get('smoothing', 0.2),
+                kp=controller_config.get('kp', 0.5),
+                ki=controller_config.get('ki', 0.2),
+                deadband=controller_config.get('deadband', 0.1),
+                max_degradation_level=len(self.ladder),
+                degradation_hold=controller_config.get('degradation_hold', 3)
             )
             print("✓ Performance monitor initialized")
 
@@ -92,6 +174,18 @@ class SessionManager:
             self.logger.start_session(self.session_id, self.config)
             print("✓ Session logger initialized")
 
+            # Start metrics endpoint
+            if self.metrics_config.get('enabled', False):
+                self.metrics_server = MetricsServer(
+                    host=self.metrics_config.get('host', '127.0.0.1'),
+                    port=self.metrics_config.get('port', 9464)
+                )
+                self.metrics_server.add_collector(self.collect_metrics)
+                if self.metrics_server.start():
+                    print(f"✓ Metrics endpoint at {self.metrics_server.url}")
+                else:
+                    self.metrics_server = None
+
             self.is_initialized = True
             print(f"\n{'='*60}")
             print("All components initialized successfully!")
@@ -119,13 +213,42 @@ class SessionManager:
         self.is_running = True
         self.frame_callback = frame_callback
         self.last_process_time = time.time()
+        self.instrumentation.reset()
+        self.tracker.reset()
+        self.frame_clock.reset()
+        if self.auto_roi:
+            self.auto_roi.reset()
+            self.frame_source.set_roi(None)
 
         print(f"Session {self.session_id} started")
 
-    def process_frame(self) -> Optional[FrameAnalysis]:
+    def _frame_interval(self) -> float:
+        """Current target time between frames in seconds."""
+        return self.performance.frame_interval if self.performance else 0.1
+
+    def run(self, on_frame=None) -> None:
+        """
+        Process frames on the frame clock until stopped.
+
+        Args:
+            on_frame: Optional callback(frame_analysis) for each processed frame
+        """
+        while self.frame_clock.wait_next():
+            if not self.is_running:
+                self.frame_clock.idle(0.5)
+                continue
+            frame_analysis = self.process_frame(throttle=False)
+            if frame_analysis and on_frame:
+                on_frame(frame_analysis)
+
+    def process_frame(self, throttle: bool = True) -> Optional[FrameAnalysis]:
         """
         Process a single frame.
 
+        Args:
+            throttle: Skip the frame if the adaptive frame interval has not
+                elapsed yet (set False when a FrameClock schedules the calls)
+
         Returns:
             FrameAnalysis or None if frame should be skipped
         """
@@ -134,42 +257,95 @@ class SessionManager:
 
         # Check if we should process this frame (adaptive frame rate)
         current_time = time.time()
-        if not self.performance.should_process_frame(self.last_process_time):
+        if throttle and not self.performance.should_process_frame(self.last_process_time):
             return None
 
         process_start = time.time()
 
         try:
-            # Capture screen
-            frame = self.screen_capture.capture_frame()
-            if frame is None:
+            # Capture frames and detect faces
+            views = self._capture_and_detect()
+            if not views:
                 return None
-
-            # Detect faces
-            face_regions = self.face_detector.detect_faces(frame)
+            frame = views[0].captured.image
+            timestamp_ns = min(view.captured.timestamp_ns for view in views)
+            self.capture_pixels = sum(v.captured.image.shape[0] * v.captured.image.shape[1] for v in views)
+
+            # Results are in screen coordinates, so tracks survive capture area
+            # moves and faces from several monitors merge into one frame
+            face_views = [i for i, view in enumerate(views) for _ in view.regions]
+            frame_regions = [region for view in views for region in view.regions]
+            face_regions = [
+                region for view in views
+                for region in self._to_screen(view.regions, view.captured.origin)
+            ]
+
+            # Assign stable track IDs; forget the histories of lost faces
+            track_ids = self.tracker.update(face_regions)
+            for track_id in self.tracker.dropped:
+                self.deception_detector.clear_face(track_id)
+
+            if self.auto_roi:
+                previous_roi = self.auto_roi.region
+                self.frame_source.set_roi(self.auto_roi.update(face_regions))
+                if self.auto_roi.region != previous_roi:
+                    # Frame coordinates shift with the capture area
+                    self.face_detector.reset_motion()
+
+            if self.use_frame_batch:
+                return self._process_batch(
+                    views, face_views, frame_regions, face_regions, track_ids,
+                    timestamp_ns, process_start, current_time
+                )
 
             # Analyze each face
             face_analyses = []
-            for i, face_region in enumerate(face_regions):
+            refresh = self.quality.emotion_refresh
+            for view_index, frame_region, face_region, track_id in zip(
+                face_views, frame_regions, face_regions, track_ids
+            ):
+                # Between refreshes, reuse the track's last analysis; its
+                # deception event was counted when it was analyzed
+                if refresh > 1 and not self.tracker.needs_refresh(track_id, self.frame_count, refresh):
+                    cached = self.tracker.cached_analysis(track_id)
+                    face_analyses.append(replace(
+                        cached,
+                        region=face_region,
+                        timestamp_ns=timestamp_ns,
+                        is_deceptive=False,
+                        deception_confidence=0.0,
+                        deception_reason=None
+                    ))
+                    self.faces_detected += 1
+                    continue
+
                 # Analyze emotion
-                face_analysis = self.emotion_detector.analyze_face(
-                    frame,
-                    face_region,
-                    face_id=i
-                )
+                with self.instrumentation.stage("emotion"):
+                    face_analysis = self.emotion_detector.analyze_face(
+                        views[view_index].captured.image,
+                        frame_region,
+                        face_id=track_id
+                    )
 
                 if face_analysis:
+                    face_analysis.region = face_region
+
                     # Analyze for deception
-                    is_deceptive, deception_conf, reason = self.deception_detector.analyze_for_deception(
-                        i,
-                        face_analysis
-                    )
+                    with self.instrumentation.stage("deception"):
+                        is_deceptive, deception_conf, reason = self.deception_detector.analyze_for_deception(
+                            track_id,
+                            face_analysis
+                        )
 
                     face_analysis.is_deceptive = is_deceptive
                     face_analysis.deception_confidence = deception_conf
                     face_analysis.deception_reason = reason
 
                     face_analyses.append(face_analysis)
+                    self.tracker.store_analysis(track_id, face_analysis, self.frame_count)
+                    self.faces_detected += 1
+                    if is_deceptive:
+                        self.deception_events += 1
 
             # Calculate processing time
             process_end = time.time()
@@ -181,22 +357,22 @@ class SessionManager:
             # Create frame analysis
             frame_analysis = FrameAnalysis(
                 frame_number=self.frame_count,
-                timestamp=datetime.now(),
                 faces=face_analyses,
                 fps=self.performance.current_fps,
-                processing_time_ms=processing_time_ms
+                processing_time_ms=processing_time_ms,
+                timestamp_ns=timestamp_ns
             )
 
             # Log frame
-            self.logger.log_frame(frame_analysis)
+            with self.instrumentation.stage("logging"):
+                self.logger.log_frame(frame_analysis)
 
             # Update state
             self.frame_count += 1
             self.last_process_time = current_time
 
             # Adapt frame rate
-            if self.config.get('performance', {}).get('adaptive', True):
-                self.performance.adapt_frame_rate()
+            self._adapt()
 
             # Call frame callback if provided
             if self.frame_callback:
@@ -210,12 +386,160 @@ class SessionManager:
             traceback.print_exc()
             return None
 
+    def _capture_and_detect(self) -> List[MonitorView]:
+        """
+        Capture the next frame(s) and detect faces in frame coordinates.
+
+        Returns:
+            One view per captured frame (several with multi-monitor capture),
+            empty if nothing was captured
+        """
+        if self.multi_monitor:
+            # Capture and detection overlap across monitors, so they are timed together
+            with self.instrumentation.stage("detect"):
+                return self.multi_monitor.read()
+
+        with self.instrumentation.stage("capture"):
+            captured = self.frame_source.read()
+        if captured is None:
+            return []
+        with self.instrumentation.stage("detect"):
+            return [MonitorView(captured, self.face_detector.detect_faces(captured.image))]
+
+    @staticmethod
+    def _to_screen(regions: List[FaceRegion], origin) -> List[FaceRegion]:
+        """Translate frame-relative face regions by the frame's screen origin."""
+        if not any(origin):
+            return regions
+        return [r.scaled(1.0, origin) for r in regions]
+
+    def _process_batch(
+        self,
+        views: List[MonitorView],
+        face_views: List[int],
+        frame_regions: List[FaceRegion],
+        face_regions: List[FaceRegion],
+        track_ids: List[int],
+        timestamp_ns: int,
+        process_start: float,
+        current_time: float
+    ):
+        """Analyze, score and log a frame as a columnar FrameBatch."""
+        refresh = self.quality.emotion_refresh
+        due = [
+            i for i, track_id in enumerate(track_ids)
+            if refresh <= 1 or self.tracker.needs_refresh(track_id, self.frame_count, refresh)
+        ]
+
+        with self.instrumentation.stage("emotion"):
+            parts = []
+            for index, view in enumerate(views):
+                rows = [i for i in due if face_views[i] == index]
+                if not rows and (parts or index < len(views) - 1):
+                    continue
+                part = self.emotion_detector.analyze_faces_batch(
+                    view.captured.image,
+                    [frame_regions[i] for i in rows],
+                    self.frame_count,
+                    [track_ids[i] for i in rows]
+                )
+                part.boxes[:, :2] += view.captured.origin
+                parts.append(part)
+            batch = parts[0] if len(parts) == 1 else FrameBatch.concatenate(parts, self.frame_count)
+        with self.instrumentation.stage("deception"):
+            self.deception_detector.analyze_batch(batch)
+        self.deception_events += int(batch.is_deceptive.sum())
+
+        if refresh > 1:
+            for row, track_id in enumerate(batch.track_ids.tolist()):
+                self.tracker.store_analysis(track_id, batch.subset([row]), self.frame_count)
+
+            # Between refreshes, reuse each track's last analysis at its new position
+            reused = []
+            for i in sorted(set(range(len(track_ids))) - set(due)):
+                cached = self.tracker.cached_analysis(track_ids[i]).subset([0])
+                cached.boxes[0] = face_regions[i].to_tuple()
+                # Its deception event was counted when it was analyzed
+                cached.is_deceptive[0] = False
+                cached.deception_score[0] = 0.0
+                cached.deception_reasons[0] = None
+                reused.append(cached)
+            if reused:
+                batch = FrameBatch.concatenate([batch] + reused, self.frame_count)
+
+        self.faces_detected += len(batch)
+
+        process_end = time.time()
+        self.performance.record_frame_time(process_end - process_start)
+        batch.timestamp_ns = timestamp_ns
+        batch.fps = self.performance.current_fps
+        batch.processing_time_ms = (process_end - process_start) * 1000
+
+        with self.instrumentation.stage("logging"):
+            self.logger.log_batch(batch)
+
+        self.frame_count += 1
+        self.last_process_time = current_time
+
+        self._adapt()
+
+        if self.frame_callback:
+            self.frame_callback(batch, views[0].captured.image)
+
+        return batch
+
+    def _adapt(self) -> None:
+        """Run the adaptive controller and apply any change in degradation level."""
+        if not self.config.get('performance', {}).get('adaptive', True):
+            return
+
+        self.performance.adapt_frame_rate()
+        level = self.performance.degradation_level
+        if level != self.degradation_level:
+            self._apply_degradation(level)
+
+    def _apply_degradation(self, level: int) -> None:
+        """
+        Move to a level of the degradation ladder.
+
+        Args:
+            level: Ladder level (0 = full quality)
+        """
+        quality = self.ladder.state(level)
+
+        if self.face_detector:
+            self.face_detector.detection_scale = quality.detection_scale
+        if self.multi_monitor:
+            self.multi_monitor.set_detection_scale(quality.detection_scale)
+        self.emotion_detector.facs_enabled = quality.facs_enabled
+        if quality.dropped_models != self.quality.dropped_models:
+            self.emotion_detector.set_suspended_models(quality.dropped_models)
+
+        direction = 'up' if level > self.degradation_level else 'down'
+        self.degradation_changes[direction] += 1
+        print(f"Performance: degradation level {self.degradation_level} -> {level} "
+              f"({quality.describe()})")
+
+        self.degradation_level = level
+        self.quality = quality
+
     def stop(self) -> None:
         """Stop the detection session."""
         self.is_running = False
         print(f"\nSession {self.session_id} stopped")
         print(f"Total frames processed: {self.frame_count}")
 
+        if self.frame_clock.ticks:
+            jitter = self.frame_clock.to_dict()
+            print(f"Frame scheduling jitter (ms): p50 {jitter['p50_ms']:.2f} / "
+                  f"p99 {jitter['p99_ms']:.2f}, missed slots: {jitter['missed_slots']}")
+
+        latencies = self.instrumentation.summary()
+        if latencies:
+            print("Stage latencies (ms):  p50 /  p95 /  p99")
+            for name, stats in latencies.items():
+                print(f"  {name:<18} {stats['p50_ms']:6.1f} / {stats['p95_ms']:6.1f} / {stats['p99_ms']:6.1f}")
+
         # Save session logs
         if self.logger:
             self.logger.save_session()
@@ -224,8 +548,11 @@ class SessionManager:
         """Clean up all resources."""
         self.stop()
 
-        if self.screen_capture:
-            self.screen_capture.close()
+        if self.frame_source:
+            self.frame_source.close()
+
+        if self.multi_monitor:
+            self.multi_monitor.close()
 
         if self.face_detector:
             self.face_detector.shutdown()
@@ -236,8 +563,79 @@ class SessionManager:
         if self.deception_detector:
             self.deception_detector.clear_all()
 
+        if self.metrics_server:
+            self.metrics_server.stop()
+            self.metrics_server = None
+
         print(f"Session {self.session_id} shutdown complete")
 
+    def collect_metrics(self) -> List[Metric]:
+        """Metrics for the scrape endpoint (performance plus session counters)."""
+        namespace = self.metrics_config.get('namespace', DEFAULT_NAMESPACE)
+        metrics = [
+            gauge(f"{namespace}_session_running", "Whether monitoring is active", self.is_running),
+            counter(f"{namespace}_frames_processed_total", "Frames processed this session", self.frame_count),
+            counter(f"{namespace}_faces_analyzed_total", "Faces analyzed this session", self.faces_detected),
+            counter(f"{namespace}_deception_events_total", "Faces flagged as deceptive this session",
+                    self.deception_events),
+        ]
+        changes = Metric(
+            f"{namespace}_degradation_changes_total", "counter",
+            "Degradation level changes by direction"
+        )
+        for direction, count in self.degradation_changes.items():
+            changes.add(count, direction=direction)
+        metrics.extend([
+            changes,
+            gauge(f"{namespace}_detection_scale", "Face detection resolution scale",
+                  self.quality.detection_scale),
+            gauge(f"{namespace}_facs_enabled", "Whether FACS analysis is running",
+                  self.quality.facs_enabled),
+            gauge(f"{namespace}_emotion_refresh_frames", "Frames between emotion refreshes per track",
+                  self.quality.emotion_refresh),
+            gauge(f"{namespace}_suspended_models", "Emotion models suspended under load",
+                  len(self.emotion_detector.suspended_models) if self.emotion_detector else 0),
+        ])
+        metrics.append(add_histogram(
+            Metric(f"{namespace}_schedule_jitter_seconds", "summary",
+                   "Lateness of frame clock wakeups against their deadlines"),
+            self.frame_clock.jitter
+        ))
+        metrics.append(counter(
+            f"{namespace}_missed_frame_slots_total",
+            "Frame slots skipped because processing overran", self.frame_clock.missed_slots
+        ))
+        if self.performance:
+            metrics.extend(self.performance.collect_metrics(namespace))
+        metrics.append(gauge(f"{namespace}_capture_pixels", "Pixels in the last captured frame",
+                             self.capture_pixels))
+        if self.auto_roi:
+            metrics.append(counter(f"{namespace}_roi_full_scans_total",
+                                   "Full-area scans for new faces while capture was narrowed",
+                                   self.auto_roi.full_scans))
+
+        # Detection caches of the detector and any per-monitor detectors
+        detectors = [self.face_detector] if self.face_detector else []
+        if self.multi_monitor:
+            detectors += [worker.detector for worker in self.multi_monitor.workers]
+        caches = [detector.cache for detector in detectors if detector.cache]
+        if caches:
+            metrics.append(counter(f"{namespace}_detection_cache_hits_total",
+                                   "Frames and tiles whose faces came from the detection cache",
+                                   sum(cache.hits for cache in caches)))
+            metrics.append(counter(f"{namespace}_detection_cache_misses_total",
+                                   "Frames and tiles detected because no cached detection matched",
+                                   sum(cache.misses for cache in caches)))
+        gates = [detector.motion_gate for detector in detectors if detector.motion_gate]
+        if gates:
+            metric = Metric(f"{namespace}_motion_gate_frames_total", "counter",
+                            "Frames by motion gating outcome")
+            metric.add(sum(gate.full_refreshes for gate in gates), outcome="full")
+            metric.add(sum(gate.gated_frames for gate in gates), outcome="regions")
+            metric.add(sum(gate.idle_frames for gate in gates), outcome="idle")
+            metrics.append(metric)
+        return metrics
+
     def get_performance_metrics(self):
         """Get current performance metrics."""
         if self.performance:
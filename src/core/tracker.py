@@ -0,0 +1,331 @@
+"""Frame-to-frame face tracking for stable face IDs."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..data.models import FaceRegion, EMOTION_INDEX, EMOTION_LABELS
+from ..utils.box_ops import box_centers, regions_to_boxes
+
+
+try:
+    from scipy.optimize import linear_sum_assignment
+except ImportError:  # Optional: matching falls back to greedy assignment
+    linear_sum_assignment = None
+
+
+def assign_centers(
+    centers: np.ndarray,
+    target_centers: np.ndarray,
+    max_distance: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    One-to-one assignment of points to targets minimizing total distance.
+
+    Uses the Hungarian algorithm (scipy) when available, otherwise greedy
+    matching by ascending distance. Pairs farther apart than
+    ``max_distance`` are never returned.
+
+    Args:
+        centers: (N, 2) points
+        target_centers: (M, 2) points
+        max_distance: Largest distance for a pair
+
+    Returns:
+        (rows, cols) index arrays of the assigned pairs
+    """
+    empty = np.empty(0, dtype=np.intp)
+    if len(centers) == 0 or len(target_centers) == 0:
+        return empty, empty
+
+    centers = np.asarray(centers, dtype=np.float64)
+    target_centers = np.asarray(target_centers, dtype=np.float64)
+    distance = np.linalg.norm(centers[:, None, :] - target_centers[None, :, :], axis=2)
+    allowed = distance <= max_distance
+    if not allowed.any():
+        return empty, empty
+
+    if linear_sum_assignment is not None:
+        # Gated pairs cost more than any set of allowed pairs
+        cost = np.where(allowed, distance, max_distance * (min(distance.shape) + 1) + 1)
+        rows, cols = linear_sum_assignment(cost)
+        keep = allowed[rows, cols]
+        return rows[keep].astype(np.intp), cols[keep].astype(np.intp)
+
+    flat = np.argsort(distance, axis=None)
+    flat = flat[:np.count_nonzero(allowed)]
+    used_rows = np.zeros(distance.shape[0], dtype=bool)
+    used_cols = np.zeros(distance.shape[1], dtype=bool)
+    rows, cols = [], []
+    for row, col in zip(*np.unravel_index(flat, distance.shape)):
+        if used_rows[row] or used_cols[col]:
+            continue
+        used_rows[row] = used_cols[col] = True
+        rows.append(row)
+        cols.append(col)
+    return np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)
+
+
+def match_by_distance(
+    regions: Sequence[FaceRegion],
+    targets: Sequence[FaceRegion],
+    max_distance: float
+) -> List[Tuple[int, int]]:
+    """
+    Pair regions with targets by center distance (see assign_centers).
+
+    Args:
+        regions: Regions to match
+        targets: Regions to match against
+        max_distance: Largest center distance (pixels) for a pair
+
+    Returns:
+        (region index, target index) pairs; each index appears at most once
+    """
+    if not regions or not targets:
+        return []
+    rows, cols = assign_centers(
+        box_centers(regions_to_boxes(regions)[0]),
+        box_centers(regions_to_boxes(targets)[0]),
+        max_distance
+    )
+    return list(zip(rows.tolist(), cols.tolist()))
+
+
+@dataclass
+class Track:
+    """A face followed across frames."""
+    track_id: int
+    region: FaceRegion
+    missed: int = 0
+    analysis: Any = None  # Last emotion analysis (FaceAnalysis or 1-row FrameBatch)
+    analyzed_frame: int = -1
+
+
+class FaceTracker:
+    """
+    Assigns persistent track IDs to detected faces.
+
+    Detections are matched to existing tracks by center distance (see
+    assign_centers); unmatched detections start new tracks and tracks unmatched for
+    more than ``timeout`` frames are dropped (listed in ``dropped`` after
+    each update, so per-face state elsewhere can be released). Tracks also
+    cache the last emotion analysis so it can be reused between refreshes.
+    """
+
+    def __init__(self, max_distance: float = 100.0, timeout: int = 30):
+        """
+        Initialize tracker.
+
+        Args:
+            max_distance: Largest center distance (pixels) for a match
+            timeout: Frames a track survives without a match
+        """
+        self.max_distance = max_distance
+        self.timeout = timeout
+        self.tracks: Dict[int, Track] = {}
+        self.next_track_id = 0
+        # Track IDs dropped by the last update
+        self.dropped: List[int] = []
+
+    def update(self, regions: List[FaceRegion]) -> List[int]:
+        """
+        Match a frame's detections to tracks.
+
+        Args:
+            regions: Detected face regions
+
+        Returns:
+            Track ID for each region, in the same order
+        """
+        track_ids: List[Optional[int]] = [None] * len(regions)
+        existing = list(self.tracks.values())
+
+        track_regions = [t.region for t in existing]
+        for row, col in match_by_distance(regions, track_regions, self.max_distance):
+            track_ids[row] = existing[col].track_id
+
+        self.dropped = []
+        matched = set()
+        for i, region in enumerate(regions):
+            if track_ids[i] is None:
+                track_ids[i] = self.next_track_id
+                self.tracks[self.next_track_id] = Track(self.next_track_id, region)
+                self.next_track_id += 1
+            else:
+                track = self.tracks[track_ids[i]]
+                track.region = region
+                track.missed = 0
+            matched.add(track_ids[i])
+
+        for track_id in list(self.tracks):
+            if track_id not in matched:
+                track = self.tracks[track_id]
+                track.missed += 1
+                if track.missed > self.timeout:
+                    del self.tracks[track_id]
+                    self.dropped.append(track_id)
+
+        return track_ids
+
+    def needs_refresh(self, track_id: int, frame_number: int, interval: int) -> bool:
+        """Whether a track's emotion analysis is due (or missing)."""
+        track = self.tracks.get(track_id)
+        if track is None or track.analysis is None:
+            return True
+        return frame_number - track.analyzed_frame >= interval
+
+    def store_analysis(self, track_id: int, analysis: Any, frame_number: int) -> None:
+        """Cache the latest analysis of a track."""
+        track = self.tracks.get(track_id)
+        if track is not None:
+            track.analysis = analysis
+            track.analyzed_frame = frame_number
+
+    def cached_analysis(self, track_id: int) -> Any:
+        """Last cached analysis of a track, if any."""
+        track = self.tracks.get(track_id)
+        return track.analysis if track is not None else None
+
+    def reset(self) -> None:
+        """Forget all tracks."""
+        self.tracks.clear()
+        self.next_track_id = 0
+        self.dropped = []
+
+
+class SmoothingTracker:
+    """
+    Display-side tracker with smoothed boxes and majority-vote emotions.
+
+    Track state lives in parallel numpy arrays (one row per track), so an
+    update is one distance matrix and assignment plus vectorized
+    bookkeeping. Emotion history is a fixed-size ring buffer per track with
+    running vote counts, so the displayed (most frequent) emotion is an
+    argmax instead of a recount.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.15,
+        max_distance: float = 100.0,
+        timeout: int = 30,
+        history: int = 15
+    ):
+        """
+        Initialize tracker.
+
+        Args:
+            alpha: Exponential smoothing factor for boxes (lower = smoother)
+            max_distance: Largest center distance (pixels) for a match
+            timeout: Updates a track survives without a match
+            history: Emotions remembered per track for the vote
+        """
+        self.alpha = alpha
+        self.max_distance = max_distance
+        self.timeout = timeout
+        self.history_size = history
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all tracks."""
+        self.next_track_id = 0
+        self.ids = np.empty(0, dtype=np.int64)
+        self.boxes = np.empty((0, 4), dtype=np.float64)  # Smoothed (x, y, w, h)
+        self.ages = np.empty(0, dtype=np.int64)  # Updates since the last match
+        self.history = np.empty((0, self.history_size), dtype=np.int8)  # Emotion indices, -1 = empty
+        self.history_pos = np.empty(0, dtype=np.intp)
+        self.votes = np.empty((0, len(EMOTION_LABELS)), dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def update(
+        self,
+        regions: Sequence[FaceRegion],
+        emotions: Sequence[str]
+    ) -> Tuple[List[int], np.ndarray, List[str]]:
+        """
+        Match a frame's faces to tracks and update smoothing.
+
+        Args:
+            regions: Detected face regions
+            emotions: Emotion label of each face
+
+        Returns:
+            (track IDs, smoothed integer (x, y, w, h) boxes as an (N, 4)
+            array, majority emotions), each in the order of ``regions``
+        """
+        boxes, _ = regions_to_boxes(regions)
+        emotion_index = np.array([EMOTION_INDEX.get(e, -1) for e in emotions], dtype=np.intp)
+        rows = np.full(len(boxes), -1, dtype=np.intp)
+
+        if len(boxes) and len(self.ids):
+            faces, tracks = assign_centers(box_centers(boxes), box_centers(self.boxes), self.max_distance)
+            rows[faces] = tracks
+
+        # Smooth matched tracks, age the rest
+        matched = rows >= 0
+        self.ages += 1
+        if matched.any():
+            tracks = rows[matched]
+            self.boxes[tracks] += self.alpha * (boxes[matched] - self.boxes[tracks])
+            self.ages[tracks] = 0
+
+        new = np.flatnonzero(~matched)
+        if new.size:
+            rows[new] = self._add_tracks(boxes[new])
+
+        self._vote(rows, emotion_index)
+
+        votes = self.votes[rows]
+        majority = votes.argmax(axis=1)
+        smoothed_emotions = [
+            EMOTION_LABELS[index] if votes[i, index] > 0 else emotions[i]
+            for i, index in enumerate(majority.tolist())
+        ]
+        result = (self.ids[rows].tolist(), self.boxes[rows].astype(np.int64), smoothed_emotions)
+
+        # Drop stale tracks last: it renumbers rows
+        keep = self.ages <= self.timeout
+        if not keep.all():
+            self._compact(keep)
+        return result
+
+    def _add_tracks(self, boxes: np.ndarray) -> np.ndarray:
+        """Append tracks for unmatched faces; returns their rows."""
+        count = len(boxes)
+        first = len(self.ids)
+        self.ids = np.concatenate([self.ids, np.arange(self.next_track_id, self.next_track_id + count)])
+        self.next_track_id += count
+        self.boxes = np.concatenate([self.boxes, boxes])
+        self.ages = np.concatenate([self.ages, np.zeros(count, dtype=np.int64)])
+        self.history = np.concatenate([self.history, np.full((count, self.history_size), -1, dtype=np.int8)])
+        self.history_pos = np.concatenate([self.history_pos, np.zeros(count, dtype=np.intp)])
+        self.votes = np.concatenate([self.votes, np.zeros((count, self.votes.shape[1]), dtype=np.int32)])
+        return np.arange(first, first + count)
+
+    def _vote(self, rows: np.ndarray, emotion_index: np.ndarray) -> None:
+        """Push emotions into the ring buffers and update running counts."""
+        valid = emotion_index >= 0
+        rows, emotion_index = rows[valid], emotion_index[valid]
+        if not rows.size:
+            return
+        # Rows are unique within an update, so fancy-index updates are safe
+        pos = self.history_pos[rows]
+        evicted = self.history[rows, pos].astype(np.intp)
+        full = evicted >= 0
+        self.votes[rows[full], evicted[full]] -= 1
+        self.history[rows, pos] = emotion_index
+        self.votes[rows, emotion_index] += 1
+        self.history_pos[rows] = (pos + 1) % self.history_size
+
+    def _compact(self, keep: np.ndarray) -> None:
+        """Keep only the selected track rows in every per-track array."""
+        self.ids = self.ids[keep]
+        self.boxes = self.boxes[keep]
+        self.ages = self.ages[keep]
+        self.history = self.history[keep]
+        self.history_pos = self.history_pos[keep]
+        self.votes = self.votes[keep]
@@ -0,0 +1,365 @@
+"""Offline video processing split into segments across worker processes."""
+
+import math
+import multiprocessing
+import os
+import sys
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional
+
+from ..data.models import FrameAnalysis
+from ..data.logger import SessionLogger
+from .frame_sources import VideoFileSource
+from .tracker import FaceTracker, match_by_distance
+
+
+@dataclass
+class VideoSegment:
+    """A run of sampled frames processed by one worker."""
+    index: int
+    start: int  # First sampled frame
+    end: int  # One past the last sampled frame owned by the segment
+    overlap: int = 0  # Extra sampled frames read past ``end`` for track stitching
+
+
+@dataclass
+class SegmentResult:
+    """Analyses of one segment, with face IDs local to the segment."""
+    segment: VideoSegment
+    frames: List[FrameAnalysis] = field(default_factory=list)
+    processing_time_s: float = 0.0
+
+
+def plan_segments(
+    total_frames: int,
+    workers: int,
+    segments_per_worker: int = 4,
+    min_segment_frames: int = 300,
+    overlap_frames: int = 10
+) -> List[VideoSegment]:
+    """
+    Split sampled frames into contiguous segments.
+
+    Several segments per worker keep the pool busy when segments take
+    uneven time; every segment but the last overlaps the next one by
+    ``overlap_frames`` so tracks can be stitched across the boundary.
+
+    Args:
+        total_frames: Number of sampled frames
+        workers: Worker processes
+        segments_per_worker: Target segments per worker
+        min_segment_frames: Smallest segment worth a separate task
+        overlap_frames: Frames shared with the next segment
+
+    Returns:
+        Segments in frame order
+    """
+    if total_frames <= 0:
+        return []
+
+    count = max(1, min(workers * segments_per_worker, total_frames // max(min_segment_frames, 1)))
+    size = math.ceil(total_frames / count)
+    segments = []
+    for index, start in enumerate(range(0, total_frames, size)):
+        end = min(start + size, total_frames)
+        segments.append(VideoSegment(index, start, end, min(overlap_frames, total_frames - end)))
+    return segments
+
+
+# Per-process pipeline, built once by the pool initializer
+_worker_state: Dict[str, object] = {}
+
+
+def _init_worker(config: dict, tile_workers: Optional[int] = None) -> None:
+    """
+    Pool initializer: build this worker's detectors.
+
+    Args:
+        config: Application configuration
+        tile_workers: Tile detection threads, unless configured (the CPUs
+            left to each worker process)
+    """
+    from .face_detector import create_face_detector
+    from ..detection.emotion_detector import EmotionDetector
+
+    face_detector = create_face_detector(config)
+    tiling_config = (config.get('face_detection', {}) or {}).get('tiling', {}) or {}
+    if tile_workers and not tiling_config.get('workers'):
+        face_detector.tile_workers = tile_workers
+    if not face_detector.initialize():
+        raise RuntimeError("Failed to initialize face detector")
+    emotion_detector = EmotionDetector(config)
+    if not emotion_detector.initialize():
+        raise RuntimeError("Failed to initialize emotion detector")
+
+    _worker_state.update(
+        config=config,
+        face_detector=face_detector,
+        emotion_detector=emotion_detector
+    )
+
+
+def _init_spawned_worker(config: dict, tile_workers: Optional[int] = None) -> None:
+    """Initializer of spawned workers: diagnostics go to stderr, then _init_worker."""
+    # Model initialization prints; the parent's stdout may carry JSON output
+    sys.stdout = sys.stderr
+    _init_worker(config, tile_workers)
+
+
+def _process_segment(path: str, segment: VideoSegment, stride: int, base_ns: int) -> SegmentResult:
+    """
+    Detect, track and analyze one segment (runs in a worker process).
+
+    Args:
+        path: Video file path
+        segment: Segment to process
+        stride: File frames per sampled frame
+        base_ns: Timestamp of the first file frame; frames are stamped
+            ``base_ns + media time`` so all workers share one timeline
+
+    Returns:
+        SegmentResult with one FrameAnalysis per sampled frame read
+    """
+    from ..detection.deception import DeceptionDetector
+
+    config = _worker_state['config']
+    face_detector = _worker_state['face_detector']
+    emotion_detector = _worker_state['emotion_detector']
+    deception_detector = DeceptionDetector(config)
+    tracking_config = config.get('performance', {}).get('tracking', {}) or {}
+    tracker = FaceTracker(
+        max_distance=tracking_config.get('max_distance', 100),
+        timeout=tracking_config.get('timeout', 30)
+    )
+
+    result = SegmentResult(segment)
+    start = time.monotonic()
+    source = VideoFileSource(path, start_frame=segment.start * stride, stride=stride)
+    try:
+        for offset in range(segment.end + segment.overlap - segment.start):
+            captured = source.read()
+            if captured is None:
+                break
+            frame_start = time.monotonic()
+            timestamp_ns = base_ns + captured.media_time_ns
+
+            face_regions = face_detector.detect_faces(captured.image)
+            track_ids = tracker.update(face_regions)
+            for track_id in tracker.dropped:
+                deception_detector.clear_face(track_id)
+
+            faces = []
+            for face_region, track_id in zip(face_regions, track_ids):
+                face_analysis = emotion_detector.analyze_face(captured.image, face_region, face_id=track_id)
+                if face_analysis is None:
+                    continue
+                is_deceptive, deception_conf, reason = deception_detector.analyze_for_deception(
+                    track_id,
+                    face_analysis
+                )
+                # Landmarks are not logged; keep them out of the result pickles
+                faces.append(replace(
+                    face_analysis,
+                    is_deceptive=is_deceptive,
+                    deception_confidence=deception_conf,
+                    deception_reason=reason,
+                    landmarks=None,
+                    timestamp_ns=timestamp_ns
+                ))
+
+            result.frames.append(FrameAnalysis(
+                frame_number=segment.start + offset,
+                faces=faces,
+                processing_time_ms=(time.monotonic() - frame_start) * 1000,
+                timestamp_ns=timestamp_ns
+            ))
+    finally:
+        source.close()
+
+    result.processing_time_s = time.monotonic() - start
+    return result
+
+
+class TrackStitcher:
+    """
+    Maps segment-local face IDs onto session-wide IDs.
+
+    Segments are fed in order. For each boundary, faces of the previous
+    segment's overlap frames are paired with the next segment's first
+    frames by center distance; each next-segment track inherits the global
+    ID of the previous track it was paired with most often.
+    """
+
+    def __init__(self, max_distance: float = 100.0):
+        """
+        Initialize stitcher.
+
+        Args:
+            max_distance: Largest center distance (pixels) for a pairing
+        """
+        self.max_distance = max_distance
+        self.next_id = 0
+        self._previous: Optional[SegmentResult] = None
+        self._previous_ids: Dict[int, int] = {}
+
+    def _global_id(self, ids: Dict[int, int], local_id: int) -> int:
+        if local_id not in ids:
+            ids[local_id] = self.next_id
+            self.next_id += 1
+        return ids[local_id]
+
+    def add(self, result: SegmentResult) -> List[FrameAnalysis]:
+        """
+        Add the next segment.
+
+        Args:
+            result: Next segment's result
+
+        Returns:
+            Frames finalized by this call (the previous segment's owned
+            frames), with face IDs rewritten to global IDs
+        """
+        ids: Dict[int, int] = {}
+        if self._previous is not None:
+            owned = self._previous.segment.end - self._previous.segment.start
+            shared = zip(self._previous.frames[owned:], result.frames)
+            votes: Counter = Counter()
+            for previous_frame, frame in shared:
+                pairs = match_by_distance(
+                    [f.region for f in previous_frame.faces],
+                    [f.region for f in frame.faces],
+                    self.max_distance
+                )
+                for row, col in pairs:
+                    votes[(previous_frame.faces[row].face_id, frame.faces[col].face_id)] += 1
+
+            inherited = set()
+            for (previous_id, local_id), _ in votes.most_common():
+                if previous_id in inherited or local_id in ids:
+                    continue
+                ids[local_id] = self._global_id(self._previous_ids, previous_id)
+                inherited.add(previous_id)
+
+        finished = self._flush()
+        self._previous = result
+        self._previous_ids = ids
+        return finished
+
+    def finish(self) -> List[FrameAnalysis]:
+        """Finalize the last segment, overlap included."""
+        finished = self._flush(final=True)
+        self._previous = None
+        return finished
+
+    def _flush(self, final: bool = False) -> List[FrameAnalysis]:
+        if self._previous is None:
+            return []
+        frames = self._previous.frames
+        if not final:
+            frames = frames[:self._previous.segment.end - self._previous.segment.start]
+        for frame in frames:
+            for face in frame.faces:
+                face.face_id = self._global_id(self._previous_ids, face.face_id)
+        return frames
+
+
+def process_video(
+    path: str,
+    config: dict,
+    workers: Optional[int] = None,
+    sample_fps: Optional[float] = None
+) -> dict:
+    """
+    Analyze a video file in parallel and write one merged session log.
+
+    Args:
+        path: Video file path
+        config: Application configuration ('batch_processing' for defaults)
+        workers: Worker processes (default: configured, else CPU count)
+        sample_fps: Analyzed frames per second of video (default: every frame)
+
+    Returns:
+        Run summary (frames, faces, tracks, elapsed seconds, speed-up)
+
+    Raises:
+        IOError: If the video cannot be opened
+    """
+    batch_config = config.get('batch_processing', {}) or {}
+    workers = workers or batch_config.get('workers') or os.cpu_count() or 1
+    sample_fps = sample_fps or batch_config.get('sample_fps')
+
+    probe = VideoFileSource(path, prefetch=0)
+    fps = probe.fps or 30.0
+    file_frames = probe.frame_count
+    probe.close()
+    if file_frames <= 0:
+        raise IOError(f"Cannot determine the frame count of: {path}")
+
+    stride = max(int(round(fps / sample_fps)), 1) if sample_fps else 1
+    sampled_frames = math.ceil(file_frames / stride)
+    segments = plan_segments(
+        sampled_frames,
+        workers,
+        segments_per_worker=batch_config.get('segments_per_worker', 4),
+        min_segment_frames=batch_config.get('min_segment_frames', 300),
+        overlap_frames=batch_config.get('overlap_frames', 10)
+    )
+    workers = min(workers, len(segments))
+    print(f"Processing {sampled_frames} frames of {path} in {len(segments)} segments "
+          f"on {workers} workers", file=sys.stderr)
+
+    session_id = str(uuid.uuid4())[:8]
+    logger = SessionLogger(config)
+    logger.start_session(session_id, config)
+    tracking_config = config.get('performance', {}).get('tracking', {}) or {}
+    stitcher = TrackStitcher(max_distance=tracking_config.get('max_distance', 100))
+
+    start = time.monotonic()
+    base_ns = time.monotonic_ns()
+    faces = deception_events = 0
+
+    def log(frames: List[FrameAnalysis]) -> None:
+        nonlocal faces, deception_events
+        for frame in frames:
+            logger.log_frame(frame)
+            faces += len(frame.faces)
+            deception_events += sum(1 for face in frame.faces if face.is_deceptive)
+
+    if workers <= 1:
+        _init_worker(config)
+        for segment in segments:
+            log(stitcher.add(_process_segment(path, segment, stride, base_ns)))
+    else:
+        # Spawned workers do not inherit the parent's model and thread state
+        context = multiprocessing.get_context("spawn")
+        # Split the CPUs between the processes' tile threads
+        tile_workers = max((os.cpu_count() or 1) // workers, 1)
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_spawned_worker,
+                                 initargs=(config, tile_workers)) as pool:
+            futures = [pool.submit(_process_segment, path, s, stride, base_ns) for s in segments]
+            # Stitch in segment order as results arrive
+            for future in futures:
+                log(stitcher.add(future.result()))
+    log(stitcher.finish())
+
+    elapsed = time.monotonic() - start
+    logger.save_session()
+
+    video_seconds = file_frames / fps
+    return {
+        'session_id': session_id,
+        'frames': sampled_frames,
+        'faces': faces,
+        'tracks': stitcher.next_id,
+        'deception_events': deception_events,
+        'workers': workers,
+        'segments': len(segments),
+        'elapsed_s': elapsed,
+        'throughput_fps': sampled_frames / elapsed if elapsed > 0 else 0.0,
+        'speedup': video_seconds / elapsed if elapsed > 0 else 0.0,
+        'log_path': getattr(logger, 'current_file_path', None),
+    }
@@ -7,7 +7,8 @@ from .models import (
     FaceAnalysis,
     FrameAnalysis,
     SessionMetadata,
-    PerformanceMetrics
+    PerformanceMetrics,
+    EMOTION_LABELS
 )
 
 __all__ = [
@@ -17,5 +18,6 @@ __all__ = [
     "FaceAnalysis",
     "FrameAnalysis",
     "SessionMetadata",
-    "PerformanceMetrics"
+    "PerformanceMetrics",
+    "EMOTION_LABELS"
 ]
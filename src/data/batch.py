@@ -0,0 +1,331 @@
+"""Struct-of-arrays representation of all faces in a frame."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+import time
+
+import numpy as np
+
+from .models import (
+    ActionUnit,
+    EmotionPrediction,
+    FaceAnalysis,
+    FaceRegion,
+    FrameAnalysis,
+    EMOTION_LABELS,
+    EMOTION_INDEX,
+    monotonic_ns_to_datetime
+)
+
+NUM_EMOTIONS = len(EMOTION_LABELS)
+
+
+@dataclass
+class FrameBatch:
+    """
+    Columnar analysis of all faces in a frame.
+
+    Row i of every per-face array describes the same face. Emotion indices
+    refer to EMOTION_LABELS; model_scores is (faces, models, emotions) with
+    NaN where a model did not score a face. Legacy callers can use ``faces``,
+    which yields lazily built FaceAnalysis-compatible views.
+    """
+    frame_number: int
+    model_names: Tuple[str, ...]
+    boxes: np.ndarray                # (N, 4) int32 x, y, w, h
+    box_confidence: np.ndarray       # (N,) float32
+    track_ids: np.ndarray            # (N,) int32
+    emotion: np.ndarray              # (N,) uint8
+    confidence: np.ndarray           # (N,) float32
+    model_scores: np.ndarray         # (N, M, E) float32
+    model_confidence: np.ndarray     # (N, M) float32, NaN = no prediction
+    model_emotion: np.ndarray        # (N, M) int16, -1 = no prediction
+    deception_score: np.ndarray      # (N,) float32
+    is_deceptive: np.ndarray         # (N,) bool
+    deception_reasons: List[Optional[str]] = field(default_factory=list)
+    action_units: List[List[ActionUnit]] = field(default_factory=list)
+    landmarks: List[Optional[np.ndarray]] = field(default_factory=list)
+    fps: float = 0.0
+    processing_time_ms: float = 0.0
+    timestamp_ns: int = field(default_factory=time.monotonic_ns)
+    _views: Optional[List["FaceView"]] = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def empty(cls, frame_number: int, model_names: Sequence[str] = (), size: int = 0) -> "FrameBatch":
+        """Allocate a batch for size faces with nothing predicted yet."""
+        m = len(model_names)
+        return cls(
+            frame_number=frame_number,
+            model_names=tuple(model_names),
+            boxes=np.zeros((size, 4), dtype=np.int32),
+            box_confidence=np.ones(size, dtype=np.float32),
+            track_ids=np.arange(size, dtype=np.int32),
+            emotion=np.zeros(size, dtype=np.uint8),
+            confidence=np.zeros(size, dtype=np.float32),
+            model_scores=np.full((size, m, NUM_EMOTIONS), np.nan, dtype=np.float32),
+            model_confidence=np.full((size, m), np.nan, dtype=np.float32),
+            model_emotion=np.full((size, m), -1, dtype=np.int16),
+            deception_score=np.zeros(size, dtype=np.float32),
+            is_deceptive=np.zeros(size, dtype=bool),
+            deception_reasons=[None] * size,
+            action_units=[[] for _ in range(size)],
+            landmarks=[None] * size
+        )
+
+    @classmethod
+    def from_regions(
+        cls,
+        frame_number: int,
+        regions: Sequence[FaceRegion],
+        model_names: Sequence[str] = (),
+        track_ids: Optional[Sequence[int]] = None
+    ) -> "FrameBatch":
+        """Allocate a batch for detected face regions."""
+        batch = cls.empty(frame_number, model_names, len(regions))
+        if regions:
+            batch.boxes[:] = [r.to_tuple() for r in regions]
+            batch.box_confidence[:] = [r.confidence for r in regions]
+        if track_ids is not None:
+            batch.track_ids[:] = track_ids
+        return batch
+
+    @classmethod
+    def from_frame_analysis(cls, frame_analysis: FrameAnalysis) -> "FrameBatch":
+        """Convert an object-graph FrameAnalysis into a batch."""
+        faces = frame_analysis.faces
+        model_names: List[str] = []
+        for face in faces:
+            for pred in face.model_predictions:
+                if pred.model_name not in model_names:
+                    model_names.append(pred.model_name)
+
+        batch = cls.from_regions(
+            frame_analysis.frame_number,
+            [face.region for face in faces],
+            model_names,
+            [face.face_id for face in faces]
+        )
+        column = {name: j for j, name in enumerate(model_names)}
+
+        for i, face in enumerate(faces):
+            batch.emotion[i] = EMOTION_INDEX.get(face.emotion, EMOTION_INDEX["neutral"])
+            batch.confidence[i] = face.confidence
+            batch.deception_score[i] = face.deception_confidence
+            batch.is_deceptive[i] = face.is_deceptive
+            batch.deception_reasons[i] = face.deception_reason
+            batch.action_units[i] = list(face.action_units)
+            batch.landmarks[i] = face.landmarks
+            for pred in face.model_predictions:
+                batch.set_prediction(i, column[pred.model_name], pred)
+
+        batch.fps = frame_analysis.fps
+        batch.processing_time_ms = frame_analysis.processing_time_ms
+        batch.timestamp_ns = frame_analysis.timestamp_ns
+        return batch
+
+    def set_prediction(self, row: int, model_column: int, prediction: EmotionPrediction) -> None:
+        """Store one model's prediction for one face."""
+        self.model_scores[row, model_column] = prediction.scores
+        self.model_confidence[row, model_column] = prediction.confidence
+        self.model_emotion[row, model_column] = EMOTION_INDEX.get(prediction.emotion, -1)
+
+    def __len__(self) -> int:
+        return len(self.track_ids)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Frame time as a datetime."""
+        return monotonic_ns_to_datetime(self.timestamp_ns)
+
+    @property
+    def faces(self) -> List["FaceView"]:
+        """FaceAnalysis-compatible views, built on first access."""
+        if self._views is None:
+            self._views = [FaceView(self, i) for i in range(len(self))]
+        return self._views
+
+    def subset(self, mask: np.ndarray) -> "FrameBatch":
+        """Select faces by boolean mask or index array."""
+        rows = np.flatnonzero(mask) if np.asarray(mask).dtype == bool else np.asarray(mask)
+        return FrameBatch(
+            frame_number=self.frame_number,
+            model_names=self.model_names,
+            boxes=self.boxes[rows],
+            box_confidence=self.box_confidence[rows],
+            track_ids=self.track_ids[rows],
+            emotion=self.emotion[rows],
+            confidence=self.confidence[rows],
+            model_scores=self.model_scores[rows],
+            model_confidence=self.model_confidence[rows],
+            model_emotion=self.model_emotion[rows],
+            deception_score=self.deception_score[rows],
+            is_deceptive=self.is_deceptive[rows],
+            deception_reasons=[self.deception_reasons[i] for i in rows],
+            action_units=[self.action_units[i] for i in rows],
+            landmarks=[self.landmarks[i] for i in rows],
+            fps=self.fps,
+            processing_time_ms=self.processing_time_ms,
+            timestamp_ns=self.timestamp_ns
+        )
+
+    @classmethod
+    def concatenate(cls, batches: Sequence["FrameBatch"], frame_number: int) -> "FrameBatch":
+        """
+        Stack batches (with the same model columns) into one frame's batch.
+
+        Frame-level fields (fps, processing time, timestamp) are taken from
+        the first batch.
+        """
+        first = batches[0]
+        return cls(
+            frame_number=frame_number,
+            model_names=first.model_names,
+            boxes=np.concatenate([b.boxes for b in batches]),
+            box_confidence=np.concatenate([b.box_confidence for b in batches]),
+            track_ids=np.concatenate([b.track_ids for b in batches]),
+            emotion=np.concatenate([b.emotion for b in batches]),
+            confidence=np.concatenate([b.confidence for b in batches]),
+            model_scores=np.concatenate([b.model_scores for b in batches]),
+            model_confidence=np.concatenate([b.model_confidence for b in batches]),
+            model_emotion=np.concatenate([b.model_emotion for b in batches]),
+            deception_score=np.concatenate([b.deception_score for b in batches]),
+            is_deceptive=np.concatenate([b.is_deceptive for b in batches]),
+            deception_reasons=[r for b in batches for r in b.deception_reasons],
+            action_units=[a for b in batches for a in b.action_units],
+            landmarks=[l for b in batches for l in b.landmarks],
+            fps=first.fps,
+            processing_time_ms=first.processing_time_ms,
+            timestamp_ns=first.timestamp_ns
+        )
+
+    def to_frame_analysis(self) -> FrameAnalysis:
+        """Materialize a full object-graph FrameAnalysis."""
+        return FrameAnalysis(
+            frame_number=self.frame_number,
+            faces=[view.to_face_analysis() for view in self.faces],
+            fps=self.fps,
+            processing_time_ms=self.processing_time_ms,
+            timestamp_ns=self.timestamp_ns
+        )
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for logging."""
+        return self.to_frame_analysis().to_dict()
+
+
+class FaceView:
+    """
+    Lazy FaceAnalysis-compatible view of one row of a FrameBatch.
+
+    Attributes are read from (and deception fields written to) the batch
+    arrays; region and model predictions are built on first access.
+    """
+
+    __slots__ = ("_batch", "_row", "_region", "_predictions")
+
+    def __init__(self, batch: FrameBatch, row: int):
+        self._batch = batch
+        self._row = row
+        self._region: Optional[FaceRegion] = None
+        self._predictions: Optional[List[EmotionPrediction]] = None
+
+    @property
+    def face_id(self) -> int:
+        return int(self._batch.track_ids[self._row])
+
+    @property
+    def region(self) -> FaceRegion:
+        if self._region is None:
+            x, y, w, h = self._batch.boxes[self._row].tolist()
+            self._region = FaceRegion(x, y, w, h, float(self._batch.box_confidence[self._row]))
+        return self._region
+
+    @property
+    def emotion(self) -> str:
+        return EMOTION_LABELS[self._batch.emotion[self._row]]
+
+    @emotion.setter
+    def emotion(self, value: str) -> None:
+        self._batch.emotion[self._row] = EMOTION_INDEX[value]
+
+    @property
+    def confidence(self) -> float:
+        return float(self._batch.confidence[self._row])
+
+    @property
+    def model_predictions(self) -> List[EmotionPrediction]:
+        if self._predictions is None:
+            batch, row = self._batch, self._row
+            self._predictions = [
+                EmotionPrediction(
+                    model_name=name,
+                    emotion=EMOTION_LABELS[batch.model_emotion[row, j]],
+                    confidence=float(batch.model_confidence[row, j]),
+                    scores=batch.model_scores[row, j],
+                    timestamp_ns=batch.timestamp_ns
+                )
+                for j, name in enumerate(batch.model_names)
+                if batch.model_emotion[row, j] >= 0
+            ]
+        return self._predictions
+
+    @property
+    def action_units(self) -> List[ActionUnit]:
+        return self._batch.action_units[self._row]
+
+    @property
+    def landmarks(self) -> Optional[np.ndarray]:
+        return self._batch.landmarks[self._row]
+
+    @property
+    def is_deceptive(self) -> bool:
+        return bool(self._batch.is_deceptive[self._row])
+
+    @is_deceptive.setter
+    def is_deceptive(self, value: bool) -> None:
+        self._batch.is_deceptive[self._row] = value
+
+    @property
+    def deception_confidence(self) -> float:
+        return float(self._batch.deception_score[self._row])
+
+    @deception_confidence.setter
+    def deception_confidence(self, value: float) -> None:
+        self._batch.deception_score[self._row] = value
+
+    @property
+    def deception_reason(self) -> Optional[str]:
+        return self._batch.deception_reasons[self._row]
+
+    @deception_reason.setter
+    def deception_reason(self, value: Optional[str]) -> None:
+        self._batch.deception_reasons[self._row] = value
+
+    @property
+    def timestamp_ns(self) -> int:
+        return self._batch.timestamp_ns
+
+    @property
+    def timestamp(self) -> datetime:
+        return self._batch.timestamp
+
+    def to_face_analysis(self) -> FaceAnalysis:
+        """Materialize a standalone FaceAnalysis."""
+        return FaceAnalysis(
+            face_id=self.face_id,
+            region=self.region,
+            emotion=self.emotion,
+            confidence=self.confidence,
+            model_predictions=self.model_predictions,
+            action_units=list(self.action_units),
+            is_deceptive=self.is_deceptive,
+            deception_confidence=self.deception_confidence,
+            deception_reason=self.deception_reason,
+            landmarks=self.landmarks,
+            timestamp_ns=self.timestamp_ns
+        )
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for logging."""
+        return self.to_face_analysis().to_dict()
@@ -0,0 +1,453 @@
+"""Compact columnar session storage.
+
+Frames are buffered into fixed-size chunks of numpy columns and written as
+uncompressed ``.npy`` members of a zip container (the ``.npz`` layout), so a
+session can be opened with ``np.load`` for analytics or memory-mapped member
+by member without parsing the rest of the file.
+"""
+
+import io
+import json
+import zipfile
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+from .models import FrameAnalysis, EMOTION_LABELS, monotonic_ns_to_epoch
+
+COLUMNAR_VERSION = 1
+COLUMNAR_EXTENSION = ".npz"
+METADATA_MEMBER = "metadata.json"
+DEFAULT_CHUNK_FRAMES = 1024
+
+DEFAULT_EMOTIONS = list(EMOTION_LABELS)
+
+# Sentinel values for missing entries
+UNKNOWN_EMOTION = 255
+NO_REASON = -1
+
+# Deception flag bits
+FLAG_DECEPTIVE = 1
+
+# Column groups, in the order they are written within a chunk
+TABLES = ("frames", "faces", "aus")
+
+
+def member_name(chunk_index: int, table: str, column: str) -> str:
+    """Build the archive member name for a chunk column."""
+    return f"chunk{chunk_index:05d}/{table}/{column}.npy"
+
+
+def parse_member_name(name: str) -> Optional[tuple]:
+    """Split a member name into (chunk_index, table, column), or None."""
+    parts = name.split("/")
+    if len(parts) != 3 or not parts[0].startswith("chunk") or not parts[2].endswith(".npy"):
+        return None
+    return (int(parts[0][5:]), parts[1], parts[2][:-4])
+
+
+class ColumnarSessionWriter:
+    """Buffers frame analyses into columnar chunks."""
+
+    def __init__(
+        self,
+        emotions: Optional[List[str]] = None,
+        chunk_frames: int = DEFAULT_CHUNK_FRAMES,
+        confidence_dtype: str = "float16",
+        log_emotions: bool = True,
+        log_confidence: bool = True,
+        log_aus: bool = True,
+        log_deception_events: bool = True,
+        log_fps: bool = True
+    ):
+        """
+        Initialize columnar writer.
+
+        Args:
+            emotions: Emotion vocabulary (index order used for the emotion column)
+            chunk_frames: Number of frames per chunk
+            confidence_dtype: 'float16' or 'float32' for confidence columns
+            log_*: Which optional columns to record
+        """
+        self.emotions = list(emotions or DEFAULT_EMOTIONS)
+        self.emotion_index = {e: i for i, e in enumerate(self.emotions)}
+        self.reasons: List[str] = []
+        self.reason_index: Dict[str, int] = {}
+
+        self.chunk_frames = max(1, int(chunk_frames))
+        self.confidence_dtype = np.dtype(confidence_dtype)
+
+        self.log_emotions = log_emotions
+        self.log_confidence = log_confidence
+        self.log_aus = log_aus
+        self.log_deception_events = log_deception_events
+        self.log_fps = log_fps
+
+        # EMOTION_LABELS index -> vocabulary code, built on first batch
+        self._label_codes: Optional[np.ndarray] = None
+
+        self.chunks: List[Dict[str, Dict[str, np.ndarray]]] = []
+        self.chunk_index: List[dict] = []
+        self.frame_count = 0
+        self._reset_buffer()
+
+    def _reset_buffer(self) -> None:
+        """Start a new in-progress chunk."""
+        self._frames = {
+            "frame_number": [], "timestamp": [], "fps": [],
+            "processing_time_ms": [], "face_count": []
+        }
+        self._faces = {
+            "frame_number": [], "face_id": [], "bbox": [], "emotion": [],
+            "confidence": [], "flags": [], "deception_confidence": [],
+            "deception_reason": []
+        }
+        self._aus = {"face_row": [], "au": [], "intensity": [], "present": []}
+
+    def _emotion_code(self, emotion: str) -> int:
+        """Map an emotion label to its index, extending the vocabulary."""
+        code = self.emotion_index.get(emotion)
+        if code is None:
+            if len(self.emotions) >= UNKNOWN_EMOTION:
+                return UNKNOWN_EMOTION
+            code = len(self.emotions)
+            self.emotions.append(emotion)
+            self.emotion_index[emotion] = code
+        return code
+
+    def _reason_code(self, reason: Optional[str]) -> int:
+        """Map a deception reason string to its index."""
+        if not reason:
+            return NO_REASON
+        code = self.reason_index.get(reason)
+        if code is None:
+            code = len(self.reasons)
+            self.reasons.append(reason)
+            self.reason_index[reason] = code
+        return code
+
+    def append(self, frame_analysis: FrameAnalysis) -> None:
+        """
+        Add a frame to the current chunk.
+
+        Args:
+            frame_analysis: Frame analysis to record
+        """
+        frames = self._frames
+        faces = self._faces
+        frame_number = frame_analysis.frame_number
+
+        frames["frame_number"].append(frame_number)
+        frames["timestamp"].append(monotonic_ns_to_epoch(frame_analysis.timestamp_ns))
+        frames["fps"].append(frame_analysis.fps)
+        frames["processing_time_ms"].append(frame_analysis.processing_time_ms)
+        frames["face_count"].append(len(frame_analysis.faces))
+
+        for face in frame_analysis.faces:
+            row = len(faces["face_id"])
+            region = face.region
+            faces["frame_number"].append(frame_number)
+            faces["face_id"].append(face.face_id)
+            faces["bbox"].append((region.x, region.y, region.width, region.height))
+            faces["emotion"].append(self._emotion_code(face.emotion))
+            faces["confidence"].append(face.confidence)
+            faces["flags"].append(FLAG_DECEPTIVE if face.is_deceptive else 0)
+            faces["deception_confidence"].append(face.deception_confidence)
+            faces["deception_reason"].append(self._reason_code(face.deception_reason))
+
+            if self.log_aus:
+                for au in face.action_units:
+                    self._aus["face_row"].append(row)
+                    self._aus["au"].append(au.au_number)
+                    self._aus["intensity"].append(au.intensity)
+                    self._aus["present"].append(au.present)
+
+        self.frame_count += 1
+        if len(frames["frame_number"]) >= self.chunk_frames:
+            self.flush()
+
+    def append_batch(self, batch) -> None:
+        """
+        Add a FrameBatch to the current chunk without per-face objects.
+
+        Args:
+            batch: FrameBatch to record
+        """
+        if self._label_codes is None:
+            self._label_codes = np.array(
+                [self._emotion_code(label) for label in EMOTION_LABELS], dtype=np.int64
+            )
+
+        frames = self._frames
+        faces = self._faces
+        n = len(batch)
+
+        frames["frame_number"].append(batch.frame_number)
+        frames["timestamp"].append(monotonic_ns_to_epoch(batch.timestamp_ns))
+        frames["fps"].append(batch.fps)
+        frames["processing_time_ms"].append(batch.processing_time_ms)
+        frames["face_count"].append(n)
+
+        if n:
+            first_row = len(faces["face_id"])
+            faces["frame_number"].extend([batch.frame_number] * n)
+            faces["face_id"].extend(batch.track_ids.tolist())
+            faces["bbox"].extend(map(tuple, batch.boxes.tolist()))
+            faces["emotion"].extend(self._label_codes[batch.emotion].tolist())
+            faces["confidence"].extend(batch.confidence.tolist())
+            faces["flags"].extend(np.where(batch.is_deceptive, FLAG_DECEPTIVE, 0).tolist())
+            faces["deception_confidence"].extend(batch.deception_score.tolist())
+            faces["deception_reason"].extend(self._reason_code(r) for r in batch.deception_reasons)
+
+            if self.log_aus:
+                for offset, units in enumerate(batch.action_units):
+                    for au in units:
+                        self._aus["face_row"].append(first_row + offset)
+                        self._aus["au"].append(au.au_number)
+                        self._aus["intensity"].append(au.intensity)
+                        self._aus["present"].append(au.present)
+
+        self.frame_count += 1
+        if len(frames["frame_number"]) >= self.chunk_frames:
+            self.flush()
+
+    def flush(self) -> None:
+        """Convert the in-progress chunk to numpy columns."""
+        if not self._frames["frame_number"]:
+            return
+
+        conf = self.confidence_dtype
+        frames = {
+            "frame_number": np.asarray(self._frames["frame_number"], dtype=np.uint32),
+            "timestamp": np.asarray(self._frames["timestamp"], dtype=np.float64),
+            "face_count": np.asarray(self._frames["face_count"], dtype=np.uint16),
+        }
+        if self.log_fps:
+            frames["fps"] = np.asarray(self._frames["fps"], dtype=np.float32)
+            frames["processing_time_ms"] = np.asarray(
+                self._frames["processing_time_ms"], dtype=np.float32
+            )
+
+        f = self._faces
+        faces = {
+            "frame_number": np.asarray(f["frame_number"], dtype=np.uint32),
+            "face_id": np.asarray(f["face_id"], dtype=np.int32),
+            "bbox": np.clip(
+                np.asarray(f["bbox"], dtype=np.int64).reshape(-1, 4), -32768, 32767
+            ).astype(np.int16),
+        }
+        if self.log_emotions:
+            faces["emotion"] = np.asarray(f["emotion"], dtype=np.uint8)
+        if self.log_confidence:
+            faces["confidence"] = np.asarray(f["confidence"], dtype=conf)
+        if self.log_deception_events:
+            faces["flags"] = np.asarray(f["flags"], dtype=np.uint8)
+            faces["deception_confidence"] = np.asarray(f["deception_confidence"], dtype=conf)
+            faces["deception_reason"] = np.asarray(f["deception_reason"], dtype=np.int16)
+
+        chunk = {"frames": frames, "faces": faces}
+
+        if self.log_aus:
+            a = self._aus
+            chunk["aus"] = {
+                "face_row": np.asarray(a["face_row"], dtype=np.uint32),
+                "au": np.asarray(a["au"], dtype=np.uint8),
+                "intensity": np.asarray(a["intensity"], dtype=conf),
+                "present": np.asarray(a["present"], dtype=np.bool_),
+            }
+
+        self.chunks.append(chunk)
+        self.chunk_index.append(self._summarize_chunk(frames, faces))
+        self._reset_buffer()
+
+    def _summarize_chunk(self, frames: Dict[str, np.ndarray], faces: Dict[str, np.ndarray]) -> dict:
+        """Build the sparse index entry for a finished chunk."""
+        summary = {
+            "frames": [int(frames["frame_number"][0]), int(frames["frame_number"][-1])],
+            "time": [float(frames["timestamp"][0]), float(frames["timestamp"][-1])],
+            "face_rows": int(len(faces["face_id"])),
+            "face_ids": np.unique(faces["face_id"]).tolist(),
+        }
+        if "flags" in faces:
+            deceptive = (faces["flags"] & FLAG_DECEPTIVE) != 0
+            summary["deceptive_face_ids"] = np.unique(faces["face_id"][deceptive]).tolist()
+        return summary
+
+    def column(self, table: str, name: str) -> np.ndarray:
+        """
+        Get a column concatenated across all chunks (flushes pending frames).
+
+        Args:
+            table: Table name ('frames', 'faces' or 'aus')
+            name: Column name
+
+        Returns:
+            Concatenated column (empty if never recorded)
+        """
+        self.flush()
+        parts = [c[table][name] for c in self.chunks if name in c.get(table, {})]
+        if not parts:
+            return np.empty(0)
+        return np.concatenate(parts)
+
+    def to_bytes(self, metadata: dict) -> bytes:
+        """
+        Serialize all chunks into a columnar container.
+
+        Args:
+            metadata: Session metadata dictionary
+
+        Returns:
+            Container bytes (uncompressed zip of .npy members)
+        """
+        self.flush()
+
+        header = {
+            "format": "columnar",
+            "version": COLUMNAR_VERSION,
+            "metadata": metadata,
+            "emotions": self.emotions,
+            "reasons": self.reasons,
+            "chunk_frames": self.chunk_frames,
+            "chunk_count": len(self.chunks),
+            "chunk_index": self.chunk_index,
+        }
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as zf:
+            for index, chunk in enumerate(self.chunks):
+                for table in TABLES:
+                    for column, array in chunk.get(table, {}).items():
+                        with zf.open(member_name(index, table, column), "w") as member:
+                            np.lib.format.write_array(member, array, allow_pickle=False)
+            # Written last so readers can locate all data members first
+            zf.writestr(METADATA_MEMBER, json.dumps(header, default=str))
+
+        return buffer.getvalue()
+
+
+def load_columnar(source: Union[str, bytes]) -> dict:
+    """
+    Load a columnar session fully into memory.
+
+    Args:
+        source: Path to an unencrypted container, or the container bytes
+
+    Returns:
+        Dictionary with 'metadata', 'emotions', 'reasons' and one dict of
+        concatenated columns per table ('frames', 'faces', 'aus')
+    """
+    stream = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+
+    with zipfile.ZipFile(stream) as zf:
+        header = json.loads(zf.read(METADATA_MEMBER).decode("utf-8"))
+
+        parts: Dict[str, Dict[str, list]] = {table: {} for table in TABLES}
+        for name in sorted(zf.namelist()):
+            parsed = parse_member_name(name)
+            if parsed is None:
+                continue
+            _, table, column = parsed
+            with zf.open(name) as member:
+                array = np.lib.format.read_array(member, allow_pickle=False)
+            parts.setdefault(table, {}).setdefault(column, []).append(array)
+
+    result = {
+        "metadata": header.get("metadata", {}),
+        "emotions": header.get("emotions", DEFAULT_EMOTIONS),
+        "reasons": header.get("reasons", []),
+        "version": header.get("version", COLUMNAR_VERSION),
+    }
+    for table, columns in parts.items():
+        result[table] = {name: np.concatenate(arrays) for name, arrays in columns.items()}
+
+    # Face rows in the AU table are chunk-relative; make them global
+    _globalize_au_rows(result, parts)
+
+    return result
+
+
+def _globalize_au_rows(result: dict, parts: Dict[str, Dict[str, list]]) -> None:
+    """Offset per-chunk AU face_row indices into the concatenated face table."""
+    face_chunks = parts.get("faces", {}).get("face_id")
+    au_chunks = parts.get("aus", {}).get("face_row")
+    if not face_chunks or not au_chunks or len(face_chunks) != len(au_chunks):
+        return
+
+    offsets = np.cumsum([0] + [len(c) for c in face_chunks[:-1]])
+    result["aus"]["face_row"] = np.concatenate([
+        rows.astype(np.int64) + offset for rows, offset in zip(au_chunks, offsets)
+    ])
+
+
+def columnar_to_json_log(data: dict) -> dict:
+    """
+    Convert a loaded columnar session to the JSON session layout.
+
+    Args:
+        data: Result of load_columnar
+
+    Returns:
+        Dictionary with 'metadata' and 'frames', as written by the JSON format
+    """
+    from datetime import datetime
+
+    emotions = data["emotions"]
+    reasons = data["reasons"]
+    frames = data.get("frames", {})
+    faces = data.get("faces", {})
+    aus = data.get("aus", {})
+
+    face_frames = faces.get("frame_number", np.empty(0, dtype=np.uint32))
+    face_order = np.argsort(face_frames, kind="stable")
+    sorted_frames = face_frames[face_order]
+
+    au_by_face: Dict[int, list] = {}
+    if aus.get("face_row") is not None:
+        for row, au, intensity, present in zip(
+            aus["face_row"].tolist(), aus["au"].tolist(),
+            aus["intensity"].tolist(), aus["present"].tolist()
+        ):
+            au_by_face.setdefault(row, []).append(
+                {"au": au, "intensity": intensity, "present": present}
+            )
+
+    frame_logs = []
+    for i, frame_number in enumerate(frames.get("frame_number", np.empty(0)).tolist()):
+        entry = {
+            "frame_number": frame_number,
+            "timestamp": datetime.fromtimestamp(float(frames["timestamp"][i])).isoformat(),
+        }
+        if "fps" in frames:
+            entry["fps"] = float(frames["fps"][i])
+            entry["processing_time_ms"] = float(frames["processing_time_ms"][i])
+
+        lo = np.searchsorted(sorted_frames, frame_number, side="left")
+        hi = np.searchsorted(sorted_frames, frame_number, side="right")
+
+        entry["faces"] = []
+        for row in face_order[lo:hi].tolist():
+            x, y, w, h = faces["bbox"][row].tolist()
+            face_data = {
+                "face_id": int(faces["face_id"][row]),
+                "region": {"x": x, "y": y, "width": w, "height": h},
+            }
+            if "emotion" in faces:
+                code = int(faces["emotion"][row])
+                face_data["emotion"] = emotions[code] if code < len(emotions) else "unknown"
+            if "confidence" in faces:
+                face_data["confidence"] = float(faces["confidence"][row])
+            if row in au_by_face:
+                face_data["action_units"] = au_by_face[row]
+            if "flags" in faces:
+                reason = int(faces["deception_reason"][row])
+                face_data["deception"] = {
+                    "is_deceptive": bool(faces["flags"][row] & FLAG_DECEPTIVE),
+                    "confidence": float(faces["deception_confidence"][row]),
+                    "reason": reasons[reason] if reason >= 0 else None,
+                }
+            entry["faces"].append(face_data)
+
+        frame_logs.append(entry)
+
+    return {"metadata": data["metadata"], "frames": frame_logs}
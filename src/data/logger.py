@@ -8,7 +8,16 @@ from pathlib import Path
 import numpy as np
 
 from .models import FrameAnalysis, SessionMetadata
+from .batch import FrameBatch
 from .encryption import DataEncryption
+from .columnar import (
+    ColumnarSessionWriter,
+    COLUMNAR_EXTENSION,
+    DEFAULT_CHUNK_FRAMES,
+    load_columnar,
+    columnar_to_json_log
+)
+from .session_reader import ColumnarSessionReader
 
 
 class NumpyEncoder(json.JSONEncoder):
@@ -54,6 +63,11 @@ class SessionLogger:
         self.encrypt = logging_config.get('encrypt', True)
         self.autosave_interval = logging_config.get('autosave_interval', 60)
 
+        # Columnar format options (used when format is 'columnar')
+        columnar_config = logging_config.get('columnar', {}) or {}
+        self.chunk_frames = columnar_config.get('chunk_frames', DEFAULT_CHUNK_FRAMES)
+        self.confidence_dtype = columnar_config.get('confidence_dtype', 'float16')
+
         # What to log
         self.log_emotions = logging_config.get('log_emotions', True)
         self.log_confidence = logging_config.get('log_confidence', True)
@@ -64,6 +78,7 @@ class SessionLogger:
         # Session data
         self.session_metadata: Optional[SessionMetadata] = None
         self.frame_logs = []
+        self.columnar_writer: Optional[ColumnarSessionWriter] = None
         self.current_file_path = None
 
         # Encryption
@@ -95,10 +110,26 @@ class SessionLogger:
         )
 
         self.frame_logs = []
+        self.columnar_writer = None
+
+        if self.format == 'columnar':
+            self.columnar_writer = ColumnarSessionWriter(
+                emotions=self.config.get('emotions'),
+                chunk_frames=self.chunk_frames,
+                confidence_dtype=self.confidence_dtype,
+                log_emotions=self.log_emotions,
+                log_confidence=self.log_confidence,
+                log_aus=self.log_aus,
+                log_deception_events=self.log_deception_events,
+                log_fps=self.log_fps
+            )
+            extension = COLUMNAR_EXTENSION
+        else:
+            extension = ".json"
 
         # Create log file path
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"session_{session_id}_{timestamp}.json"
+        filename = f"session_{session_id}_{timestamp}{extension}"
 
         if self.encrypt:
             filename += ".enc"
@@ -110,15 +141,21 @@ class SessionLogger:
         Log analysis of a single frame.
 
         Args:
-            frame_analysis: Frame analysis to log
+            frame_analysis: Frame analysis (or FrameBatch) to log
         """
         if not self.enabled or self.session_metadata is None:
             return
 
-        # Filter what to log based on configuration
-        log_entry = self._filter_frame_data(frame_analysis)
+        if isinstance(frame_analysis, FrameBatch):
+            self.log_batch(frame_analysis)
+            return
 
-        self.frame_logs.append(log_entry)
+        if self.columnar_writer is not None:
+            self.columnar_writer.append(frame_analysis)
+        else:
+            # Filter what to log based on configuration
+            log_entry = self._filter_frame_data(frame_analysis)
+            self.frame_logs.append(log_entry)
 
         # Update session metadata
         self.session_metadata.total_frames += 1
@@ -129,6 +166,28 @@ class SessionLogger:
             if face.is_deceptive:
                 self.session_metadata.deception_events += 1
 
+    def log_batch(self, batch: FrameBatch) -> None:
+        """
+        Log a columnar FrameBatch.
+
+        Columnar sessions take the batch arrays directly; JSON sessions go
+        through the batch's face views.
+
+        Args:
+            batch: Frame batch to log
+        """
+        if not self.enabled or self.session_metadata is None:
+            return
+
+        if self.columnar_writer is not None:
+            self.columnar_writer.append_batch(batch)
+        else:
+            self.frame_logs.append(self._filter_frame_data(batch))
+
+        self.session_metadata.total_frames += 1
+        self.session_metadata.total_faces_detected += len(batch)
+        self.session_metadata.deception_events += int(batch.is_deceptive.sum())
+
     def _filter_frame_data(self, frame_analysis: FrameAnalysis) -> dict:
         """Filter frame data based on logging configuration."""
         data = {
@@ -186,32 +245,36 @@ class SessionLogger:
             return
 
         # Calculate average FPS
-        if self.frame_logs:
+        if self.columnar_writer is not None:
+            fps = self.columnar_writer.column('frames', 'fps')
+            if fps.size:
+                self.session_metadata.average_fps = float(fps.mean())
+        elif self.frame_logs:
             total_fps = sum(frame.get("fps", 0) for frame in self.frame_logs)
             self.session_metadata.average_fps = total_fps / len(self.frame_logs)
 
         # End session
         self.session_metadata.end_time = datetime.now()
 
-        # Create complete log
-        complete_log = {
-            "metadata": self.session_metadata.to_dict(),
-            "frames": self.frame_logs
-        }
+        if self.columnar_writer is not None:
+            data = self.columnar_writer.to_bytes(self.session_metadata.to_dict())
+        else:
+            # Create complete log
+            complete_log = {
+                "metadata": self.session_metadata.to_dict(),
+                "frames": self.frame_logs
+            }
 
-        # Convert to JSON (use NumpyEncoder to handle numpy types)
-        json_data = json.dumps(complete_log, indent=2, cls=NumpyEncoder)
+            # Convert to JSON (use NumpyEncoder to handle numpy types)
+            data = json.dumps(complete_log, indent=2, cls=NumpyEncoder).encode('utf-8')
 
         # Save to file
         if self.encrypt and self.encryption:
-            # Encrypt and save
-            encrypted = self.encryption.encrypt(json_data.encode('utf-8'))
-            with open(self.current_file_path, 'wb') as f:
-                f.write(encrypted)
-        else:
-            # Save plain text
-            with open(self.current_file_path, 'w') as f:
-                f.write(json_data)
+            # Encrypt before writing
+            data = self.encryption.encrypt(data)
+
+        with open(self.current_file_path, 'wb') as f:
+            f.write(data)
 
         print(f"Session saved to: {self.current_file_path}")
 
@@ -223,8 +286,12 @@ class SessionLogger:
             file_path: Path to session file
 
         Returns:
-            Session data dictionary
+            Session data dictionary. Columnar sessions are returned as numpy
+            columns (see load_columnar) rather than per-frame dicts.
         """
+        is_columnar = file_path.endswith(COLUMNAR_EXTENSION) or \
+            file_path.endswith(COLUMNAR_EXTENSION + '.enc')
+
         if file_path.endswith('.enc'):
             # Decrypt and load
             if not self.encryption:
@@ -234,8 +301,49 @@ class SessionLogger:
                 encrypted_data = f.read()
 
             decrypted = self.encryption.decrypt(encrypted_data)
+            if is_columnar:
+                return load_columnar(decrypted)
             return json.loads(decrypted.decode('utf-8'))
+        elif is_columnar:
+            return load_columnar(file_path)
         else:
             # Load plain text
             with open(file_path, 'r') as f:
                 return json.load(f)
+
+    def open_session(self, file_path: str) -> ColumnarSessionReader:
+        """
+        Open a columnar session for indexed, memory-mapped queries.
+
+        Encrypted sessions are decrypted into memory first; unencrypted ones
+        are memory-mapped so only the chunks a query touches are read.
+
+        Args:
+            file_path: Path to a columnar session file
+
+        Returns:
+            ColumnarSessionReader (close it, or use it as a context manager)
+        """
+        if file_path.endswith('.enc'):
+            if not self.encryption:
+                raise ValueError("Encryption not initialized")
+
+            with open(file_path, 'rb') as f:
+                return ColumnarSessionReader(self.encryption.decrypt(f.read()))
+
+        return ColumnarSessionReader(file_path)
+
+    def export_json(self, file_path: str, output_path: str) -> None:
+        """
+        Export a session (JSON or columnar) as a plain JSON session log.
+
+        Args:
+            file_path: Path to session file
+            output_path: Path for the exported JSON file
+        """
+        data = self.load_session(file_path)
+        if 'frames' in data and isinstance(data['frames'], dict):
+            data = columnar_to_json_log(data)
+
+        with open(output_path, 'w') as f:
+            json.dump(data, f, indent=2, cls=NumpyEncoder)
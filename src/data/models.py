@@ -3,10 +3,69 @@
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+import sys
+import time
+import warnings
 import numpy as np
 
+# Per-frame objects use __slots__ where the interpreter supports it (3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Fixed emotion order used for score vectors
+EMOTION_LABELS = (
+    "angry", "disgust", "fear", "happy", "sad", "surprise", "neutral", "contempt"
+)
+EMOTION_INDEX = {label: i for i, label in enumerate(EMOTION_LABELS)}
+
+# Offset from the monotonic clock to wall-clock time, fixed at import so that
+# per-object timestamps are a cheap integer read
+_MONOTONIC_TO_WALL_NS = time.time_ns() - time.monotonic_ns()
+
+
+def monotonic_ns_to_datetime(timestamp_ns: int) -> datetime:
+    """Convert a time.monotonic_ns() reading to a local datetime."""
+    return datetime.fromtimestamp((timestamp_ns + _MONOTONIC_TO_WALL_NS) / 1e9)
+
+
+def monotonic_ns_to_epoch(timestamp_ns: int) -> float:
+    """Convert a time.monotonic_ns() reading to POSIX seconds."""
+    return (timestamp_ns + _MONOTONIC_TO_WALL_NS) / 1e9
+
+
+def datetime_to_monotonic_ns(value: datetime) -> int:
+    """Convert a datetime to the monotonic-ns timeline used by data models."""
+    return int(value.timestamp() * 1e9) - _MONOTONIC_TO_WALL_NS
+
+
+def scores_to_vector(scores: Dict[str, float]) -> np.ndarray:
+    """
+    Convert an emotion score dict to a vector in EMOTION_LABELS order.
+
+    Emotions missing from the dict are NaN; labels outside EMOTION_LABELS
+    are ignored.
+    """
+    vector = np.full(len(EMOTION_LABELS), np.nan, dtype=np.float32)
+    for emotion, score in scores.items():
+        index = EMOTION_INDEX.get(emotion)
+        if index is not None:
+            vector[index] = score
+    return vector
+
+
+def vector_to_scores(vector: np.ndarray) -> Dict[str, float]:
+    """Convert a score vector back to a dict, skipping missing (NaN) entries."""
+    return {
+        EMOTION_LABELS[i]: float(vector[i])
+        for i in np.flatnonzero(~np.isnan(vector))
+    }
+
+
+def _missing_scores() -> np.ndarray:
+    """Score vector with every emotion missing."""
+    return np.full(len(EMOTION_LABELS), np.nan, dtype=np.float32)
+
+
+@dataclass(**_SLOTS)
 class FaceRegion:
     """Represents a detected face region in a frame."""
     x: int
@@ -14,6 +73,8 @@ class FaceRegion:
     width: int
     height: int
     confidence: float = 1.0
+    # (K, 2) facial keypoints in the same coordinates, if the detector gives them
+    keypoints: Optional[np.ndarray] = field(default=None, compare=False, repr=False)
 
     def to_tuple(self) -> Tuple[int, int, int, int]:
         """Convert to (x, y, w, h) tuple."""
@@ -23,18 +84,95 @@ class FaceRegion:
         """Get center point of face region."""
         return (self.x + self.width // 2, self.y + self.height // 2)
 
+    def scaled(self, factor: float, offset: Tuple[float, float] = (0, 0)) -> "FaceRegion":
+        """
+        Map the region (and keypoints) to other coordinates.
 
-@dataclass
+        Args:
+            factor: Scale applied first (e.g. 1 / detection scale)
+            offset: (dx, dy) added after scaling (e.g. a tile or screen origin)
+
+        Returns:
+            New FaceRegion
+        """
+        dx, dy = offset
+        keypoints = None
+        if self.keypoints is not None:
+            keypoints = self.keypoints * factor + np.array([dx, dy], dtype=np.float32)
+        return FaceRegion(
+            x=int(self.x * factor + dx),
+            y=int(self.y * factor + dy),
+            width=int(self.width * factor),
+            height=int(self.height * factor),
+            confidence=self.confidence,
+            keypoints=keypoints
+        )
+
+
+@dataclass(frozen=True, eq=False, init=False, **_SLOTS)
 class EmotionPrediction:
-    """Emotion prediction from a single model."""
+    """
+    Emotion prediction from a single model.
+
+    Scores are held as a float32 vector in EMOTION_LABELS order (NaN for
+    emotions the model did not score); a dict may be passed and is converted.
+    """
     model_name: str
     emotion: str
     confidence: float
-    all_scores: Dict[str, float] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.now)
+    scores: np.ndarray = field(default_factory=_missing_scores)
+    timestamp_ns: int = field(default_factory=time.monotonic_ns)
 
+    def __init__(
+        self,
+        model_name: str,
+        emotion: str,
+        confidence: float,
+        scores=None,
+        timestamp_ns: Optional[int] = None,
+        all_scores: Optional[Dict[str, float]] = None
+    ):
+        """
+        Initialize prediction.
 
-@dataclass
+        Args:
+            model_name: Model that made the prediction
+            emotion: Predicted emotion
+            confidence: Confidence of the prediction
+            scores: Score vector in EMOTION_LABELS order, or emotion -> score dict
+            timestamp_ns: time.monotonic_ns() of the prediction (default: now)
+            all_scores: Deprecated alias of scores (emotion -> score dict)
+        """
+        if all_scores is not None:
+            warnings.warn(
+                "EmotionPrediction(all_scores=...) is deprecated; pass scores=",
+                DeprecationWarning,
+                stacklevel=2
+            )
+            if scores is None:
+                scores = all_scores
+        if scores is None:
+            scores = _missing_scores()
+        elif isinstance(scores, dict):
+            scores = scores_to_vector(scores)
+        object.__setattr__(self, 'model_name', model_name)
+        object.__setattr__(self, 'emotion', emotion)
+        object.__setattr__(self, 'confidence', confidence)
+        object.__setattr__(self, 'scores', scores)
+        object.__setattr__(self, 'timestamp_ns', time.monotonic_ns() if timestamp_ns is None else timestamp_ns)
+
+    @property
+    def all_scores(self) -> Dict[str, float]:
+        """Scores as an emotion -> score dict."""
+        return vector_to_scores(self.scores)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Prediction time as a datetime."""
+        return monotonic_ns_to_datetime(self.timestamp_ns)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ActionUnit:
     """FACS Action Unit detection."""
     au_number: int
@@ -42,7 +180,7 @@ class ActionUnit:
     present: bool  # Whether AU is active
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FaceAnalysis:
     """Complete analysis of a single face."""
     face_id: int
@@ -55,7 +193,12 @@ class FaceAnalysis:
     deception_confidence: float = 0.0
     deception_reason: Optional[str] = None
     landmarks: Optional[np.ndarray] = None
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp_ns: int = field(default_factory=time.monotonic_ns)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Analysis time as a datetime."""
+        return monotonic_ns_to_datetime(self.timestamp_ns)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for logging."""
@@ -96,14 +239,24 @@ class FaceAnalysis:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FrameAnalysis:
     """Analysis of all faces in a single frame."""
     frame_number: int
-    timestamp: datetime
     faces: List[FaceAnalysis] = field(default_factory=list)
     fps: float = 0.0
     processing_time_ms: float = 0.0
+    timestamp_ns: int = field(default_factory=time.monotonic_ns)
+
+    def __post_init__(self):
+        # Catches FrameAnalysis(n, timestamp, faces) from before timestamp_ns
+        if not isinstance(self.faces, list):
+            raise TypeError(f"faces must be a list of FaceAnalysis, got {type(self.faces).__name__}")
+
+    @property
+    def timestamp(self) -> datetime:
+        """Frame time as a datetime."""
+        return monotonic_ns_to_datetime(self.timestamp_ns)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for logging."""
@@ -151,3 +304,4 @@ class PerformanceMetrics:
     current_fps: float
     target_fps: float
     dropped_frames: int = 0
+    stage_latencies: Dict[str, dict] = field(default_factory=dict)
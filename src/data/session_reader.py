@@ -0,0 +1,325 @@
+"""Memory-mapped random access to columnar session files."""
+
+import json
+import mmap
+import struct
+import zipfile
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .columnar import (
+    METADATA_MEMBER,
+    DEFAULT_EMOTIONS,
+    FLAG_DECEPTIVE,
+    parse_member_name
+)
+
+# Zip local file header: fixed part is 30 bytes, name/extra lengths at 26/28
+_LOCAL_HEADER_SIZE = 30
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+
+class ColumnarSessionReader:
+    """
+    Reads columnar sessions without loading them.
+
+    The container's central directory is parsed once to find the byte offset
+    of every column, and a sparse per-chunk index (frame range, time range,
+    face IDs with deception events) is read from the header. Queries only
+    touch the pages of the chunks they select.
+    """
+
+    def __init__(self, source: Union[str, bytes]):
+        """
+        Open a columnar session.
+
+        Args:
+            source: Path to an unencrypted, uncompressed columnar file, or the
+                decrypted container bytes
+        """
+        self._file = None
+        self._mmap = None
+
+        if isinstance(source, (bytes, bytearray)):
+            self._buffer = memoryview(source)
+            zf = zipfile.ZipFile(_BufferReader(self._buffer))
+        else:
+            self._file = open(source, 'rb')
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._buffer = self._mmap
+            zf = zipfile.ZipFile(self._file)
+
+        with zf:
+            header = json.loads(zf.read(METADATA_MEMBER).decode('utf-8'))
+
+            # (chunk, table, column) -> (offset, shape, dtype, fortran_order)
+            self._members: Dict[Tuple[int, str, str], tuple] = {}
+            for info in zf.infolist():
+                parsed = parse_member_name(info.filename)
+                if parsed is None:
+                    continue
+                if info.compress_type != zipfile.ZIP_STORED:
+                    raise ValueError(
+                        f"Column {info.filename} is compressed; memory mapping "
+                        "requires an uncompressed container"
+                    )
+                self._members[parsed] = self._locate_array(info)
+
+        self.metadata: dict = header.get('metadata', {})
+        self.emotions: List[str] = header.get('emotions', DEFAULT_EMOTIONS)
+        self.reasons: List[str] = header.get('reasons', [])
+        self.chunk_count: int = header.get('chunk_count', 0)
+        self.chunk_index: List[dict] = header.get('chunk_index') or self._build_index()
+
+        # Sparse lookup arrays over chunks
+        self._first_frames = np.array([c['frames'][0] for c in self.chunk_index], dtype=np.int64)
+        self._last_frames = np.array([c['frames'][1] for c in self.chunk_index], dtype=np.int64)
+        self._first_times = np.array([c['time'][0] for c in self.chunk_index], dtype=np.float64)
+        self._last_times = np.array([c['time'][1] for c in self.chunk_index], dtype=np.float64)
+
+    def _locate_array(self, info: zipfile.ZipInfo) -> tuple:
+        """Find where a stored .npy member's array data starts."""
+        start = info.header_offset
+        local = bytes(self._buffer[start:start + _LOCAL_HEADER_SIZE])
+        if local[:4] != _LOCAL_HEADER_SIGNATURE:
+            raise ValueError(f"Corrupt local header for {info.filename}")
+        name_len, extra_len = struct.unpack('<HH', local[26:30])
+        data_offset = start + _LOCAL_HEADER_SIZE + name_len + extra_len
+
+        reader = _BufferReader(self._buffer, data_offset)
+        version = np.lib.format.read_magic(reader)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(reader)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(reader)
+
+        return (reader.tell(), shape, dtype, fortran_order)
+
+    def _build_index(self) -> List[dict]:
+        """Build the sparse chunk index for files written without one."""
+        index = []
+        for chunk in range(self.chunk_count):
+            frame_numbers = self.column(chunk, 'frames', 'frame_number')
+            timestamps = self.column(chunk, 'frames', 'timestamp')
+            face_ids = self.column(chunk, 'faces', 'face_id')
+            entry = {
+                'frames': [int(frame_numbers[0]), int(frame_numbers[-1])],
+                'time': [float(timestamps[0]), float(timestamps[-1])],
+                'face_rows': int(len(face_ids)),
+                'face_ids': np.unique(face_ids).tolist(),
+            }
+            flags = self.column(chunk, 'faces', 'flags')
+            if flags is not None:
+                entry['deceptive_face_ids'] = np.unique(
+                    face_ids[(flags & FLAG_DECEPTIVE) != 0]
+                ).tolist()
+            index.append(entry)
+        return index
+
+    def column(self, chunk: int, table: str, name: str) -> Optional[np.ndarray]:
+        """
+        Get a zero-copy view of one column of one chunk.
+
+        Args:
+            chunk: Chunk index
+            table: 'frames', 'faces' or 'aus'
+            name: Column name
+
+        Returns:
+            Read-only array view, or None if the column was not recorded
+        """
+        member = self._members.get((chunk, table, name))
+        if member is None:
+            return None
+        offset, shape, dtype, fortran_order = member
+        return np.ndarray(
+            shape,
+            dtype=dtype,
+            buffer=self._buffer,
+            offset=offset,
+            order='F' if fortran_order else 'C'
+        )
+
+    def columns(self, table: str) -> List[str]:
+        """List the columns recorded for a table."""
+        return sorted({name for (_, t, name) in self._members if t == table})
+
+    def chunks_for_frames(self, first_frame: int, last_frame: int) -> List[int]:
+        """Chunks that may contain frames in [first_frame, last_frame]."""
+        lo = np.searchsorted(self._last_frames, first_frame, side='left')
+        hi = np.searchsorted(self._first_frames, last_frame, side='right')
+        return list(range(lo, hi))
+
+    def chunks_for_time(self, t0: float, t1: float) -> List[int]:
+        """Chunks that may contain frames with timestamps in [t0, t1]."""
+        lo = np.searchsorted(self._last_times, t0, side='left')
+        hi = np.searchsorted(self._first_times, t1, side='right')
+        return list(range(lo, hi))
+
+    def frames_between(self, t0: float, t1: float) -> dict:
+        """
+        Get frames (and their faces) with timestamps in [t0, t1].
+
+        Args:
+            t0: Start time (POSIX seconds)
+            t1: End time (POSIX seconds)
+
+        Returns:
+            Dictionary with 'frames' and 'faces' column dicts
+        """
+        def select(chunk):
+            timestamps = self.column(chunk, 'frames', 'timestamp')
+            return (timestamps >= t0) & (timestamps <= t1)
+
+        return self._select_frames(self.chunks_for_time(t0, t1), select)
+
+    def frame_range(self, first_frame: int, last_frame: int) -> dict:
+        """
+        Get frames (and their faces) with frame numbers in [first_frame, last_frame].
+
+        Args:
+            first_frame: First frame number
+            last_frame: Last frame number
+
+        Returns:
+            Dictionary with 'frames' and 'faces' column dicts
+        """
+        def select(chunk):
+            frame_numbers = self.column(chunk, 'frames', 'frame_number')
+            return (frame_numbers >= first_frame) & (frame_numbers <= last_frame)
+
+        return self._select_frames(self.chunks_for_frames(first_frame, last_frame), select)
+
+    def _select_frames(self, chunks: List[int], select) -> dict:
+        """Gather selected frames and the faces belonging to them."""
+        frame_parts: Dict[str, list] = {}
+        face_parts: Dict[str, list] = {}
+        frame_columns = self.columns('frames')
+        face_columns = self.columns('faces')
+
+        for chunk in chunks:
+            mask = select(chunk)
+            if not mask.any():
+                continue
+            for name in frame_columns:
+                frame_parts.setdefault(name, []).append(self.column(chunk, 'frames', name)[mask])
+
+            selected = self.column(chunk, 'frames', 'frame_number')[mask]
+            face_mask = np.isin(self.column(chunk, 'faces', 'frame_number'), selected)
+            for name in face_columns:
+                face_parts.setdefault(name, []).append(self.column(chunk, 'faces', name)[face_mask])
+
+        return {
+            'frames': _concat(frame_parts, frame_columns, self, 'frames'),
+            'faces': _concat(face_parts, face_columns, self, 'faces'),
+        }
+
+    def deception_events(self, face_id: int) -> dict:
+        """
+        Get all deception events recorded for a face.
+
+        Only chunks whose index lists the face as deceptive are read.
+
+        Args:
+            face_id: Face ID to look up
+
+        Returns:
+            Face column dict for the matching rows, plus a 'timestamp' column
+        """
+        face_columns = self.columns('faces')
+        parts: Dict[str, list] = {}
+        timestamps = []
+
+        for chunk, entry in enumerate(self.chunk_index):
+            if face_id not in entry.get('deceptive_face_ids', []):
+                continue
+
+            flags = self.column(chunk, 'faces', 'flags')
+            ids = self.column(chunk, 'faces', 'face_id')
+            mask = (ids == face_id) & ((flags & FLAG_DECEPTIVE) != 0)
+            if not mask.any():
+                continue
+
+            for name in face_columns:
+                parts.setdefault(name, []).append(self.column(chunk, 'faces', name)[mask])
+
+            # Join to frame timestamps (frame numbers are sorted within a chunk)
+            frame_numbers = self.column(chunk, 'frames', 'frame_number')
+            rows = np.searchsorted(frame_numbers, self.column(chunk, 'faces', 'frame_number')[mask])
+            timestamps.append(self.column(chunk, 'frames', 'timestamp')[rows])
+
+        result = _concat(parts, face_columns, self, 'faces')
+        result['timestamp'] = np.concatenate(timestamps) if timestamps else np.empty(0)
+        return result
+
+    def emotion_labels(self, codes: np.ndarray) -> List[str]:
+        """Decode an emotion code column into labels."""
+        return [self.emotions[c] if c < len(self.emotions) else 'unknown' for c in codes.tolist()]
+
+    def close(self) -> None:
+        """Release the memory map and file handle."""
+        self._buffer = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Views returned to callers still reference the map; it is
+                # released when they are garbage collected
+                pass
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
+def _concat(parts: Dict[str, list], names: List[str], reader: ColumnarSessionReader, table: str) -> dict:
+    """Concatenate gathered column parts, keeping empty typed columns."""
+    result = {}
+    for name in names:
+        if name in parts:
+            result[name] = np.concatenate(parts[name])
+        else:
+            template = reader.column(0, table, name)
+            if template is None:
+                result[name] = np.empty(0)
+            else:
+                result[name] = np.empty((0,) + template.shape[1:], dtype=template.dtype)
+    return result
+
+
+class _BufferReader:
+    """Minimal seekable file interface over a buffer (mmap or memoryview)."""
+
+    def __init__(self, buffer, position: int = 0):
+        self._buffer = buffer
+        self._position = position
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._buffer) if size is None or size < 0 else self._position + size
+        data = bytes(self._buffer[self._position:end])
+        self._position += len(data)
+        return data
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if whence == 0:
+            self._position = offset
+        elif whence == 1:
+            self._position += offset
+        else:
+            self._position = len(self._buffer) + offset
+        return self._position
+
+    def tell(self) -> int:
+        return self._position
+
+    def seekable(self) -> bool:
+        return True
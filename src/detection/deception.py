@@ -4,6 +4,7 @@ from typing import List, Optional, Tuple
 import numpy as np
 
 from ..data.models import FaceAnalysis, ActionUnit
+from ..data.batch import FrameBatch
 from .microexpression import MicroexpressionDetector, EmotionChange
 
 
@@ -55,6 +56,65 @@ class DeceptionDetector:
         if not self.enabled:
             return (False, 0.0, None)
 
+        return self._score_face(face_id, analysis)
+
+    def analyze_batch(self, batch: FrameBatch) -> None:
+        """
+        Analyze every face of a FrameBatch, writing results into the batch.
+
+        Model disagreement is computed for all faces at once from the batch's
+        per-model emotion matrix; the stateful checks run per face.
+
+        Args:
+            batch: Frame batch to score in place
+        """
+        if not self.enabled or len(batch) == 0:
+            return
+
+        disagreement_scores = self.model_disagreement_batch(batch.model_emotion)
+
+        for row, face in enumerate(batch.faces):
+            is_deceptive, score, reason = self._score_face(
+                face.face_id, face, float(disagreement_scores[row])
+            )
+            batch.is_deceptive[row] = is_deceptive
+            batch.deception_score[row] = score
+            batch.deception_reasons[row] = reason
+
+    def model_disagreement_batch(self, model_emotion: np.ndarray) -> np.ndarray:
+        """
+        Vectorized model-disagreement score for a batch of faces.
+
+        Args:
+            model_emotion: (faces, models) emotion indices, -1 = no prediction
+
+        Returns:
+            (faces,) scores, matching _check_model_disagreement
+        """
+        if model_emotion.size == 0:
+            return np.zeros(model_emotion.shape[0], dtype=np.float32)
+
+        predicted = model_emotion >= 0
+        n_predictions = predicted.sum(axis=1)
+
+        # Count distinct emotions per row: sort (missing first) and count changes
+        ordered = np.sort(np.where(predicted, model_emotion, -1), axis=1)
+        starts = np.ones_like(ordered, dtype=bool)
+        starts[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+        unique = (starts & (ordered >= 0)).sum(axis=1)
+
+        disagreement = unique / np.maximum(n_predictions, 1)
+        return np.where(
+            (n_predictions >= 2) & (disagreement > 0.5), disagreement * 0.6, 0.0
+        ).astype(np.float32)
+
+    def _score_face(
+        self,
+        face_id: int,
+        analysis: FaceAnalysis,
+        disagreement_score: Optional[float] = None
+    ) -> Tuple[bool, float, Optional[str]]:
+        """Run all deception checks for one face."""
         deception_scores = []
         reasons = []
 
@@ -78,7 +138,12 @@ class DeceptionDetector:
             reasons.append(pattern_reason)
 
         # 4. Check model agreement (low agreement can indicate suppressed emotion)
-        if len(analysis.model_predictions) > 1:
+        if disagreement_score is not None:
+            if disagreement_score > 0:
+                n_unique = len({p.emotion for p in analysis.model_predictions})
+                deception_scores.append(disagreement_score)
+                reasons.append(f"Model disagreement ({n_unique} different emotions)")
+        elif len(analysis.model_predictions) > 1:
             agreement_score, agreement_reason = self._check_model_disagreement(analysis)
             if agreement_score > 0:
                 deception_scores.append(agreement_score)
@@ -4,6 +4,8 @@ from typing import List, Optional, Dict
 import numpy as np
 
 from ..data.models import FaceRegion, EmotionPrediction, FaceAnalysis
+from ..data.batch import FrameBatch
+from ..utils.instrumentation import get_instrumentation
 from ..models import (
     BaseEmotionModel,
     DeepFaceModel,
@@ -14,6 +16,10 @@ from ..models import (
     FACSAnalyzer
 )
 
+# Model name resolved to the active model with the highest measured latency
+# (e.g. the degradation ladder's drop_model: slowest)
+SLOWEST_MODEL = "slowest"
+
 
 class EmotionDetector:
     """Coordinates multiple emotion detection models and combines results."""
@@ -32,6 +38,10 @@ class EmotionDetector:
             min_models_required=config.get('ensemble', {}).get('min_models_required', 2)
         )
         self.facs_analyzer = FACSAnalyzer() if config.get('facs', {}).get('enabled', True) else None
+        self.instrumentation = get_instrumentation()
+        # Models and FACS skipped under load, see set_suspended_models
+        self.suspended_models = set()
+        self.facs_enabled = True
         self.is_initialized = False
 
     def initialize(self) -> bool:
@@ -121,8 +131,10 @@ class EmotionDetector:
         predictions: List[EmotionPrediction] = []
 
         for model in self.models:
+            if model.model_name in self.suspended_models:
+                continue
             try:
-                prediction = model.predict_emotion(frame, face_region)
+                prediction = model.predict(frame, face_region)
                 if prediction:
                     predictions.append(prediction)
             except Exception as e:
@@ -135,29 +147,23 @@ class EmotionDetector:
         model_weights = self._get_model_weights()
 
         # Combine predictions using ensemble
-        ensemble_prediction = self.ensemble.vote(predictions, model_weights)
+        with self.instrumentation.stage("ensemble"):
+            ensemble_prediction = self.ensemble.vote(predictions, model_weights)
 
         if not ensemble_prediction:
             return None
 
         # Detect Action Units if FACS is enabled
         action_units = []
-        if self.facs_analyzer and self.facs_analyzer.is_initialized:
+        if self.facs_enabled and self.facs_analyzer and self.facs_analyzer.is_initialized:
             try:
-                action_units = self.facs_analyzer.detect_action_units(frame, face_region)
+                with self.instrumentation.stage("facs"):
+                    action_units = self.facs_analyzer.detect_action_units(frame, face_region)
             except Exception as e:
                 print(f"FACS analysis error: {e}")
 
-        # Get landmarks from MediaPipe model if available
-        landmarks = None
-        for model in self.models:
-            if model.model_name == "MediaPipe" and hasattr(model, 'get_landmarks'):
-                landmarks_data = model.get_landmarks()
-                if landmarks_data and len(landmarks_data) >= 468:
-                    # Convert to numpy array for overlay (keep x, y only)
-                    import numpy as np
-                    landmarks = np.array([(lm[0], lm[1]) for lm in landmarks_data])
-                break
+        # Get landmarks from MediaPipe model if it analyzed this face
+        landmarks = self._get_landmarks({p.model_name for p in predictions})
 
         # Create face analysis
         analysis = FaceAnalysis(
@@ -172,6 +178,141 @@ class EmotionDetector:
 
         return analysis
 
+    def analyze_faces_batch(
+        self,
+        frame: np.ndarray,
+        face_regions: List[FaceRegion],
+        frame_number: int = 0,
+        track_ids: Optional[List[int]] = None
+    ) -> Optional[FrameBatch]:
+        """
+        Analyze all faces of a frame into a columnar FrameBatch.
+
+        Per-model predictions are written straight into the batch score
+        matrix and combined for every face in one ensemble call.
+
+        Args:
+            frame: Full frame image
+            face_regions: Detected face regions
+            frame_number: Frame number for the batch
+            track_ids: Optional IDs per face (defaults to detection order)
+
+        Returns:
+            FrameBatch containing the faces that produced an ensemble result,
+            or None if not initialized
+        """
+        if not self.is_initialized:
+            return None
+
+        batch = FrameBatch.from_regions(
+            frame_number,
+            face_regions,
+            [model.model_name for model in self.models],
+            track_ids
+        )
+
+        for i, face_region in enumerate(face_regions):
+            predicted = set()
+            for j, model in enumerate(self.models):
+                if model.model_name in self.suspended_models:
+                    continue
+                try:
+                    prediction = model.predict(frame, face_region)
+                    if prediction:
+                        batch.set_prediction(i, j, prediction)
+                        predicted.add(model.model_name)
+                except Exception as e:
+                    print(f"Error in {model.model_name}: {e}")
+
+            batch.landmarks[i] = self._get_landmarks(predicted)
+
+            if self.facs_enabled and self.facs_analyzer and self.facs_analyzer.is_initialized:
+                try:
+                    with self.instrumentation.stage("facs"):
+                        batch.action_units[i] = self.facs_analyzer.detect_action_units(frame, face_region)
+                except Exception as e:
+                    print(f"FACS analysis error: {e}")
+
+        weights_by_name = self._get_model_weights()
+        weights = np.array(
+            [weights_by_name.get(name, 1.0) for name in batch.model_names], dtype=np.float32
+        )
+        with self.instrumentation.stage("ensemble"):
+            emotion, confidence, _, valid = self.ensemble.vote_batch(
+                batch.model_scores, batch.model_confidence, weights
+            )
+        batch.emotion[:] = emotion
+        batch.confidence[:] = confidence
+
+        return batch if valid.all() else batch.subset(valid)
+
+    def set_suspended_models(self, names) -> List[str]:
+        """
+        Choose which models to skip (used to shed load).
+
+        The name SLOWEST_MODEL ('slowest') selects the active model with the highest recorded
+        median latency. At least min_models_required models always stay
+        active; names beyond that budget are ignored.
+
+        Args:
+            names: Model names (or 'slowest') to suspend; empty resumes all
+
+        Returns:
+            Names of the models actually suspended
+        """
+        suspended: List[str] = []
+        budget = len(self.models) - max(self.ensemble.min_models_required, 1)
+
+        for name in names:
+            if len(suspended) >= budget:
+                break
+            active = [m for m in self.models if m.model_name not in suspended]
+            if name == SLOWEST_MODEL:
+                candidate = self._slowest_model(active)
+            else:
+                candidate = next((m for m in active if m.model_name == name), None)
+            if candidate is not None:
+                suspended.append(candidate.model_name)
+
+        self.suspended_models = set(suspended)
+        return suspended
+
+    def _slowest_model(self, models: List[BaseEmotionModel]) -> Optional[BaseEmotionModel]:
+        """Model with the highest median latency (last initialized on ties)."""
+        if not models:
+            return None
+
+        def latency(item):
+            position, model = item
+            histogram = self.instrumentation.histograms.get(model.stage_name)
+            median = histogram.percentile(50) if histogram and histogram.total_count else 0
+            return (median, position)
+
+        return max(enumerate(models), key=latency)[1]
+
+    def _get_landmarks(self, predicted) -> Optional[np.ndarray]:
+        """
+        Get the landmarks MediaPipe found for the current face.
+
+        Args:
+            predicted: Names of the models that produced a prediction for
+                the face (MediaPipe keeps the landmarks of its last success,
+                which belong to another face if it was suspended or failed)
+
+        Returns:
+            (468, 2) landmark array, or None
+        """
+        if "MediaPipe" not in predicted:
+            return None
+        for model in self.models:
+            if model.model_name == "MediaPipe" and hasattr(model, 'get_landmarks'):
+                landmarks_data = model.get_landmarks()
+                if landmarks_data and len(landmarks_data) >= 468:
+                    # Convert to numpy array for overlay (keep x, y only)
+                    return np.array([(lm[0], lm[1]) for lm in landmarks_data])
+                break
+        return None
+
     def _get_model_weights(self) -> Dict[str, float]:
         """Get model weights from configuration."""
         models_config = self.config.get('models', {})
@@ -1,10 +1,9 @@
 """Microexpression detection and analysis."""
 
-from typing import List, Optional, Deque
+from typing import List
 from collections import deque
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-import numpy as np
+from datetime import datetime
 
 from ..data.models import FaceAnalysis
 
@@ -30,7 +29,7 @@ class MicroexpressionDetector:
             window_ms: Time window for detecting microexpressions (milliseconds)
         """
         self.window_ms = window_ms
-        self.window_duration = timedelta(milliseconds=window_ms)
+        self.window_ns = int(window_ms * 1_000_000)
 
         # Track emotion history for each face
         self.face_histories: dict = {}
@@ -55,8 +54,8 @@ class MicroexpressionDetector:
         history.append(analysis)
 
         # Remove old entries outside the window
-        cutoff_time = analysis.timestamp - self.window_duration
-        while history and history[0].timestamp < cutoff_time:
+        cutoff_ns = analysis.timestamp_ns - self.window_ns
+        while history and history[0].timestamp_ns < cutoff_ns:
             history.popleft()
 
         # Detect microexpressions
@@ -86,7 +85,7 @@ class MicroexpressionDetector:
 
             # Check if emotion changed
             if prev.emotion != curr.emotion:
-                duration_ms = (curr.timestamp - prev.timestamp).total_seconds() * 1000
+                duration_ms = (curr.timestamp_ns - prev.timestamp_ns) / 1_000_000
 
                 # Microexpression is typically very brief (< 500ms)
                 # but we track all changes within our window
@@ -0,0 +1,210 @@
+"""Headless pipeline runner (no Qt) for capture servers and batch runs."""
+
+import argparse
+import contextlib
+import json
+import signal
+import sys
+import time
+from typing import List, Optional
+
+from .config import load_config
+from .core.session_manager import SessionManager
+
+
+def _build_source(args):
+    """Create the frame source selected on the command line (None = screen)."""
+    if args.video:
+        from .core.frame_sources import VideoFileSource
+        return VideoFileSource(args.video, loop=args.loop)
+    if args.images:
+        from .core.frame_sources import ImageDirectorySource
+        return ImageDirectorySource(args.images, loop=args.loop)
+    if args.synthetic:
+        from .core.frame_sources import SyntheticSource
+        return SyntheticSource(num_faces=args.synthetic)
+    return None
+
+
+def _apply_overrides(config: dict, args) -> dict:
+    """Apply command-line overrides to the loaded configuration."""
+    logging_config = config.setdefault('logging', {})
+    if args.no_log:
+        logging_config['enabled'] = False
+    if args.log_dir:
+        logging_config['directory'] = args.log_dir
+    if args.log_format:
+        logging_config['format'] = args.log_format
+
+    if args.metrics_port is not None:
+        config['metrics'] = dict(config.get('metrics') or {}, enabled=True, port=args.metrics_port)
+
+    # Unthrottled runs process frames back to back; the FPS controller (and
+    # its degradation ladder) only applies to real-time scheduling
+    if not args.realtime:
+        config.setdefault('performance', {})['adaptive'] = False
+    return config
+
+
+def run(
+    session: SessionManager,
+    source=None,
+    realtime: bool = False,
+    duration: Optional[float] = None,
+    max_frames: Optional[int] = None
+) -> dict:
+    """
+    Process frames until the source ends, a limit is hit or the clock stops.
+
+    Args:
+        session: Initialized session manager
+        source: FrameSource to stop on when exhausted (None = configured source)
+        realtime: Schedule frames at the adaptive FPS instead of back to back
+        duration: Stop after this many seconds
+        max_frames: Stop after this many processed frames
+
+    Returns:
+        Run summary (frames, faces, elapsed seconds, throughput)
+    """
+    session.start()
+    start = time.monotonic()
+    first_frame = session.frame_count
+
+    def done() -> bool:
+        if source is not None and getattr(source, 'exhausted', False):
+            return True
+        if duration is not None and time.monotonic() - start >= duration:
+            return True
+        if max_frames is not None and session.frame_count - first_frame >= max_frames:
+            return True
+        return False
+
+    clock = session.frame_clock
+    while not done():
+        if realtime:
+            if not clock.wait_next():
+                break
+        elif clock.stopped:
+            break
+        session.process_frame(throttle=False)
+
+    elapsed = time.monotonic() - start
+    frames = session.frame_count - first_frame
+    return {
+        'session_id': session.session_id,
+        'frames': frames,
+        'faces': session.faces_detected,
+        'deception_events': session.deception_events,
+        'elapsed_s': elapsed,
+        'throughput_fps': frames / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def _run_video_batch(args, config: dict) -> Optional[dict]:
+    """Process a video file with parallel segment workers (None on error)."""
+    from .core.video_batch import process_video
+
+    try:
+        return process_video(args.video, config, workers=args.workers, sample_fps=args.sample_fps)
+    except (IOError, RuntimeError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return None
+
+
+def _run_session(args, config: dict) -> Optional[dict]:
+    """Run a session on the selected source (None on error)."""
+    try:
+        source = _build_source(args)
+    except IOError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return None
+
+    session = SessionManager(config, frame_source=source)
+    if not session.initialize():
+        print("ERROR: Failed to initialize session", file=sys.stderr)
+        return None
+
+    # Ctrl+C / SIGTERM end the run cleanly so the session log is saved
+    def request_stop(signum, frame):
+        session.frame_clock.stop()
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    try:
+        return run(
+            session,
+            source=source,
+            realtime=args.realtime,
+            duration=args.duration,
+            max_frames=args.max_frames
+        )
+    finally:
+        session.shutdown()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the headless CLI."""
+    parser = argparse.ArgumentParser(
+        description="Run the detection pipeline without a GUI"
+    )
+    source_group = parser.add_mutually_exclusive_group()
+    source_group.add_argument("--video", help="Process a video file")
+    source_group.add_argument("--images", help="Process the images of a directory")
+    source_group.add_argument(
+        "--synthetic", type=int, metavar="FACES",
+        help="Process generated frames with this many moving faces"
+    )
+    parser.add_argument("--loop", action="store_true", help="Restart the video/image source at its end")
+    parser.add_argument("-c", "--config", help="Settings file (default: config/settings.yaml)")
+    parser.add_argument("-d", "--duration", type=float, help="Stop after this many seconds")
+    parser.add_argument("-n", "--max-frames", type=int, help="Stop after this many frames")
+    parser.add_argument(
+        "--realtime", action="store_true",
+        help="Schedule frames at the adaptive FPS (default: process back to back)"
+    )
+    parser.add_argument(
+        "--workers", type=int,
+        help="Analyze --video offline in parallel segments on this many processes"
+    )
+    parser.add_argument(
+        "--sample-fps", type=float,
+        help="With --workers: analyzed frames per second of video (default: every frame)"
+    )
+    parser.add_argument("--log-dir", help="Session log directory")
+    parser.add_argument("--log-format", choices=["json", "columnar"], help="Session log format")
+    parser.add_argument("--no-log", action="store_true", help="Do not write a session log")
+    parser.add_argument("--metrics-port", type=int, help="Serve metrics on localhost at this port")
+    parser.add_argument("--json", action="store_true", help="Print the run summary as JSON")
+    args = parser.parse_args(argv)
+    if args.workers and not args.video:
+        parser.error("--workers requires --video")
+
+    unbounded = args.duration is None and args.max_frames is None
+    if unbounded and (args.loop or not (args.video or args.images)):
+        print("Running until interrupted (Ctrl+C)", file=sys.stderr)
+
+    # Model initialization, session banners and log saving print; keep
+    # stdout for the JSON summary
+    with contextlib.redirect_stdout(sys.stderr if args.json else sys.stdout):
+        config = _apply_overrides(load_config(args.config), args)
+        if args.workers:
+            summary = _run_video_batch(args, config)
+        else:
+            summary = _run_session(args, config)
+    if summary is None:
+        return 1
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    elif args.workers:
+        print(f"Processed {summary['frames']} frames ({summary['faces']} faces, "
+              f"{summary['tracks']} tracks) in {summary['elapsed_s']:.1f}s: "
+              f"{summary['speedup']:.1f}x real time")
+    else:
+        print(f"Processed {summary['frames']} frames ({summary['faces']} faces) in "
+              f"{summary['elapsed_s']:.1f}s: {summary['throughput_fps']:.1f} FPS")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
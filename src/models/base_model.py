@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
 import numpy as np
 from ..data.models import EmotionPrediction, FaceRegion
+from ..utils.instrumentation import get_instrumentation
 
 
 class BaseEmotionModel(ABC):
@@ -20,6 +21,8 @@ class BaseEmotionModel(ABC):
         self.model_name = model_name
         self.weight = weight
         self.is_initialized = False
+        self.instrumentation = get_instrumentation()
+        self.stage_name = f"model.{model_name}"
 
     @abstractmethod
     def initialize(self) -> bool:
@@ -49,6 +52,24 @@ class BaseEmotionModel(ABC):
         """
         pass
 
+    def predict(
+        self,
+        frame: np.ndarray,
+        face_region: FaceRegion
+    ) -> Optional[EmotionPrediction]:
+        """
+        Predict emotion, recording the call's latency under this model's stage.
+
+        Args:
+            frame: Full frame image
+            face_region: Region containing the face
+
+        Returns:
+            EmotionPrediction or None if prediction fails
+        """
+        with self.instrumentation.stage(self.stage_name):
+            return self.predict_emotion(frame, face_region)
+
     def extract_face(self, frame: np.ndarray, face_region: FaceRegion) -> np.ndarray:
         """
         Extract face region from frame.
@@ -3,7 +3,6 @@
 from typing import Dict, List, Optional
 import numpy as np
 import cv2
-from datetime import datetime
 
 from .base_model import BaseEmotionModel
 from ..data.models import EmotionPrediction, FaceRegion
@@ -92,8 +91,7 @@ class DeepFaceModel(BaseEmotionModel):
                 model_name=self.model_name,
                 emotion=dominant_emotion,
                 confidence=confidence,
-                all_scores=normalized_scores,
-                timestamp=datetime.now()
+                scores=normalized_scores
             )
 
         except Exception as e:
@@ -1,10 +1,10 @@
 """Ensemble voting for emotion predictions from multiple models."""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 from collections import defaultdict
 
-from ..data.models import EmotionPrediction
+from ..data.models import EmotionPrediction, EMOTION_LABELS
 
 
 class EnsembleVoter:
@@ -63,42 +63,15 @@ class EnsembleVoter:
         Returns:
             Combined prediction
         """
-        # Aggregate emotion scores across all predictions
-        emotion_scores = defaultdict(float)
-        total_weight = 0.0
-
-        for pred in predictions:
-            # Get model weight
-            if model_weights and pred.model_name in model_weights:
-                model_weight = model_weights[pred.model_name]
-            else:
-                model_weight = 1.0
-
-            # Weight by both model weight and prediction confidence
-            effective_weight = model_weight * pred.confidence
-
-            # Add all emotion scores from this prediction
-            for emotion, score in pred.all_scores.items():
-                emotion_scores[emotion] += score * effective_weight
-
-            total_weight += effective_weight
-
-        # Normalize scores
-        if total_weight > 0:
-            emotion_scores = {k: v / total_weight for k, v in emotion_scores.items()}
-
-        # Get dominant emotion
-        if not emotion_scores:
-            return None
+        # Model weight times prediction confidence, one row per prediction
+        weights = np.array([
+            (model_weights.get(pred.model_name, 1.0) if model_weights else 1.0) * pred.confidence
+            for pred in predictions
+        ], dtype=np.float32)
+        total_weight = float(weights.sum())
 
-        dominant_emotion = max(emotion_scores.items(), key=lambda x: x[1])
-
-        return EmotionPrediction(
-            model_name="Ensemble",
-            emotion=dominant_emotion[0],
-            confidence=dominant_emotion[1],
-            all_scores=dict(emotion_scores)
-        )
+        # Aggregate emotion scores across all predictions
+        return self._combine(predictions, weights, total_weight)
 
     def _average_voting(self, predictions: List[EmotionPrediction]) -> Optional[EmotionPrediction]:
         """
@@ -110,24 +83,48 @@ class EnsembleVoter:
         Returns:
             Combined prediction
         """
-        emotion_scores = defaultdict(float)
+        weights = np.ones(len(predictions), dtype=np.float32)
+        return self._combine(predictions, weights, float(len(predictions)))
 
-        for pred in predictions:
-            for emotion, score in pred.all_scores.items():
-                emotion_scores[emotion] += score
+    def _combine(
+        self,
+        predictions: List[EmotionPrediction],
+        weights: np.ndarray,
+        normalizer: float
+    ) -> Optional[EmotionPrediction]:
+        """
+        Weighted sum of prediction score vectors.
+
+        Emotions no model scored stay missing (NaN) in the result.
 
-        # Average
-        n = len(predictions)
-        emotion_scores = {k: v / n for k, v in emotion_scores.items()}
+        Args:
+            predictions: List of predictions
+            weights: Per-prediction weights
+            normalizer: Divisor applied to the weighted sum (skipped if <= 0)
+
+        Returns:
+            Combined prediction, or None if no emotion was scored
+        """
+        scores = np.stack([pred.scores for pred in predictions])
+        present = ~np.isnan(scores)
+        scored = present.any(axis=0)
+
+        if not scored.any():
+            return None
+
+        combined = (np.where(present, scores, 0.0) * weights[:, None]).sum(axis=0)
+        if normalizer > 0:
+            combined = combined / normalizer
+        combined = np.where(scored, combined, np.nan).astype(np.float32)
 
         # Get dominant emotion
-        dominant_emotion = max(emotion_scores.items(), key=lambda x: x[1])
+        dominant = int(np.nanargmax(combined))
 
         return EmotionPrediction(
             model_name="Ensemble",
-            emotion=dominant_emotion[0],
-            confidence=dominant_emotion[1],
-            all_scores=dict(emotion_scores)
+            emotion=EMOTION_LABELS[dominant],
+            confidence=float(combined[dominant]),
+            scores=combined
         )
 
     def _max_confidence(self, predictions: List[EmotionPrediction]) -> Optional[EmotionPrediction]:
@@ -149,9 +146,66 @@ class EnsembleVoter:
             model_name="Ensemble",
             emotion=max_pred.emotion,
             confidence=max_pred.confidence,
-            all_scores=max_pred.all_scores
+            scores=max_pred.scores
         )
 
+    def vote_batch(
+        self,
+        model_scores: np.ndarray,
+        model_confidence: np.ndarray,
+        model_weights: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Combine predictions for every face of a frame at once.
+
+        Args:
+            model_scores: (faces, models, emotions) scores, NaN = not scored
+            model_confidence: (faces, models) confidences, NaN = no prediction
+            model_weights: Optional (models,) weights
+
+        Returns:
+            (emotion_index, confidence, combined_scores, valid) where valid
+            marks faces with enough predictions and at least one scored emotion
+        """
+        n_faces, n_models, n_emotions = model_scores.shape
+        predicted = ~np.isnan(model_confidence)
+        enough = predicted.sum(axis=1) >= self.min_models_required
+
+        if model_weights is None:
+            model_weights = np.ones(n_models, dtype=np.float32)
+        confidence = np.where(predicted, model_confidence, 0.0)
+
+        if self.method == "max_confidence":
+            best = np.argmax(np.where(predicted, model_confidence, -np.inf), axis=1) if n_models else \
+                np.zeros(n_faces, dtype=np.int64)
+            combined = model_scores[np.arange(n_faces), best] if n_models else \
+                np.full((n_faces, n_emotions), np.nan, dtype=np.float32)
+        else:
+            if self.method == "weighted_voting":
+                weights = confidence * model_weights[None, :]
+                normalizer = weights.sum(axis=1)
+            elif self.method == "average":
+                weights = predicted.astype(np.float32)
+                normalizer = weights.sum(axis=1)
+            else:
+                raise ValueError(f"Unknown voting method: {self.method}")
+
+            present = ~np.isnan(model_scores) & predicted[:, :, None]
+            combined = (np.where(present, model_scores, 0.0) * weights[:, :, None]).sum(axis=1)
+            combined = combined / np.where(normalizer > 0, normalizer, 1.0)[:, None]
+            combined = np.where(present.any(axis=1), combined, np.nan)
+
+        combined = combined.astype(np.float32)
+        scored = ~np.isnan(combined).all(axis=1) if n_emotions else np.zeros(n_faces, dtype=bool)
+        valid = enough & scored
+
+        emotion_index = np.argmax(np.where(np.isnan(combined), -np.inf, combined), axis=1)
+        result_confidence = np.where(
+            valid, combined[np.arange(n_faces), emotion_index], 0.0
+        ).astype(np.float32)
+
+        return emotion_index.astype(np.uint8), result_confidence, combined, valid
+
     def get_agreement_score(self, predictions: List[EmotionPrediction]) -> float:
         """
         Calculate how much models agree on the emotion.
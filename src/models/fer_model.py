@@ -3,7 +3,6 @@
 from typing import Dict, List, Optional
 import numpy as np
 import cv2
-from datetime import datetime
 
 from .base_model import BaseEmotionModel
 from ..data.models import EmotionPrediction, FaceRegion
@@ -86,8 +85,7 @@ class FERModel(BaseEmotionModel):
                 model_name=self.model_name,
                 emotion=dominant_emotion[0],
                 confidence=dominant_emotion[1],
-                all_scores=emotions,
-                timestamp=datetime.now()
+                scores=emotions
             )
 
         except Exception as e:
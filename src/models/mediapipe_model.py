@@ -3,7 +3,6 @@
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 import cv2
-from datetime import datetime
 import os
 
 from .base_model import BaseEmotionModel
@@ -142,8 +141,7 @@ class MediaPipeModel(BaseEmotionModel):
                 model_name=self.model_name,
                 emotion=dominant_emotion[0],
                 confidence=dominant_emotion[1],
-                all_scores=emotion_scores,
-                timestamp=datetime.now()
+                scores=emotion_scores
             )
 
         except Exception as e:
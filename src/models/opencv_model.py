@@ -3,7 +3,6 @@
 from typing import Dict, List, Optional
 import numpy as np
 import cv2
-from datetime import datetime
 import os
 
 from .base_model import BaseEmotionModel
@@ -93,8 +92,7 @@ class OpenCVModel(BaseEmotionModel):
                 model_name=self.model_name,
                 emotion=dominant_emotion,
                 confidence=confidence,
-                all_scores=emotion_scores,
-                timestamp=datetime.now()
+                scores=emotion_scores
             )
 
         except Exception as e:
@@ -5,7 +5,7 @@ from PyQt6.QtWidgets import (
     QPushButton, QLabel, QTextEdit, QGroupBox, QFrame,
     QProgressBar, QSplitter, QApplication
 )
-from PyQt6.QtCore import QTimer, Qt, QThread, pyqtSignal
+from PyQt6.QtCore import QTimer, Qt, QThread
 from PyQt6.QtGui import QKeySequence, QShortcut, QFont, QPalette, QColor
 from typing import Optional
 import threading
@@ -15,32 +15,49 @@ import subprocess
 import os
 
 from ..core.session_manager import SessionManager
+from ..utils.mailbox import EventQueue, LatestValueMailbox
+from ..utils.metrics_server import DEFAULT_NAMESPACE
 from .overlay import TransparentOverlay
 
 
+# Deception confidence above which a face raises an alert
+ALERT_CONFIDENCE = 0.8
+
+
 class ProcessingThread(QThread):
-    """Background thread for continuous frame processing."""
-    frame_processed = pyqtSignal(object, object)  # frame_analysis, frame
+    """
+    Background thread for continuous frame processing.
 
-    def __init__(self, session_manager):
+    Results are published to a latest-value mailbox rather than signalled
+    one by one, so the worker never waits on the GUI event loop and results
+    the GUI has no time to display are coalesced instead of queued. Alerts
+    are extracted here from every result and queued separately, so none is
+    lost with a coalesced result.
+    """
+
+    def __init__(self, session_manager, mailbox: LatestValueMailbox, alerts: EventQueue):
         super().__init__()
         self.session_manager = session_manager
+        self.mailbox = mailbox
+        self.alerts = alerts
         self.running = False
 
     def run(self):
-        """Process frames continuously in background."""
+        """Process frames on the session's frame clock."""
         self.running = True
-        while self.running and self.session_manager:
-            if self.session_manager.is_running:
-                frame_analysis = self.session_manager.process_frame()
-                if frame_analysis:
-                    # Get current frame for callback
-                    self.frame_processed.emit(frame_analysis, None)
-            time.sleep(0.05)  # ~20 FPS max processing rate
+        self.session_manager.run(on_frame=self._on_frame)
+
+    def _on_frame(self, frame_analysis):
+        """Queue the frame's alerts, then publish it (worker thread)."""
+        for face in frame_analysis.faces:
+            if face.is_deceptive and face.deception_confidence > ALERT_CONFIDENCE:
+                self.alerts.put((face.face_id, face.deception_reason, face.deception_confidence))
+        self.mailbox.publish(frame_analysis)
 
     def stop(self):
         """Stop the processing thread."""
         self.running = False
+        self.session_manager.frame_clock.stop()
         self.wait()
 
 
@@ -57,10 +74,19 @@ class MainWindow(QMainWindow):
         self.processing_thread: Optional[ProcessingThread] = None
         self.http_server_process = None
 
+        # Newest frame analysis and every alert from the processing thread
+        self.results = LatestValueMailbox()
+        self.alerts = EventQueue()
+
         # Timer for UI updates (separate from processing)
         self.ui_timer = QTimer()
         self.ui_timer.timeout.connect(self.update_ui_metrics)
 
+        # Pulls the newest result once per display refresh
+        self.display_timer = QTimer()
+        self.display_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.display_timer.timeout.connect(self._pull_frame_analysis)
+
         self.init_ui()
         self.setup_hotkeys()
         self.initialize_session()
@@ -432,6 +458,10 @@ class MainWindow(QMainWindow):
         if self.session_manager.initialize():
             self.log("[OK] Session initialized successfully")
             self.overlay = TransparentOverlay(self.config)
+            if self.session_manager.metrics_server:
+                self.session_manager.metrics_server.add_collector(
+                    lambda: self.results.collect_metrics(DEFAULT_NAMESPACE)
+                )
             self.status_detail.setText("Ready to start monitoring")
         else:
             self.log("[ERROR] Failed to initialize session")
@@ -456,12 +486,14 @@ class MainWindow(QMainWindow):
         self.is_monitoring = True
 
         # Start background processing thread
-        self.processing_thread = ProcessingThread(self.session_manager)
-        self.processing_thread.frame_processed.connect(self.on_frame_analyzed)
+        self.results.take()  # Drop a result and alerts left over from the previous run
+        self.alerts.drain()
+        self.processing_thread = ProcessingThread(self.session_manager, self.results, self.alerts)
         self.processing_thread.start()
 
-        # Start UI update timer
+        # Start UI update timers
         self.ui_timer.start(200)  # Update UI 5 times per second
+        self.display_timer.start(self._display_interval_ms())
 
         # Start overlay keep-alive timer to maintain visibility when app loses focus
         if not hasattr(self, 'overlay_timer'):
@@ -488,6 +520,7 @@ class MainWindow(QMainWindow):
             self.processing_thread = None
 
         self.ui_timer.stop()
+        self.display_timer.stop()
         if hasattr(self, 'overlay_timer'):
             self.overlay_timer.stop()
         self.session_manager.stop()
@@ -507,6 +540,22 @@ class MainWindow(QMainWindow):
         if self.session_manager and self.session_manager.performance:
             self.fps_value.setText(f"{self.session_manager.performance.current_fps:.0f}")
 
+    def _display_interval_ms(self) -> int:
+        """Result polling interval: configured ui.refresh_hz, else the screen refresh rate."""
+        refresh_hz = self.config.get('ui', {}).get('refresh_hz')
+        if not refresh_hz:
+            screen = self.screen()
+            refresh_hz = screen.refreshRate() if screen else 0
+        return max(int(1000 / refresh_hz), 1) if refresh_hz and refresh_hz > 0 else 16
+
+    def _pull_frame_analysis(self):
+        """Display the newest frame analysis and every alert since the last refresh."""
+        for face_id, reason, confidence in self.alerts.drain():
+            self.on_alert(face_id, reason, confidence)
+        frame_analysis = self.results.take()
+        if frame_analysis is not None:
+            self.on_frame_analyzed(frame_analysis, None)
+
     def toggle_mesh(self):
         """Toggle facial mesh overlay."""
         if self.overlay:
@@ -566,21 +615,26 @@ class MainWindow(QMainWindow):
         # Update UI metrics
         self.faces_value.setText(str(len(frame_analysis.faces)))
 
-        # Update overlay if visible (runs on main thread via signal)
+        # Update overlay if visible (runs on main thread via the display timer)
         if self.overlay_visible and self.overlay:
             self.overlay.update_analysis(frame_analysis)
 
-        # Log deception events (only log once per face)
-        for face in frame_analysis.faces:
-            if face.is_deceptive and face.deception_confidence > 0.8:
-                # Update alerts counter
-                current_alerts = int(self.alerts_value.text())
-                self.alerts_value.setText(str(current_alerts + 1))
-
-                self.log(
-                    f"[ALERT] DECEPTION DETECTED - Face {face.face_id}: "
-                    f"{face.deception_reason} (Confidence: {face.deception_confidence:.0%})"
-                )
+    def on_alert(self, face_id, reason, confidence):
+        """
+        Count and log a deception alert (queued by the processing thread).
+
+        Args:
+            face_id: Track ID of the face
+            reason: Deception reason
+            confidence: Deception confidence
+        """
+        current_alerts = int(self.alerts_value.text())
+        self.alerts_value.setText(str(current_alerts + 1))
+
+        self.log(
+            f"[ALERT] DECEPTION DETECTED - Face {face_id}: "
+            f"{reason} (Confidence: {confidence:.0%})"
+        )
 
     def toggle_overlay(self):
         """Toggle overlay visibility."""
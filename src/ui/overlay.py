@@ -1,12 +1,14 @@
 """Transparent overlay for displaying face detection results."""
 
 from PyQt6.QtWidgets import QWidget, QApplication
-from PyQt6.QtCore import Qt, QRect, QPoint
-from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QPainterPath
-from typing import Optional, List
+from PyQt6.QtCore import Qt, QRect, QPointF
+from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QFontMetrics, QPainterPath, QRegion
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Tuple
 import numpy as np
 
-from ..data.models import FrameAnalysis
+from ..data.models import FrameAnalysis, FaceRegion
+from ..core.tracker import SmoothingTracker
 
 
 # MediaPipe face mesh connection indices for drawing
@@ -44,6 +46,58 @@ FACE_MESH_CONNECTIONS = [
 ]
 
 
+# Edge endpoints as arrays; an edge "continues" when it starts where the
+# previous one ended, so the path can extend the current polyline
+_MESH_EDGES = np.array(FACE_MESH_CONNECTIONS, dtype=np.intp)
+_MESH_CONTINUES = np.r_[False, _MESH_EDGES[1:, 0] == _MESH_EDGES[:-1, 1]]
+
+# Key facial landmarks drawn as points: eyes, nose, mouth corners
+KEY_LANDMARKS = np.array([33, 133, 362, 263, 1, 61, 291, 199], dtype=np.intp)
+
+# MediaPipe extracts landmarks from the face box expanded by 50% per side
+MESH_EXPAND = 0.5
+
+MODEL_COLORS = {
+    'DeepFace': [0, 200, 255],   # Cyan
+    'OpenCV': [255, 200, 0],      # Orange
+    'MediaPipe': [200, 100, 255], # Purple
+    'FER': [100, 255, 100]        # Green
+}
+
+LABEL_PADDING = 5
+
+
+def landmarks_to_screen(landmarks: np.ndarray, region: FaceRegion, expand: float = MESH_EXPAND) -> np.ndarray:
+    """
+    Map normalized face mesh landmarks to screen coordinates.
+
+    Args:
+        landmarks: (N, 2+) landmarks normalized to the expanded face crop
+        region: Face region the landmarks were extracted from
+        expand: Crop expansion per side, as a fraction of the face size
+
+    Returns:
+        (N, 2) float array of screen coordinates
+    """
+    origin = np.array([region.x - region.width * expand, region.y - region.height * expand])
+    size = np.array([region.width * (1 + 2 * expand), region.height * (1 + 2 * expand)])
+    return origin + np.asarray(landmarks, dtype=np.float64)[:, :2] * size
+
+
+@dataclass
+class FaceGraphics:
+    """Prebuilt drawing primitives for one face, reused until the face changes."""
+    key: tuple
+    landmarks: Optional[np.ndarray]
+    bbox: QRect
+    pen: QPen
+    mesh: Optional[QPainterPath] = None
+    points: Optional[QPainterPath] = None
+    # (background rect, background color, text x, text y, text, text color)
+    labels: List[Tuple[QRect, QColor, int, int, str, QColor]] = field(default_factory=list)
+    bounds: QRect = field(default_factory=QRect)
+
+
 class TransparentOverlay(QWidget):
     """Transparent overlay window that displays face detection results."""
 
@@ -54,17 +108,42 @@ class TransparentOverlay(QWidget):
         self.show_mesh = True  # Toggle for facial mesh display (enabled by default)
 
         # Face tracking - use spatial tracking instead of index-based
-        self.tracked_faces = {}  # track_id -> {x, y, w, h, emotion, history, age}
-        self.next_track_id = 0
-        self.smoothing_alpha = 0.15  # Exponential smoothing factor (lower = smoother)
-        self.max_track_distance = 100  # Max pixels to match same face
-        self.track_timeout = 30  # Frames before removing unmatched track
+        self.tracker = SmoothingTracker(
+            alpha=0.15,  # Exponential smoothing factor (lower = smoother)
+            max_distance=100,  # Max pixels to match same face
+            timeout=30,  # Frames before removing unmatched track
+            history=15  # Emotions in the majority vote
+        )
 
         # Get overlay configuration
         overlay_config = config.get('ui', {}).get('overlay', {})
         self.bbox_config = overlay_config.get('bbox', {})
         self.label_config = overlay_config.get('label', {})
 
+        # Pens, colors and font are created once and shared by every repaint
+        thickness = self.bbox_config.get('thickness', 2)
+        self._bbox_color = self.bbox_config.get('color', [0, 255, 0])
+        self._deception_color = self.bbox_config.get('deception_color', [255, 0, 0])
+        self._bbox_pen = QPen(QColor(*self._bbox_color))
+        self._bbox_pen.setWidth(thickness)
+        self._deception_pen = QPen(QColor(*self._deception_color))
+        self._deception_pen.setWidth(thickness)
+        self._mesh_pen = QPen(QColor(0, 255, 255, 220))  # Cyan
+        self._mesh_pen.setWidth(2)
+        self._point_pen = QPen(QColor(0, 255, 128, 255))  # Bright green
+        self._point_pen.setWidth(4)
+        self._font = QFont("Arial", self.label_config.get('font_size', 12), QFont.Weight.Bold)
+        self._font_metrics = QFontMetrics(self._font)
+        self._label_background = QColor(0, 0, 0, int(self.label_config.get('background_opacity', 0.7) * 255))
+        self._deception_background = QColor(255, 0, 0, self._label_background.alpha())
+        # Widest pen, so dirty regions include stroke overhang
+        self._bounds_margin = max(thickness, 4)
+
+        # Retained scene: faces being drawn (track ID, analysis, smoothed
+        # overlay-relative box, majority emotion) and their graphics by track ID
+        self._faces: List[Tuple[int, object, FaceRegion, str]] = []
+        self._graphics: Dict[int, FaceGraphics] = {}
+
         self.init_ui()
 
     def init_ui(self):
@@ -81,9 +160,15 @@ class TransparentOverlay(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
 
-        # Set to fullscreen
-        screen = QApplication.primaryScreen().geometry()
-        self.setGeometry(screen)
+        # Set to fullscreen (the whole desktop when several monitors are analyzed)
+        screen = QApplication.primaryScreen()
+        if self.config.get('screen_capture', {}).get('monitors'):
+            geometry = screen.virtualGeometry()
+        else:
+            geometry = screen.geometry()
+        self.setGeometry(geometry)
+        # Face regions are in screen coordinates; paint relative to the overlay
+        self._origin = (geometry.x(), geometry.y())
 
     def update_analysis(self, frame_analysis: FrameAnalysis):
         """
@@ -92,303 +177,189 @@ class TransparentOverlay(QWidget):
         Args:
             frame_analysis: Latest frame analysis
         """
-        from collections import Counter
-        import math
-
-        # Mark all tracks as unmatched
-        for track_id in self.tracked_faces:
-            self.tracked_faces[track_id]['matched'] = False
-
-        # Match detected faces to existing tracks based on position
-        for face in frame_analysis.faces:
-            face_cx = face.region.x + face.region.width / 2
-            face_cy = face.region.y + face.region.height / 2
-
-            # Find closest existing track
-            best_track_id = None
-            best_distance = self.max_track_distance
-
-            for track_id, track in self.tracked_faces.items():
-                if track['matched']:
-                    continue
-                track_cx = track['x'] + track['w'] / 2
-                track_cy = track['y'] + track['h'] / 2
-                distance = math.sqrt((face_cx - track_cx)**2 + (face_cy - track_cy)**2)
-                if distance < best_distance:
-                    best_distance = distance
-                    best_track_id = track_id
-
-            if best_track_id is not None:
-                # Update existing track with exponential smoothing
-                track = self.tracked_faces[best_track_id]
-                alpha = self.smoothing_alpha
-                track['x'] = track['x'] * (1 - alpha) + face.region.x * alpha
-                track['y'] = track['y'] * (1 - alpha) + face.region.y * alpha
-                track['w'] = track['w'] * (1 - alpha) + face.region.width * alpha
-                track['h'] = track['h'] * (1 - alpha) + face.region.height * alpha
-                track['emotion_history'].append(face.emotion)
-                if len(track['emotion_history']) > 15:
-                    track['emotion_history'] = track['emotion_history'][-15:]
-                track['matched'] = True
-                track['age'] = 0
-                track['face_data'] = face  # Store current face data
-            else:
-                # Create new track
-                self.tracked_faces[self.next_track_id] = {
-                    'x': float(face.region.x),
-                    'y': float(face.region.y),
-                    'w': float(face.region.width),
-                    'h': float(face.region.height),
-                    'emotion_history': [face.emotion],
-                    'matched': True,
-                    'age': 0,
-                    'face_data': face
-                }
-                self.next_track_id += 1
-
-        # Age unmatched tracks and remove old ones
-        tracks_to_remove = []
-        for track_id, track in self.tracked_faces.items():
-            if not track['matched']:
-                track['age'] += 1
-                if track['age'] > self.track_timeout:
-                    tracks_to_remove.append(track_id)
-
-        for track_id in tracks_to_remove:
-            del self.tracked_faces[track_id]
-
-        # Apply smoothed positions back to faces for rendering
-        for face in frame_analysis.faces:
-            face_cx = face.region.x + face.region.width / 2
-            face_cy = face.region.y + face.region.height / 2
-
-            # Find the track for this face
-            for track_id, track in self.tracked_faces.items():
-                if track.get('face_data') == face:
-                    # Apply smoothed position
-                    face.region.x = int(track['x'])
-                    face.region.y = int(track['y'])
-                    face.region.width = int(track['w'])
-                    face.region.height = int(track['h'])
-
-                    # Apply smoothed emotion (most common in history)
-                    if track['emotion_history']:
-                        emotion_counts = Counter(track['emotion_history'])
-                        face.emotion = emotion_counts.most_common(1)[0][0]
-                    break
-
-        self.frame_analysis = frame_analysis
-        self.update()  # Trigger repaint
-
-    def paintEvent(self, event):
-        """Paint the overlay."""
-        if not self.frame_analysis or not self.frame_analysis.faces:
-            return
-
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        faces = list(frame_analysis.faces)
+        track_ids, boxes, emotions = self.tracker.update(
+            [face.region for face in faces],
+            [face.emotion for face in faces]
+        )
 
-        # Draw each detected face
-        for face in self.frame_analysis.faces:
-            self._draw_face(painter, face)
+        # Smoothed boxes in overlay coordinates; the analyses are shared with
+        # the pipeline and logs, so they are never modified here
+        self._faces = [
+            (track_id, face, FaceRegion(x - self._origin[0], y - self._origin[1], w, h), emotion)
+            for face, track_id, (x, y, w, h), emotion in zip(faces, track_ids, boxes.tolist(), emotions)
+        ]
 
-        painter.end()
-
-    def _draw_face(self, painter: QPainter, face):
-        """Draw bounding box, label, and optional mesh for a face."""
-        # Determine color based on deception
-        if face.is_deceptive:
-            color = self.bbox_config.get('deception_color', [255, 0, 0])
-        else:
-            color = self.bbox_config.get('color', [0, 255, 0])
-
-        # Create pen for bounding box
-        pen = QPen(QColor(*color))
-        pen.setWidth(self.bbox_config.get('thickness', 2))
-        painter.setPen(pen)
-
-        # Draw bounding box
-        rect = QRect(
-            face.region.x,
-            face.region.y,
-            face.region.width,
-            face.region.height
+        self.frame_analysis = frame_analysis
+        self._refresh_graphics()
+
+    def _refresh_graphics(self) -> None:
+        """Rebuild graphics of changed faces and repaint only their areas."""
+        graphics: Dict[int, FaceGraphics] = {}
+        for track_id, face, region, emotion in self._faces:
+            key = self._graphics_key(face, region, emotion)
+            cached = self._graphics.get(track_id)
+            if cached is not None and cached.key == key and cached.landmarks is face.landmarks:
+                graphics[track_id] = cached
+            else:
+                graphics[track_id] = self._build_graphics(face, key, region, emotion)
+
+        # Dirty region: old and new bounds of every face that changed
+        dirty = QRegion()
+        for track_id in set(self._graphics) | set(graphics):
+            old, new = self._graphics.get(track_id), graphics.get(track_id)
+            if old is new:
+                continue
+            for item in (old, new):
+                if item is not None:
+                    dirty = dirty.united(item.bounds)
+
+        self._graphics = graphics
+        if not dirty.isEmpty():
+            self.update(dirty)
+
+    def _graphics_key(self, face, region: FaceRegion, emotion: str) -> tuple:
+        """Everything the drawing of a face depends on, except landmarks."""
+        return (
+            region.to_tuple(),
+            emotion,
+            round(face.confidence, 2),
+            face.is_deceptive,
+            tuple((p.model_name, p.emotion, round(p.confidence, 2)) for p in face.model_predictions),
+            self.show_mesh
         )
-        painter.drawRect(rect)
 
-        # Draw facial mesh if enabled
-        self._draw_mesh(painter, face)
+    def _build_graphics(self, face, key: tuple, region: FaceRegion, emotion: str) -> FaceGraphics:
+        """Build bounding box, mesh and label primitives for a face at its overlay box."""
+        color = self._deception_color if face.is_deceptive else self._bbox_color
+        graphics = FaceGraphics(
+            key=key,
+            landmarks=face.landmarks,
+            bbox=QRect(region.x, region.y, region.width, region.height),
+            pen=self._deception_pen if face.is_deceptive else self._bbox_pen
+        )
+        bounds = QRect(graphics.bbox)
+
+        if self.show_mesh and face.landmarks is not None and len(face.landmarks) >= 468:
+            graphics.mesh, graphics.points = self._build_mesh(face.landmarks, region)
+            bounds = bounds.united(graphics.mesh.boundingRect().toAlignedRect())
+            bounds = bounds.united(graphics.points.boundingRect().toAlignedRect())
+
+        graphics.labels = self._layout_labels(face, color, region, emotion)
+        for rect, *_ in graphics.labels:
+            bounds = bounds.united(rect)
+
+        margin = self._bounds_margin
+        graphics.bounds = bounds.adjusted(-margin, -margin, margin, margin)
+        return graphics
+
+    def _build_mesh(self, landmarks: np.ndarray, region: FaceRegion) -> Tuple[QPainterPath, QPainterPath]:
+        """Mesh edges and key points as two paths, from one vectorized transform."""
+        points = landmarks_to_screen(landmarks, region)
+
+        mesh = QPainterPath()
+        starts = points[_MESH_EDGES[:, 0]].tolist()
+        ends = points[_MESH_EDGES[:, 1]].tolist()
+        for (x1, y1), (x2, y2), continues in zip(starts, ends, _MESH_CONTINUES.tolist()):
+            if not continues:
+                mesh.moveTo(x1, y1)
+            mesh.lineTo(x2, y2)
+
+        key_points = QPainterPath()
+        for x, y in points[KEY_LANDMARKS].tolist():
+            key_points.addEllipse(QPointF(x, y), 3, 3)
+        return mesh, key_points
+
+    def _layout_labels(
+        self,
+        face,
+        color,
+        region: FaceRegion,
+        emotion: str
+    ) -> List[Tuple[QRect, QColor, int, int, str, QColor]]:
+        """Lay out the emotion labels with multi-model predictions above the face."""
+        metrics = self._font_metrics
+        text_height = metrics.height()
+        padding = LABEL_PADDING
+        labels = []
 
-        # Draw label
-        self._draw_label(painter, face, color)
+        def add(x: int, y: int, text: str, background: QColor, text_color) -> None:
+            rect = QRect(x, y, metrics.horizontalAdvance(text) + 2 * padding, text_height + 2 * padding)
+            labels.append((rect, background, x + padding, y + text_height, text, QColor(*text_color)))
 
-    def _draw_label(self, painter: QPainter, face, color):
-        """Draw emotion label with multi-model predictions above face."""
-        font_size = self.label_config.get('font_size', 12)
-        font = QFont("Arial", font_size, QFont.Weight.Bold)
-        painter.setFont(font)
-        metrics = painter.fontMetrics()
-        text_height = metrics.height()
-        padding = 5
-        bg_opacity = int(self.label_config.get('background_opacity', 0.7) * 255)
-
-        # Build multi-model display
-        model_colors = {
-            'DeepFace': [0, 200, 255],   # Cyan
-            'OpenCV': [255, 200, 0],      # Orange
-            'MediaPipe': [200, 100, 255], # Purple
-            'FER': [100, 255, 100]        # Green
-        }
-
-        # Get model predictions
         predictions = face.model_predictions if hasattr(face, 'model_predictions') else []
-
-        if predictions and len(predictions) > 0:
-            # Draw individual model predictions
-            label_y = face.region.y - (text_height + padding * 2) * len(predictions) - padding
+        if predictions:
+            # One line per model prediction
+            label_y = region.y - (text_height + padding * 2) * len(predictions) - padding
             if label_y < 0:
-                label_y = face.region.y + face.region.height + padding
+                label_y = region.y + region.height + padding
 
             for pred in predictions:
-                model_name = pred.model_name
-                emotion = pred.emotion.upper()
-                conf = pred.confidence
-
-                label_text = f"{model_name}: {emotion} ({conf:.0%})"
-                text_width = metrics.horizontalAdvance(label_text)
-
-                # Draw background
-                bg_color = QColor(0, 0, 0, bg_opacity)
-                painter.fillRect(
-                    face.region.x,
-                    label_y,
-                    text_width + 2 * padding,
-                    text_height + 2 * padding,
-                    bg_color
-                )
-
-                # Draw text with model-specific color
-                model_color = model_colors.get(model_name, color)
-                painter.setPen(QColor(*model_color))
-                painter.drawText(
-                    face.region.x + padding,
-                    label_y + text_height,
-                    label_text
+                add(
+                    region.x, label_y,
+                    f"{pred.model_name}: {pred.emotion.upper()} ({pred.confidence:.0%})",
+                    self._label_background,
+                    MODEL_COLORS.get(pred.model_name, color)
                 )
-
                 label_y += text_height + padding * 2
 
-            # Draw ensemble result if deceptive
             if face.is_deceptive:
-                deception_text = "⚠ DECEPTION"
-                text_width = metrics.horizontalAdvance(deception_text)
-                painter.fillRect(
-                    face.region.x,
-                    label_y,
-                    text_width + 2 * padding,
-                    text_height + 2 * padding,
-                    QColor(255, 0, 0, bg_opacity)
-                )
-                painter.setPen(QColor(255, 255, 255))
-                painter.drawText(
-                    face.region.x + padding,
-                    label_y + text_height,
-                    deception_text
-                )
+                add(region.x, label_y, "⚠ DECEPTION", self._deception_background, (255, 255, 255))
         else:
             # Fallback to single label
             label_parts = []
             if self.label_config.get('show_emotion', True):
-                label_parts.append(face.emotion.upper())
+                label_parts.append(emotion.upper())
             if self.label_config.get('show_confidence', True):
                 label_parts.append(f"{face.confidence:.0%}")
             if face.is_deceptive:
                 label_parts.append("DECEPTION")
 
-            label_text = " | ".join(label_parts)
-            text_width = metrics.horizontalAdvance(label_text)
-
-            label_x = face.region.x
-            label_y = face.region.y - text_height - padding
+            label_y = region.y - text_height - padding
             if label_y < 0:
-                label_y = face.region.y + face.region.height + padding
-
-            bg_color = QColor(0, 0, 0, bg_opacity)
-            painter.fillRect(
-                label_x,
-                label_y,
-                text_width + 2 * padding,
-                text_height + 2 * padding,
-                bg_color
-            )
-
-            painter.setPen(QColor(*color))
-            painter.drawText(
-                label_x + padding,
-                label_y + text_height,
-                label_text
-            )
-
-    def _draw_mesh(self, painter: QPainter, face):
-        """Draw facial mesh landmarks if available."""
-        if not self.show_mesh:
-            return
+                label_y = region.y + region.height + padding
+            add(region.x, label_y, " | ".join(label_parts), self._label_background, color)
 
-        if face.landmarks is None:
-            # Debug: landmarks not available
-            return
+        return labels
 
-        if len(face.landmarks) < 468:
-            # Not enough landmarks
+    def paintEvent(self, event):
+        """Paint the retained face graphics that intersect the dirty area."""
+        if not self._graphics:
             return
 
-        # Get face region and expand it to match MediaPipe's extraction area
-        region = face.region
-        landmarks = face.landmarks
-
-        # MediaPipe uses 50% expansion, so we need to draw in expanded coordinates
-        expand = 0.5
-        expanded_x = int(region.x - region.width * expand)
-        expanded_y = int(region.y - region.height * expand)
-        expanded_w = int(region.width * (1 + 2 * expand))
-        expanded_h = int(region.height * (1 + 2 * expand))
-
-        # Set pen for mesh lines - thicker and more visible
-        mesh_pen = QPen(QColor(0, 255, 255, 220))  # Cyan
-        mesh_pen.setWidth(2)
-        painter.setPen(mesh_pen)
-
-        # Draw mesh connections
-        for start_idx, end_idx in FACE_MESH_CONNECTIONS:
-            if start_idx < len(landmarks) and end_idx < len(landmarks):
-                # Scale landmarks to expanded region
-                x1 = int(expanded_x + landmarks[start_idx][0] * expanded_w)
-                y1 = int(expanded_y + landmarks[start_idx][1] * expanded_h)
-                x2 = int(expanded_x + landmarks[end_idx][0] * expanded_w)
-                y2 = int(expanded_y + landmarks[end_idx][1] * expanded_h)
-
-                painter.drawLine(x1, y1, x2, y2)
-
-        # Draw landmark points - larger and more visible
-        point_pen = QPen(QColor(0, 255, 128, 255))  # Bright green
-        point_pen.setWidth(4)
-        painter.setPen(point_pen)
-
-        # Draw fewer points for clarity (key facial landmarks)
-        key_landmarks = [33, 133, 362, 263, 1, 61, 291, 199]  # Eyes, nose, mouth corners
-        for idx in key_landmarks:
-            if idx < len(landmarks):
-                x = int(expanded_x + landmarks[idx][0] * expanded_w)
-                y = int(expanded_y + landmarks[idx][1] * expanded_h)
-                painter.drawEllipse(x-3, y-3, 6, 6)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.setFont(self._font)
+        area = event.rect()
+
+        for graphics in self._graphics.values():
+            if not graphics.bounds.intersects(area):
+                continue
+
+            painter.setPen(graphics.pen)
+            painter.drawRect(graphics.bbox)
+
+            if graphics.mesh is not None:
+                painter.setPen(self._mesh_pen)
+                painter.drawPath(graphics.mesh)
+                painter.setPen(self._point_pen)
+                painter.drawPath(graphics.points)
+
+            for rect, background, x, y, text, text_color in graphics.labels:
+                painter.fillRect(rect, background)
+                painter.setPen(text_color)
+                painter.drawText(x, y, text)
+
+        painter.end()
 
     def toggle_mesh(self):
         """Toggle facial mesh display on/off."""
         self.show_mesh = not self.show_mesh
-        self.update()
+        self._refresh_graphics()
         return self.show_mesh
 
     def set_mesh_visible(self, visible: bool):
         """Set facial mesh visibility."""
         self.show_mesh = visible
-        self.update()
+        self._refresh_graphics()
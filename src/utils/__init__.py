@@ -1,6 +1,15 @@
 """Utility modules."""
 
 from .performance import PerformanceMonitor
+from .instrumentation import (
+    Instrumentation,
+    LatencyHistogram,
+    get_instrumentation,
+    stage,
+    timed
+)
+from .mailbox import EventQueue, LatestValueMailbox
+from .box_ops import iou_matrix, nms, soft_nms, weighted_box_fusion
 from .validators import (
     validate_frame,
     validate_face_region,
@@ -11,6 +20,17 @@ from .validators import (
 
 __all__ = [
     "PerformanceMonitor",
+    "Instrumentation",
+    "LatencyHistogram",
+    "get_instrumentation",
+    "stage",
+    "timed",
+    "LatestValueMailbox",
+    "EventQueue",
+    "iou_matrix",
+    "nms",
+    "soft_nms",
+    "weighted_box_fusion",
     "validate_frame",
     "validate_face_region",
     "validate_confidence",
@@ -0,0 +1,213 @@
+"""Vectorized operations on (N, 4) arrays of (x, y, width, height) boxes."""
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..data.models import FaceRegion
+
+
+def regions_to_boxes(regions: Sequence[FaceRegion]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stack face regions into arrays.
+
+    Args:
+        regions: Face regions
+
+    Returns:
+        ((N, 4) float64 boxes, (N,) float64 confidences)
+    """
+    boxes = np.array([r.to_tuple() for r in regions], dtype=np.float64).reshape(-1, 4)
+    scores = np.array([r.confidence for r in regions], dtype=np.float64)
+    return boxes, scores
+
+
+def boxes_to_regions(boxes: np.ndarray, scores: Optional[np.ndarray] = None) -> List[FaceRegion]:
+    """
+    Convert boxes (rounded to whole pixels) back to face regions.
+
+    Args:
+        boxes: (N, 4) boxes
+        scores: Optional (N,) confidences (default 1.0)
+
+    Returns:
+        Face regions in row order
+    """
+    boxes = np.rint(np.asarray(boxes, dtype=np.float64)).astype(np.int64).reshape(-1, 4)
+    scores = np.ones(len(boxes)) if scores is None else np.asarray(scores, dtype=np.float64)
+    return [
+        FaceRegion(x=x, y=y, width=w, height=h, confidence=score)
+        for (x, y, w, h), score in zip(boxes.tolist(), scores.tolist())
+    ]
+
+
+def box_centers(boxes: np.ndarray) -> np.ndarray:
+    """(N, 2) centers of (N, 4) boxes."""
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    return boxes[:, :2] + boxes[:, 2:] / 2
+
+
+def iou_matrix(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """
+    Pairwise intersection over union.
+
+    Args:
+        boxes_a: (N, 4) boxes
+        boxes_b: (M, 4) boxes
+
+    Returns:
+        (N, M) IoU values (0 where the union is empty)
+    """
+    a = np.asarray(boxes_a, dtype=np.float64).reshape(-1, 4)
+    b = np.asarray(boxes_b, dtype=np.float64).reshape(-1, 4)
+
+    x0 = np.maximum(a[:, None, 0], b[None, :, 0])
+    y0 = np.maximum(a[:, None, 1], b[None, :, 1])
+    x1 = np.minimum(a[:, None, 0] + a[:, None, 2], b[None, :, 0] + b[None, :, 2])
+    y1 = np.minimum(a[:, None, 1] + a[:, None, 3], b[None, :, 1] + b[None, :, 3])
+    intersection = np.clip(x1 - x0, 0, None) * np.clip(y1 - y0, 0, None)
+
+    union = (a[:, 2] * a[:, 3])[:, None] + (b[:, 2] * b[:, 3])[None, :] - intersection
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+
+def nms(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    iou_threshold: float = 0.5,
+    max_outputs: Optional[int] = None
+) -> np.ndarray:
+    """
+    Greedy non-maximum suppression.
+
+    Args:
+        boxes: (N, 4) boxes
+        scores: (N,) scores; higher boxes suppress lower ones
+        iou_threshold: Boxes overlapping a kept box by more than this are dropped
+        max_outputs: Optional cap on kept boxes
+
+    Returns:
+        Indices of kept boxes, by descending score
+    """
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    if len(boxes) == 0:
+        return np.zeros(0, dtype=np.intp)
+
+    order = np.argsort(-np.asarray(scores, dtype=np.float64), kind="stable")
+    kept = []
+    while order.size and (max_outputs is None or len(kept) < max_outputs):
+        best, order = order[0], order[1:]
+        kept.append(best)
+        order = order[iou_matrix(boxes[best], boxes[order])[0] <= iou_threshold]
+    return np.array(kept, dtype=np.intp)
+
+
+def soft_nms(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    sigma: float = 0.5,
+    score_threshold: float = 0.001,
+    method: str = "gaussian",
+    iou_threshold: float = 0.3
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Soft-NMS: decay the scores of overlapping boxes instead of dropping them.
+
+    Args:
+        boxes: (N, 4) boxes
+        scores: (N,) scores
+        sigma: Gaussian decay width ('gaussian')
+        score_threshold: Boxes whose decayed score falls below this are dropped
+        method: 'gaussian' (score *= exp(-iou^2 / sigma)) or 'linear'
+            (score *= 1 - iou above ``iou_threshold``)
+        iou_threshold: Overlap above which 'linear' decays scores
+
+    Returns:
+        (kept indices by descending decayed score, their decayed scores)
+    """
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    scores = np.array(scores, dtype=np.float64)
+    overlaps = iou_matrix(boxes, boxes)
+    remaining = np.arange(len(boxes))
+    kept, kept_scores = [], []
+    while remaining.size:
+        best = remaining[np.argmax(scores[remaining])]
+        if scores[best] < score_threshold:
+            break
+        kept.append(best)
+        kept_scores.append(scores[best])
+        remaining = remaining[remaining != best]
+
+        iou = overlaps[best, remaining]
+        if method == "linear":
+            decay = np.where(iou > iou_threshold, 1.0 - iou, 1.0)
+        else:
+            decay = np.exp(-(iou ** 2) / sigma)
+        scores[remaining] *= decay
+        remaining = remaining[scores[remaining] >= score_threshold]
+    return np.array(kept, dtype=np.intp), np.array(kept_scores, dtype=np.float64)
+
+
+def weighted_box_fusion(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    iou_threshold: float = 0.55,
+    num_sources: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fuse overlapping boxes into score-weighted averages.
+
+    Boxes are clustered greedily by descending score: each box joins the
+    cluster whose fused box it overlaps most, if by more than
+    ``iou_threshold``, else starts a new cluster. Unlike NMS, every box in a
+    cluster contributes to its position.
+
+    Args:
+        boxes: (N, 4) boxes (e.g. from several detectors or tiles)
+        scores: (N,) scores
+        iou_threshold: Overlap for joining a cluster
+        num_sources: Number of detectors that contributed boxes; if given,
+            clusters found by fewer sources get proportionally lower scores
+
+    Returns:
+        ((K, 4) fused boxes, (K,) fused scores), by descending score
+    """
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    scores = np.asarray(scores, dtype=np.float64)
+    if len(boxes) == 0:
+        return np.zeros((0, 4)), np.zeros(0)
+
+    order = np.argsort(-scores, kind="stable")
+    corners = np.concatenate([boxes[:, :2], boxes[:, :2] + boxes[:, 2:]], axis=1)
+    # Zero-score boxes still get a (negligible) weight
+    box_weights = np.maximum(scores, 1e-9)
+    weighted = np.zeros((len(boxes), 4))
+    weights = np.zeros(len(boxes))
+    score_sums = np.zeros(len(boxes))
+    counts = np.zeros(len(boxes), dtype=np.int64)
+    fused = np.zeros((len(boxes), 4))
+    clusters = 0
+    for i in order:
+        if clusters:
+            overlap = iou_matrix(boxes[i], fused[:clusters])[0]
+            best = int(np.argmax(overlap))
+            if overlap[best] > iou_threshold:
+                weighted[best] += box_weights[i] * corners[i]
+                weights[best] += box_weights[i]
+                score_sums[best] += scores[i]
+                counts[best] += 1
+                x0, y0, x1, y1 = weighted[best] / weights[best]
+                fused[best] = (x0, y0, x1 - x0, y1 - y0)
+                continue
+        weighted[clusters] = box_weights[i] * corners[i]
+        weights[clusters] = box_weights[i]
+        score_sums[clusters] = scores[i]
+        counts[clusters] = 1
+        fused[clusters] = boxes[i]
+        clusters += 1
+
+    fused_scores = score_sums[:clusters] / counts[:clusters]
+    if num_sources:
+        fused_scores *= np.minimum(counts[:clusters], num_sources) / num_sources
+    order = np.argsort(-fused_scores, kind="stable")
+    return fused[:clusters][order], fused_scores[order]
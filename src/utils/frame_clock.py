@@ -0,0 +1,104 @@
+"""Deadline-based frame scheduling."""
+
+import threading
+import time
+from typing import Callable, Optional
+
+from .instrumentation import LatencyHistogram
+
+
+class FrameClock:
+    """
+    Schedules frames on fixed deadlines instead of polling.
+
+    Each call to ``wait_next`` sleeps exactly until the next frame slot
+    (previous deadline + current interval), so the loop runs at the target
+    rate regardless of how long processing took, without a sleep floor and
+    without idle wakeups. ``stop`` releases a pending wait immediately.
+    Lateness of every wakeup against its
+    deadline is recorded as scheduling jitter; slots that are skipped
+    because processing overran by more than one interval are counted.
+    """
+
+    def __init__(self, interval: Callable[[], float]):
+        """
+        Initialize frame clock.
+
+        Args:
+            interval: Returns the current frame interval in seconds (read on
+                every tick, so adaptive frame rates take effect immediately)
+        """
+        self.interval = interval
+        self.jitter = LatencyHistogram()
+        self.missed_slots = 0
+        self.ticks = 0
+        self._deadline: Optional[float] = None
+        self._event = threading.Event()
+        self._stopped = False
+
+    def wait_next(self) -> bool:
+        """
+        Block until the next frame slot (or until stopped).
+
+        Returns:
+            False if the clock was stopped, True otherwise
+        """
+        if self._stopped:
+            return False
+
+        interval = max(self.interval(), 0.0)
+        now = time.monotonic()
+        if self._deadline is None:
+            self._deadline = now
+        else:
+            self._deadline += interval
+
+            # Overran by more than a slot: skip the missed slots, keep the phase
+            behind = now - self._deadline
+            if interval > 0 and behind > interval:
+                missed = int(behind // interval)
+                self.missed_slots += missed
+                self._deadline += missed * interval
+
+        timeout = self._deadline - now
+        if timeout > 0 and self._event.wait(timeout):
+            self._event.clear()
+            if self._stopped:
+                return False
+
+        lateness = time.monotonic() - self._deadline
+        self.jitter.record(int(max(lateness, 0.0) * 1e9))
+        self.ticks += 1
+        return not self._stopped
+
+    @property
+    def stopped(self) -> bool:
+        """Whether stop() was called since the last reset."""
+        return self._stopped
+
+    def idle(self, timeout: float) -> None:
+        """Sleep while there is nothing to schedule, waking early on stop()."""
+        if self._event.wait(timeout):
+            self._event.clear()
+        self._deadline = None
+
+    def stop(self) -> None:
+        """Stop the clock; pending and future waits return False."""
+        self._stopped = True
+        self._event.set()
+
+    def reset(self) -> None:
+        """Restart scheduling and statistics."""
+        self._stopped = False
+        self._event.clear()
+        self._deadline = None
+        self.jitter.reset()
+        self.missed_slots = 0
+        self.ticks = 0
+
+    def to_dict(self) -> dict:
+        """Jitter percentiles (ms) and slot counters."""
+        stats = self.jitter.to_dict()
+        stats["missed_slots"] = self.missed_slots
+        stats["ticks"] = self.ticks
+        return stats
@@ -0,0 +1,249 @@
+"""Low-overhead per-stage latency instrumentation."""
+
+import functools
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+# Sub-bucket resolution: 2**7 = 128 linear sub-buckets per power of two,
+# giving < 1% relative error on recorded values
+SUB_BUCKET_BITS = 7
+# Largest trackable latency: 2**36 ns (~68 s); longer values are clamped
+MAX_VALUE_BITS = 36
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket log-linear latency histogram (HDR-style).
+
+    Values are nanoseconds. Below 2**SUB_BUCKET_BITS ns buckets are exact;
+    above, each power of two is split into the same number of linear
+    sub-buckets, so recording is O(1) with a bounded relative error and the
+    memory footprint does not grow with the number of samples.
+    """
+
+    def __init__(self, sub_bucket_bits: int = SUB_BUCKET_BITS, max_value_bits: int = MAX_VALUE_BITS):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.sub_bucket_count = 1 << sub_bucket_bits
+        self.half_count = self.sub_bucket_count >> 1
+        self.max_value = (1 << max_value_bits) - 1
+        self.counts = [0] * (
+            self.sub_bucket_count + (max_value_bits - sub_bucket_bits) * self.half_count
+        )
+        self.total_count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def _index(self, value: int) -> int:
+        """Bucket index for a value in nanoseconds."""
+        if value < self.sub_bucket_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return self.sub_bucket_count + (shift - 1) * self.half_count + (value >> shift) - self.half_count
+
+    def _upper_bound(self, index: int) -> int:
+        """Highest value that falls into a bucket."""
+        if index < self.sub_bucket_count:
+            return index
+        shift, offset = divmod(index - self.sub_bucket_count, self.half_count)
+        shift += 1
+        return ((offset + self.half_count + 1) << shift) - 1
+
+    def record(self, value_ns: int) -> None:
+        """Record one latency in nanoseconds."""
+        value = min(max(int(value_ns), 0), self.max_value)
+        self.counts[self._index(value)] += 1
+        if self.total_count == 0 or value < self.min_ns:
+            self.min_ns = value
+        if value > self.max_ns:
+            self.max_ns = value
+        self.total_count += 1
+        self.total_ns += value
+
+    def percentile(self, percent: float) -> int:
+        """
+        Get a latency percentile.
+
+        Args:
+            percent: Percentile in [0, 100]
+
+        Returns:
+            Upper bound (ns) of the bucket holding the percentile, capped at
+            the largest recorded value; 0 if nothing was recorded
+        """
+        if self.total_count == 0:
+            return 0
+        target = max(1, -(-self.total_count * percent // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self._upper_bound(index), self.max_ns)
+        return self.max_ns
+
+    @property
+    def mean_ns(self) -> float:
+        """Mean recorded latency in nanoseconds."""
+        return self.total_ns / self.total_count if self.total_count else 0.0
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's samples (same bucket layout) to this one."""
+        if other.total_count == 0:
+            return
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.min_ns = other.min_ns if self.total_count == 0 else min(self.min_ns, other.min_ns)
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.total_count += other.total_count
+        self.total_ns += other.total_ns
+
+    def reset(self) -> None:
+        """Discard all samples."""
+        self.counts = [0] * len(self.counts)
+        self.total_count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def to_dict(self) -> dict:
+        """Summary in milliseconds."""
+        return {
+            "count": self.total_count,
+            "mean_ms": self.mean_ns / 1e6,
+            "p50_ms": self.percentile(50) / 1e6,
+            "p95_ms": self.percentile(95) / 1e6,
+            "p99_ms": self.percentile(99) / 1e6,
+            "max_ms": self.max_ns / 1e6
+        }
+
+
+class _Stage:
+    """Active timing of one stage; records into its histogram on exit."""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: LatencyHistogram):
+        self._histogram = histogram
+        self._start = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._histogram.record(time.perf_counter_ns() - self._start)
+        return False
+
+
+class _NullStage:
+    """Shared no-op context used while instrumentation is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Instrumentation:
+    """
+    Registry of named latency histograms.
+
+    Stages are timed with ``with instrumentation.stage("detect"): ...`` or the
+    ``timed`` decorator. While disabled, ``stage`` returns a shared no-op
+    context, so the hot path costs one attribute check and no allocation.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        """Get (creating if needed) the histogram for a stage."""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(name, LatencyHistogram())
+        return histogram
+
+    def stage(self, name: str):
+        """
+        Time a block of code.
+
+        Args:
+            name: Stage name, e.g. 'detect' or 'model.DeepFace'
+
+        Returns:
+            Context manager recording the block's latency
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self.histogram(name))
+
+    def record(self, name: str, value_ns: int) -> None:
+        """Record an externally measured latency in nanoseconds."""
+        if self.enabled:
+            self.histogram(name).record(value_ns)
+
+    def timed(self, name: Optional[str] = None) -> Callable:
+        """
+        Decorator timing every call of a function.
+
+        Args:
+            name: Stage name (default: the function's qualified name)
+        """
+        def decorator(func: Callable) -> Callable:
+            stage_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.histogram(stage_name).record(time.perf_counter_ns() - start)
+
+            return wrapper
+        return decorator
+
+    def summary(self) -> Dict[str, dict]:
+        """Per-stage latency summaries in milliseconds."""
+        return {
+            name: histogram.to_dict()
+            for name, histogram in sorted(self.histograms.items())
+            if histogram.total_count
+        }
+
+    def reset(self) -> None:
+        """Discard all recorded samples."""
+        with self._lock:
+            self.histograms.clear()
+
+
+# Process-wide registry shared by the pipeline components
+_default = Instrumentation()
+
+
+def get_instrumentation() -> Instrumentation:
+    """Get the process-wide instrumentation registry."""
+    return _default
+
+
+def stage(name: str):
+    """Time a block of code in the process-wide registry."""
+    return _default.stage(name) if _default.enabled else _NULL_STAGE
+
+
+def timed(name: Optional[str] = None) -> Callable:
+    """Decorator timing a function in the process-wide registry."""
+    return _default.timed(name)
@@ -0,0 +1,149 @@
+"""Thread handoffs: a single-slot latest value and a bounded event queue."""
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Generic, List, Optional, TypeVar
+
+from .instrumentation import LatencyHistogram
+from .metrics_server import Metric, add_histogram, counter, gauge
+
+T = TypeVar("T")
+
+
+class LatestValueMailbox(Generic[T]):
+    """
+    Holds only the newest published value.
+
+    The producer never blocks: ``publish`` replaces whatever is waiting, so
+    values the consumer did not get to are coalesced (dropped) instead of
+    queueing up behind it. The consumer polls ``take`` at its own rate (e.g.
+    the display refresh rate) and receives each value at most once. The age
+    of every delivered value is recorded, bounding how stale the consumer's
+    view can get.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value: Optional[T] = None
+        self._published_ns = 0
+        self._pending = False
+        self.published = 0
+        self.delivered = 0
+        self.coalesced = 0
+        self.age = LatencyHistogram()
+
+    def publish(self, value: T) -> None:
+        """
+        Replace the waiting value (producer side, never blocks on the consumer).
+
+        Args:
+            value: Newest value
+        """
+        now = time.monotonic_ns()
+        with self._lock:
+            if self._pending:
+                self.coalesced += 1
+            self._value = value
+            self._published_ns = now
+            self._pending = True
+            self.published += 1
+
+    def take(self) -> Optional[T]:
+        """
+        Take the newest value if it was not taken yet (consumer side).
+
+        Returns:
+            The newest unseen value, or None if nothing new was published
+        """
+        with self._lock:
+            if not self._pending:
+                return None
+            value = self._value
+            self._value = None
+            self._pending = False
+            self.delivered += 1
+            published_ns = self._published_ns
+        self.age.record(time.monotonic_ns() - published_ns)
+        return value
+
+    @property
+    def pending(self) -> int:
+        """Values waiting for the consumer (0 or 1)."""
+        return int(self._pending)
+
+    def reset(self) -> None:
+        """Drop the waiting value and clear statistics."""
+        with self._lock:
+            self._value = None
+            self._pending = False
+            self.published = 0
+            self.delivered = 0
+            self.coalesced = 0
+        self.age.reset()
+
+    def collect_metrics(self, namespace: str, name: str = "ui") -> List[Metric]:
+        """
+        Export queue depth, handoff counters and delivered-value age.
+
+        Args:
+            namespace: Metric name prefix
+            name: Mailbox name, used as a metric name component
+
+        Returns:
+            Metric families for the metrics endpoint
+        """
+        prefix = f"{namespace}_{name}"
+        return [
+            gauge(f"{prefix}_queue_depth", "Results waiting for the consumer", self.pending),
+            counter(f"{prefix}_published_total", "Results published by the worker", self.published),
+            counter(f"{prefix}_delivered_total", "Results taken by the consumer", self.delivered),
+            counter(f"{prefix}_coalesced_total", "Results replaced before the consumer took them",
+                    self.coalesced),
+            add_histogram(
+                Metric(f"{prefix}_result_age_seconds", "summary",
+                       "Time from publishing a result to the consumer taking it"),
+                self.age
+            ),
+        ]
+
+
+class EventQueue(Generic[T]):
+    """
+    Bounded queue of events that must not be coalesced (e.g. alerts).
+
+    Results go through a LatestValueMailbox, which drops the ones the
+    consumer had no time for; events derived from every result go through
+    this queue instead, so each is delivered even when the consumer lags.
+    Past ``maxlen`` waiting events the oldest are dropped and counted.
+    """
+
+    def __init__(self, maxlen: int = 256):
+        """
+        Initialize event queue.
+
+        Args:
+            maxlen: Most events kept waiting for the consumer
+        """
+        self._lock = threading.Lock()
+        self._events: Deque[T] = deque(maxlen=maxlen)
+        self.dropped = 0
+
+    def put(self, event: T) -> None:
+        """Queue an event (producer side, never blocks on the consumer)."""
+        with self._lock:
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+            self._events.append(event)
+
+    def drain(self) -> List[T]:
+        """
+        Take every waiting event (consumer side).
+
+        Returns:
+            Events in the order they were queued
+        """
+        with self._lock:
+            events = list(self._events)
+            self._events.clear()
+        return events
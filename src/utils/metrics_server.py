@@ -0,0 +1,193 @@
+"""Local Prometheus-format metrics endpoint."""
+
+import math
+import threading
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .instrumentation import Instrumentation, LatencyHistogram
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_NAMESPACE = "facial_detection"
+
+# Quantiles exported for every latency histogram
+SUMMARY_QUANTILES = (0.5, 0.95, 0.99)
+
+
+@dataclass
+class Metric:
+    """One metric family in the Prometheus text exposition format."""
+    name: str
+    kind: str  # 'gauge', 'counter' or 'summary'
+    help: str
+    samples: List[Tuple[str, Dict[str, str], float]] = field(default_factory=list)
+
+    def add(self, value: float, suffix: str = "", **labels: str) -> "Metric":
+        """Add a sample (suffix is appended to the name, e.g. '_sum')."""
+        self.samples.append((suffix, labels, value))
+        return self
+
+
+def gauge(name: str, help: str, value: float, **labels: str) -> Metric:
+    """Single-sample gauge."""
+    return Metric(name, "gauge", help).add(value, **labels)
+
+
+def counter(name: str, help: str, value: float, **labels: str) -> Metric:
+    """Single-sample counter."""
+    return Metric(name, "counter", help).add(value, **labels)
+
+
+def add_histogram(metric: Metric, histogram: LatencyHistogram, **labels: str) -> Metric:
+    """Add a latency histogram to a summary metric, in seconds."""
+    if histogram.total_count:
+        for quantile in SUMMARY_QUANTILES:
+            metric.add(histogram.percentile(quantile * 100) / 1e9, **labels, quantile=str(quantile))
+        metric.add(histogram.total_ns / 1e9, "_sum", **labels)
+        metric.add(histogram.total_count, "_count", **labels)
+    return metric
+
+
+def latency_summaries(name: str, help: str, instrumentation: Instrumentation) -> Metric:
+    """
+    Export every stage histogram as a summary in seconds.
+
+    Quantiles are cumulative since the histograms were last reset (the start
+    of the session).
+    """
+    metric = Metric(name, "summary", help)
+    for stage, histogram in sorted(instrumentation.histograms.items()):
+        add_histogram(metric, histogram, stage=stage)
+    return metric
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_metrics(metrics: List[Metric]) -> str:
+    """Render metric families in the Prometheus text exposition format."""
+    lines = []
+    for metric in metrics:
+        if not metric.samples:
+            continue
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for suffix, labels, value in metric.samples:
+            label_text = ""
+            if labels:
+                label_text = "{" + ",".join(
+                    f'{key}="{_escape(str(val))}"' for key, val in labels.items()
+                ) + "}"
+            lines.append(f"{metric.name}{suffix}{label_text} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """
+    Serves metrics over HTTP for scraping.
+
+    Collectors are callables returning a list of Metric; they are invoked on
+    every scrape of ``/metrics`` from the server thread, so they should only
+    read state. The server binds to localhost unless configured otherwise.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 9464):
+        """
+        Initialize metrics server.
+
+        Args:
+            host: Interface to bind (default: localhost only)
+            port: TCP port (0 picks a free port)
+        """
+        self.host = host
+        self.port = port
+        self.collectors: List[Callable[[], List[Metric]]] = []
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def add_collector(self, collector: Callable[[], List[Metric]]) -> None:
+        """Register a callable that returns metrics on each scrape."""
+        self.collectors.append(collector)
+
+    def collect(self) -> str:
+        """Run all collectors and render the exposition text."""
+        metrics: List[Metric] = []
+        for collector in self.collectors:
+            try:
+                metrics.extend(collector())
+            except Exception as e:
+                print(f"Metrics collector error: {e}")
+        return render_metrics(metrics)
+
+    def start(self) -> bool:
+        """
+        Start serving in a background thread.
+
+        Returns:
+            True if the server is listening
+        """
+        if self._server is not None:
+            return True
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = server.collect().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Scrapes are periodic; keep them out of the console
+                pass
+
+        try:
+            self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        except OSError as e:
+            print(f"Failed to start metrics server on {self.host}:{self.port}: {e}")
+            self._server = None
+            return False
+
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-server", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    @property
+    def url(self) -> str:
+        """Scrape URL."""
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
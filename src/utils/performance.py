@@ -1,90 +1,254 @@
 """Performance monitoring and adaptive frame rate management."""
 
 import time
+from collections import deque
 import psutil
-from typing import Optional
+from typing import Dict, List, Optional
 from ..data.models import PerformanceMetrics
+from .instrumentation import Instrumentation, get_instrumentation
+from .metrics_server import Metric, gauge, counter, latency_summaries, DEFAULT_NAMESPACE
 
 
 class PerformanceMonitor:
-    """Monitors system performance and adjusts frame rate adaptively."""
+    """
+    Monitors system performance and adjusts frame rate adaptively.
+
+    A PI controller keeps the smoothed fraction of wall time spent processing
+    (frame time x FPS) at ``target_utilization`` and CPU usage under
+    ``target_cpu_percent``, whichever is more constrained. It runs in
+    velocity form: each interval scales the frame rate by the change in
+    error (P) plus the error itself (I), so the frame rate is the only
+    accumulated state and clamping it cannot wind anything up. A deadband
+    around the setpoint provides hysteresis, CPU is sampled at a fixed low
+    rate, and
+    when the frame rate is pinned at ``min_fps`` while still overloaded the
+    controller steps up ``degradation_level`` so the pipeline can trade
+    detection resolution and models for throughput.
+    """
 
     def __init__(
         self,
         initial_fps: int = 10,
         min_fps: int = 5,
         max_fps: int = 30,
-        target_cpu_percent: float = 70.0
+        target_cpu_percent: float = 70.0,
+        instrumentation: Optional[Instrumentation] = None,
+        target_utilization: float = 0.8,
+        control_interval: float = 0.5,
+        cpu_sample_interval: float = 1.0,
+        smoothing: float = 0.2,
+        kp: float = 0.5,
+        ki: float = 0.2,
+        deadband: float = 0.1,
+        max_degradation_level: int = 0,
+        degradation_hold: int = 3
     ):
         self.initial_fps = initial_fps
-        self.min_fps = min_fps
+        self.min_fps = max(min_fps, 1)
         self.max_fps = max_fps
         self.target_cpu_percent = target_cpu_percent
 
-        self.current_fps = initial_fps
-        self.frame_times = []
+        self.current_fps = float(initial_fps)
         self.max_frame_time_samples = 30
+        self.frame_times = deque(maxlen=self.max_frame_time_samples)
+
+        # Controller settings
+        self.target_utilization = target_utilization
+        self.control_interval = control_interval
+        self.cpu_sample_interval = cpu_sample_interval
+        self.smoothing = smoothing
+        self.kp = kp
+        self.ki = ki
+        self.deadband = deadband
+        self.max_degradation_level = max_degradation_level
+        self.degradation_hold = degradation_hold
+
+        # Controller state
+        self.smoothed_frame_time: Optional[float] = None
+        self.cpu_percent: Optional[float] = None
+        self.degradation_level = 0
+        self._last_error: Optional[float] = None
+        self._last_control: Optional[float] = None
+        self._last_cpu_sample = 0.0
+        self._overload_count = 0
+        self._underload_count = 0
+
+        # Per-stage latency histograms (shared with the pipeline components)
+        self.instrumentation = instrumentation or get_instrumentation()
 
         self.process = psutil.Process()
+        self.process.cpu_percent()  # Prime the interval measurement
+        self._last_cpu_sample = time.monotonic()
         self.dropped_frames = 0
 
     def record_frame_time(self, processing_time: float) -> None:
         """Record processing time for a frame."""
         self.frame_times.append(processing_time)
-        if len(self.frame_times) > self.max_frame_time_samples:
-            self.frame_times.pop(0)
+        if self.smoothed_frame_time is None:
+            self.smoothed_frame_time = processing_time
+        else:
+            self.smoothed_frame_time += self.smoothing * (processing_time - self.smoothed_frame_time)
+        self.instrumentation.record("frame", int(processing_time * 1e9))
+
+    def sample_cpu(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Sample process CPU usage at most once per cpu_sample_interval.
+
+        Args:
+            now: Current monotonic time (default: time.monotonic())
+
+        Returns:
+            Smoothed CPU percent, or None before the first full interval
+        """
+        now = time.monotonic() if now is None else now
+        if now - self._last_cpu_sample >= self.cpu_sample_interval:
+            sample = self.process.cpu_percent()
+            self._last_cpu_sample = now
+            if self.cpu_percent is None:
+                self.cpu_percent = sample
+            else:
+                self.cpu_percent += self.smoothing * (sample - self.cpu_percent)
+        return self.cpu_percent
+
+    def get_stage_latencies(self) -> Dict[str, dict]:
+        """
+        Get per-stage latency percentiles.
+
+        Returns:
+            Mapping of stage name to count, mean, p50, p95, p99 and max in
+            milliseconds (empty while instrumentation is disabled)
+        """
+        return self.instrumentation.summary()
 
     def get_metrics(self) -> PerformanceMetrics:
         """Get current performance metrics."""
-        cpu_percent = self.process.cpu_percent()
+        cpu_percent = self.sample_cpu()
         memory_mb = self.process.memory_info().rss / 1024 / 1024
 
         return PerformanceMetrics(
-            cpu_percent=cpu_percent,
+            cpu_percent=cpu_percent if cpu_percent is not None else 0.0,
             memory_mb=memory_mb,
             current_fps=self.current_fps,
             target_fps=self.target_fps,
-            dropped_frames=self.dropped_frames
+            dropped_frames=self.dropped_frames,
+            stage_latencies=self.get_stage_latencies()
         )
 
-    def adapt_frame_rate(self) -> int:
+    def collect_metrics(self, namespace: str = DEFAULT_NAMESPACE) -> List[Metric]:
+        """
+        Export frame rate, drops, process resources and stage latencies.
+
+        Process CPU is reported as cumulative CPU seconds so that scraping
+        does not disturb the interval sampling used by adapt_frame_rate.
+
+        Args:
+            namespace: Metric name prefix
+
+        Returns:
+            Metric families for the metrics endpoint
+        """
+        cpu_times = self.process.cpu_times()
+        metrics = [
+            gauge(f"{namespace}_fps", "Current target processing frame rate", self.current_fps),
+            gauge(f"{namespace}_degradation_level", "Current quality degradation level",
+                  self.degradation_level),
+            counter(f"{namespace}_dropped_frames_total", "Frames dropped by the pipeline", self.dropped_frames),
+            gauge("process_resident_memory_bytes", "Resident memory size in bytes",
+                  self.process.memory_info().rss),
+            counter("process_cpu_seconds_total", "Total user and system CPU time in seconds",
+                    cpu_times.user + cpu_times.system),
+        ]
+        if self.frame_times:
+            metrics.append(gauge(
+                f"{namespace}_frame_time_seconds",
+                "Mean processing time of recent frames",
+                sum(self.frame_times) / len(self.frame_times)
+            ))
+        metrics.append(latency_summaries(
+            f"{namespace}_stage_latency_seconds",
+            "Per-stage and per-model latency",
+            self.instrumentation
+        ))
+        return metrics
+
+    def adapt_frame_rate(self, now: Optional[float] = None) -> float:
         """
         Adjust frame rate based on system performance.
 
+        Runs the controller at most once per control_interval; calls in
+        between return the current target unchanged.
+
+        Args:
+            now: Current monotonic time (default: time.monotonic())
+
         Returns:
-            New target FPS
+            New target FPS (never below min_fps)
         """
-        if not self.frame_times:
+        if self.smoothed_frame_time is None:
             return self.current_fps
 
-        # Get average processing time
-        avg_time = sum(self.frame_times) / len(self.frame_times)
-        cpu_percent = self.process.cpu_percent()
+        now = time.monotonic() if now is None else now
+        if self._last_control is not None and now - self._last_control < self.control_interval:
+            return self.current_fps
+        dt = self.control_interval if self._last_control is None else now - self._last_control
+        self._last_control = now
 
-        # Calculate theoretical max FPS based on processing time
-        if avg_time > 0:
-            theoretical_fps = 1.0 / avg_time
-        else:
-            theoretical_fps = self.max_fps
-
-        # Adjust based on CPU usage
-        if cpu_percent > self.target_cpu_percent:
-            # Reduce FPS
-            new_fps = max(self.min_fps, self.current_fps - 1)
-        elif cpu_percent < self.target_cpu_percent * 0.7 and theoretical_fps > self.current_fps:
-            # Increase FPS if we have headroom
-            new_fps = min(self.max_fps, self.current_fps + 1)
+        error = self._control_error(now)
+        last_error = error if self._last_error is None else self._last_error
+        self._last_error = error
+
+        # Hysteresis: hold the frame rate inside the deadband
+        if abs(error) <= self.deadband:
+            adjustment = 0.0
         else:
-            new_fps = self.current_fps
+            # Velocity-form PI on the log frame rate: the multiplicative
+            # update integrates, so ki acts on the error and kp on its change
+            adjustment = self.kp * (error - last_error) + self.ki * error * dt / self.control_interval
+            adjustment = min(max(adjustment, -0.5), 0.5)
+        new_fps = self.current_fps * (1.0 - adjustment)
+
+        # Never schedule more work than the measured frame time can sustain
+        if self.smoothed_frame_time > 0:
+            new_fps = min(new_fps, self.target_utilization / self.smoothed_frame_time)
 
-        # Ensure we don't exceed theoretical limit
-        new_fps = min(new_fps, int(theoretical_fps * 0.9))
+        new_fps = min(max(new_fps, self.min_fps), self.max_fps)
+        self._update_degradation(error, new_fps)
+
+        self.current_fps = round(new_fps, 1)
+        return self.current_fps
 
-        self.current_fps = new_fps
-        return new_fps
+    def _control_error(self, now: float) -> float:
+        """Relative overload (> 0) or headroom (< 0) against the setpoints."""
+        utilization = self.smoothed_frame_time * self.current_fps
+        error = utilization / self.target_utilization - 1.0
+
+        cpu_percent = self.sample_cpu(now)
+        if cpu_percent is not None and self.target_cpu_percent > 0:
+            error = max(error, cpu_percent / self.target_cpu_percent - 1.0)
+
+        return min(max(error, -1.0), 1.0)
+
+    def _update_degradation(self, error: float, new_fps: float) -> None:
+        """Step the degradation level once FPS alone cannot absorb the load."""
+        if error > 0 and new_fps <= self.min_fps:
+            self._overload_count += 1
+            self._underload_count = 0
+            if self._overload_count >= self.degradation_hold and \
+                    self.degradation_level < self.max_degradation_level:
+                self.degradation_level += 1
+                self._overload_count = 0
+        elif error < 0 and self.degradation_level > 0:
+            self._underload_count += 1
+            self._overload_count = 0
+            if self._underload_count >= self.degradation_hold:
+                self.degradation_level -= 1
+                self._underload_count = 0
+        else:
+            self._overload_count = 0
+            self._underload_count = 0
 
     @property
-    def target_fps(self) -> int:
+    def target_fps(self) -> float:
         """Get target FPS."""
         return self.current_fps
 
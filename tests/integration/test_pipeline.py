@@ -1,6 +1,7 @@
 """Integration tests for the full detection pipeline."""
 
 import pytest
+from pathlib import Path
 import numpy as np
 
 from src.core.session_manager import SessionManager
@@ -20,7 +21,7 @@ class TestDetectionPipeline:
 
         assert success is True
         assert session.is_initialized is True
-        assert session.screen_capture is not None
+        assert session.frame_source is not None
         assert session.face_detector is not None
         assert session.emotion_detector is not None
         assert session.deception_detector is not None
@@ -74,3 +75,156 @@ class TestSessionLogging:
 
         assert logger.session_metadata is not None
         assert logger.session_metadata.session_id == "test_session"
+
+    def test_columnar_session_roundtrip(self, test_config, tmp_path):
+        """Test that columnar sessions save and load as columns."""
+        from src.data.logger import SessionLogger
+        from src.data.models import FaceAnalysis, FaceRegion
+
+        test_config['logging'].update({
+            'enabled': True,
+            'directory': str(tmp_path),
+            'format': 'columnar',
+            'columnar': {'chunk_frames': 4}
+        })
+
+        logger = SessionLogger(test_config)
+        logger.start_session("columnar", test_config)
+
+        for i in range(10):
+            face = FaceAnalysis(
+                face_id=0,
+                region=FaceRegion(x=10 + i, y=20, width=50, height=60),
+                emotion="happy" if i % 2 else "sad",
+                confidence=0.75,
+                is_deceptive=(i == 3),
+                deception_confidence=0.9 if i == 3 else 0.0,
+                deception_reason="Model disagreement" if i == 3 else None
+            )
+            logger.log_frame(FrameAnalysis(
+                frame_number=i,
+                faces=[face],
+                fps=10.0
+            ))
+
+        logger.save_session()
+        assert logger.current_file_path.endswith(".npz")
+
+        data = logger.load_session(logger.current_file_path)
+        assert data["frames"]["frame_number"].tolist() == list(range(10))
+        assert data["faces"]["bbox"][:, 0].tolist() == [10 + i for i in range(10)]
+        assert data["metadata"]["average_fps"] == pytest.approx(10.0)
+
+        exported = tmp_path / "exported.json"
+        logger.export_json(logger.current_file_path, str(exported))
+
+        import json
+        log = json.loads(exported.read_text())
+        assert len(log["frames"]) == 10
+        assert log["frames"][1]["faces"][0]["emotion"] == "happy"
+        assert log["frames"][3]["faces"][0]["deception"]["reason"] == "Model disagreement"
+
+    def test_columnar_reader_queries(self, test_config, tmp_path):
+        """Test indexed time-range and deception queries on a mapped session."""
+        from datetime import datetime, timedelta
+        from src.data.logger import SessionLogger
+        from src.data.models import FaceAnalysis, FaceRegion, datetime_to_monotonic_ns
+
+        test_config['logging'].update({
+            'enabled': True,
+            'directory': str(tmp_path),
+            'format': 'columnar',
+            'columnar': {'chunk_frames': 8}
+        })
+
+        logger = SessionLogger(test_config)
+        logger.start_session("reader", test_config)
+
+        start = datetime(2024, 1, 1, 12, 0, 0)
+        for i in range(40):
+            faces = [
+                FaceAnalysis(
+                    face_id=k,
+                    region=FaceRegion(x=100 * k, y=0, width=50, height=50),
+                    emotion="neutral",
+                    confidence=0.5,
+                    is_deceptive=(k == 1 and i in (5, 33)),
+                    deception_confidence=0.85
+                )
+                for k in range(2)
+            ]
+            logger.log_frame(FrameAnalysis(
+                frame_number=i,
+                timestamp_ns=datetime_to_monotonic_ns(start + timedelta(seconds=i)),
+                faces=faces
+            ))
+        logger.save_session()
+
+        with logger.open_session(logger.current_file_path) as reader:
+            assert reader.chunk_count == 5
+
+            t0 = (start + timedelta(seconds=10)).timestamp()
+            t1 = (start + timedelta(seconds=19)).timestamp()
+            assert reader.chunks_for_time(t0, t1) == [1, 2]
+
+            window = reader.frames_between(t0, t1)
+            assert window["frames"]["frame_number"].tolist() == list(range(10, 20))
+            assert len(window["faces"]["face_id"]) == 20
+
+            events = reader.deception_events(1)
+            assert events["frame_number"].tolist() == [5, 33]
+            assert len(events["timestamp"]) == 2
+            assert reader.deception_events(0)["frame_number"].size == 0
+
+
+class TestHeadless:
+    """Test the headless runner and offline frame sources."""
+
+    def test_headless_does_not_import_qt(self):
+        """Test that the headless entry point never imports Qt."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, src.headless; "
+            "sys.exit(any(name.startswith('PyQt') for name in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=str(Path(__file__).parents[2]))
+        assert result.returncode == 0
+
+    def test_image_directory_source(self, tmp_path):
+        """Test images are read in name order until exhausted."""
+        import cv2
+        from src.core.frame_sources import ImageDirectorySource
+
+        for i in range(3):
+            cv2.imwrite(str(tmp_path / f"{i:02d}.png"), np.full((8, 8, 3), i * 50, dtype=np.uint8))
+
+        source = ImageDirectorySource(str(tmp_path), fps=10.0)
+        frames = []
+        while True:
+            captured = source.read()
+            if captured is None:
+                break
+            frames.append(captured)
+
+        assert [int(f.image[0, 0, 0]) for f in frames] == [0, 50, 100]
+        assert [f.media_time_ns for f in frames] == [0, 100_000_000, 200_000_000]
+        assert source.exhausted
+
+    def test_synthetic_source_is_deterministic(self):
+        """Test the same seed yields identical frames and ground truth."""
+        from src.core.frame_sources import SyntheticSource
+
+        first = SyntheticSource(width=320, height=240, num_faces=2, face_size=48, frames=5, seed=3)
+        second = SyntheticSource(width=320, height=240, num_faces=2, face_size=48, frames=5, seed=3)
+
+        for index in range(5):
+            a, b = first.read(), second.read()
+            assert np.array_equal(a.image, b.image)
+            assert a.media_time_ns == b.media_time_ns
+            for x, y, w, h in first.boxes_at(index):
+                assert 0 <= x <= 320 - w and 0 <= y <= 240 - h
+
+        assert first.read() is None
+        assert first.exhausted
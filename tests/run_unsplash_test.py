@@ -19,7 +19,7 @@ import math
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.core.session_manager import SessionManager
-from src.main import load_config
+from src.config import load_config
 
 EXPECTED_FACES = 12
 TEST_DURATION = 5  # seconds
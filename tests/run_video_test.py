@@ -18,7 +18,7 @@ import math
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.core.session_manager import SessionManager
-from src.main import load_config
+from src.config import load_config
 
 TEST_DURATION = 10  # seconds
 MIN_DETECTION_RATE = 0.5  # At least 50% of frames should have faces
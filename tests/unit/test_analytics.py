@@ -0,0 +1,64 @@
+"""Unit tests for offline session analytics."""
+
+import pytest
+import numpy as np
+
+from src.analytics.session_stats import SessionColumns, summarize_columns, merge_summaries
+
+
+def make_columns(face_ids, times, emotions, deceptive=None):
+    """Build SessionColumns with one face observation per frame."""
+    n = len(face_ids)
+    return SessionColumns(
+        session_id="test",
+        emotions=["happy", "sad", "neutral"],
+        frame_number=np.arange(n),
+        frame_timestamp=np.asarray(times, dtype=np.float64),
+        processing_time_ms=np.linspace(10, 100, n).astype(np.float32),
+        face_count=np.ones(n, dtype=np.int64),
+        face_frame_number=np.arange(n),
+        face_timestamp=np.asarray(times, dtype=np.float64),
+        face_id=np.asarray(face_ids),
+        emotion=np.asarray(emotions),
+        confidence=np.ones(n, dtype=np.float32),
+        deceptive=np.asarray(deceptive if deceptive is not None else [False] * n)
+    )
+
+
+class TestSessionSummary:
+    """Test vectorized session aggregates."""
+
+    def test_dwell_and_transitions(self):
+        """Test dwell times and transition counts per face."""
+        columns = make_columns(
+            face_ids=[0, 0, 0, 0, 1, 1],
+            times=[0.0, 1.0, 2.0, 10.0, 0.0, 0.5],
+            emotions=[0, 0, 1, 0, 2, 2],
+            deceptive=[False, False, True, False, False, True]
+        )
+
+        summary = summarize_columns(columns, max_gap_s=2.0)
+
+        # Face 0: happy 0-2s, the 2s->10s gap is not counted
+        assert summary.per_face_dwell_s[0].tolist() == [2.0, 0.0, 0.0]
+        assert summary.per_face_dwell_s[1].tolist() == [0.0, 0.0, 0.5]
+        assert summary.transitions[0, 1] == 1  # happy -> sad
+        assert summary.transitions[1, 0] == 0  # exceeded max gap
+        assert summary.deception_events == 2
+        assert summary.per_face_deception_events == {0: 1, 1: 1}
+        assert summary.face_count_hist.tolist() == [0, 6]
+
+    def test_merge_aligns_vocabularies(self):
+        """Test merging summaries with different emotion vocabularies."""
+        a = summarize_columns(make_columns([0, 0], [0.0, 1.0], [0, 1]))
+        other = make_columns([0, 0], [0.0, 1.0], [0, 0])
+        other.emotions = ["sad", "angry", "happy"]
+        b = summarize_columns(other)
+
+        merged = merge_summaries([a, b])
+
+        assert merged.sessions == 2
+        assert merged.emotions == ["happy", "sad", "neutral", "angry"]
+        assert merged.dwell_s[0] == pytest.approx(1.0)  # happy from a
+        assert merged.dwell_s[1] == pytest.approx(1.0)  # sad from b
+        assert merged.processing_percentiles()["p50"] == pytest.approx(55.0)
@@ -0,0 +1,117 @@
+"""Unit tests for the benchmark suite."""
+
+import json
+
+import pytest
+
+from src.benchmarks.suite import measure, run_suite
+
+
+class TestBenchmarkSuite:
+    """Test benchmark measurement and reports."""
+
+    def test_measure_skips_warmup(self):
+        """Test warmup calls are run but not recorded."""
+        calls = []
+        result = measure(
+            "stage", "scenario", calls.append, ((i,) for i in range(5)),
+            faces=2, unit="face", items_per_call=2, warmup=2
+        )
+
+        assert calls == [0, 1, 2, 3, 4]
+        assert result.name == "stage/scenario"
+        assert result.items == 6
+        assert result.latency["count"] == 3
+        assert result.peak_rss_bytes > 0
+
+    def test_report_is_json_with_unique_names(self, test_config):
+        """Test a small run produces a serializable report keyed by name."""
+        report = run_suite(
+            test_config,
+            face_counts=[1, 2],
+            frames=3,
+            warmup=1,
+            stages=["ensemble", "deception", "logger"]
+        )
+
+        names = [result["name"] for result in report["results"]]
+        assert len(names) == len(set(names)) == 8
+        assert "logger.columnar/2faces" in names
+        assert all(result["items"] > 0 for result in report["results"])
+        json.dumps(report)
+
+
+def make_report(throughputs, p99=1.0):
+    """Report with one benchmark whose throughput varies across runs."""
+    return {
+        "environment": {},
+        "runs": len(throughputs),
+        "results": [{
+            "name": "face_detector/720p/1faces",
+            "stage": "face_detector",
+            "scenario": "720p/1faces",
+            "samples": {
+                "throughput_per_s": list(throughputs),
+                "p99_ms": [p99] * len(throughputs),
+            },
+        }],
+    }
+
+
+class TestRegressionGate:
+    """Test noise-aware comparison of benchmark reports."""
+
+    def test_significant_slowdown_is_flagged(self):
+        """Test a consistent throughput drop beyond the threshold fails the gate."""
+        from src.benchmarks.regression import compare_reports
+
+        comparison = compare_reports(make_report([100, 101, 99, 100]), make_report([80, 81, 79, 80]))
+
+        assert not comparison.passed
+        [regression] = comparison.regressions
+        assert regression.metric == "throughput_per_s"
+        assert regression.change == pytest.approx(0.2)
+        assert regression.ci_low > 0
+
+    def test_noisy_change_is_not_flagged(self):
+        """Test a drop within run-to-run noise passes."""
+        from src.benchmarks.regression import compare_reports
+
+        comparison = compare_reports(make_report([100, 60, 140, 100]), make_report([85, 50, 120, 85]))
+
+        assert comparison.passed
+        assert comparison.comparisons[0].ci_low < 0
+
+    def test_missing_benchmarks_fail(self):
+        """Test gated benchmarks absent from the candidate fail unless allowed."""
+        from src.benchmarks.regression import compare_reports
+
+        broken = make_report([100])
+        broken["results"][0]["skipped"] = "initialization failed"
+
+        comparison = compare_reports(make_report([100]), broken)
+        assert comparison.missing == ["face_detector/720p/1faces"]
+        assert not comparison.passed
+        assert compare_reports(make_report([100]), broken, allow_missing=True).passed
+
+    def test_rss_delta_near_zero_is_not_flagged(self):
+        """Test tiny memory deltas are compared against a floor, not their own size."""
+        from src.benchmarks.regression import compare_reports
+
+        baseline, candidate = make_report([100]), make_report([100])
+        baseline["results"][0]["samples"]["rss_delta_bytes"] = [4096]
+        candidate["results"][0]["samples"]["rss_delta_bytes"] = [65536]
+        assert compare_reports(baseline, candidate).passed
+
+        candidate["results"][0]["samples"]["rss_delta_bytes"] = [64 * 2**20]
+        [regression] = compare_reports(baseline, candidate).regressions
+        assert regression.metric == "rss_delta_bytes"
+
+    def test_ungated_stages_are_ignored(self):
+        """Test only the gated stage prefixes are compared."""
+        from src.benchmarks.regression import compare_reports
+
+        comparison = compare_reports(make_report([100]), make_report([50]), stages=["logger."])
+
+        assert comparison.comparisons == []
+        assert comparison.passed
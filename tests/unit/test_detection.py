@@ -105,3 +105,636 @@ class TestDeceptionDetector:
         assert confidence > 0.0
         if is_deceptive:
             assert "AU" in reason or "Deception" in reason
+
+
+class TestFaceTracker:
+    """Test frame-to-frame face tracking."""
+
+    def test_stable_ids_when_order_changes(self):
+        """Test that track IDs follow faces, not detection order."""
+        from src.core.tracker import FaceTracker
+
+        tracker = FaceTracker(max_distance=50)
+        left, right = FaceRegion(0, 0, 40, 40), FaceRegion(300, 0, 40, 40)
+
+        first = tracker.update([left, right])
+        second = tracker.update([FaceRegion(305, 2, 40, 40), FaceRegion(3, 1, 40, 40)])
+
+        assert second == [first[1], first[0]]
+
+    def test_dropped_tracks_are_reported(self):
+        """Test tracks are listed once when they time out."""
+        from src.core.tracker import FaceTracker
+
+        tracker = FaceTracker(timeout=1)
+        track_id = tracker.update([FaceRegion(0, 0, 40, 40)])[0]
+        tracker.update([])
+        assert tracker.dropped == []
+        tracker.update([])
+        assert tracker.dropped == [track_id]
+        tracker.update([])
+        assert tracker.dropped == []
+
+    def test_refresh_interval(self):
+        """Test cached analyses are reused until the refresh interval passes."""
+        from src.core.tracker import FaceTracker
+
+        tracker = FaceTracker()
+        track_id = tracker.update([FaceRegion(0, 0, 40, 40)])[0]
+        assert tracker.needs_refresh(track_id, 0, 3)
+
+        tracker.store_analysis(track_id, "analysis", 0)
+        assert not tracker.needs_refresh(track_id, 2, 3)
+        assert tracker.needs_refresh(track_id, 3, 3)
+        assert tracker.cached_analysis(track_id) == "analysis"
+
+    def test_assignment_respects_max_distance(self):
+        """Test pairs farther apart than max_distance are never assigned."""
+        import numpy as np
+        from src.core.tracker import assign_centers
+
+        rows, cols = assign_centers(
+            np.array([[0, 0], [100, 0], [500, 500]]),
+            np.array([[98, 0], [2, 0]]),
+            max_distance=10
+        )
+
+        assert sorted(zip(rows.tolist(), cols.tolist())) == [(0, 1), (1, 0)]
+
+    def test_smoothing_tracker_majority_emotion(self):
+        """Test boxes are smoothed and the emotion is the majority of the history."""
+        from src.core.tracker import SmoothingTracker
+
+        tracker = SmoothingTracker(alpha=0.5, history=3)
+        region = FaceRegion(0, 0, 40, 40)
+
+        ids, boxes, emotions = tracker.update([region], ["happy"])
+        assert emotions == ["happy"]
+        tracker.update([region], ["happy"])
+        _, _, emotions = tracker.update([region], ["sad"])
+        assert emotions == ["happy"]
+        # The oldest "happy" is evicted from the 3-frame history
+        _, _, emotions = tracker.update([region], ["sad"])
+        assert emotions == ["sad"]
+
+        second_ids, boxes, _ = tracker.update([FaceRegion(20, 0, 40, 40)], ["sad"])
+        assert second_ids == ids
+        assert boxes.tolist() == [[10, 0, 40, 40]]
+
+    def test_smoothing_tracker_drops_stale_tracks(self):
+        """Test tracks unmatched for longer than the timeout are removed."""
+        from src.core.tracker import SmoothingTracker
+
+        tracker = SmoothingTracker(timeout=1)
+        tracker.update([FaceRegion(0, 0, 40, 40), FaceRegion(500, 0, 40, 40)], ["happy", "sad"])
+        tracker.update([FaceRegion(0, 0, 40, 40)], ["happy"])
+        assert len(tracker) == 2
+        ids, _, _ = tracker.update([FaceRegion(0, 0, 40, 40)], ["happy"])
+        assert len(tracker) == 1
+        assert ids == [0]
+
+
+class TestDegradationLadder:
+    """Test the quality degradation ladder."""
+
+    def test_default_ladder_is_cumulative(self):
+        """Test each level keeps the reductions of the levels below it."""
+        from src.core.degradation import DegradationLadder
+
+        ladder = DegradationLadder()
+
+        assert ladder.state(0).facs_enabled
+        assert not ladder.state(1).facs_enabled
+        assert ladder.state(2).dropped_models == ("DeepFace",)
+        assert ladder.state(3).detection_scale == 0.5
+        top = ladder.state(ladder.max_level)
+        assert top.emotion_refresh == 3 and not top.facs_enabled
+        assert ladder.state(99) == top
+
+    def test_invalid_step(self):
+        """Test unknown steps are rejected."""
+        from src.core.degradation import DegradationLadder
+
+        with pytest.raises(ValueError):
+            DegradationLadder(["turbo"])
+
+
+class TestVideoBatch:
+    """Test segment planning and track stitching for offline video runs."""
+
+    def test_plan_segments_cover_all_frames(self):
+        """Test segments are contiguous and overlap their successor."""
+        from src.core.video_batch import plan_segments
+
+        segments = plan_segments(1000, workers=2, segments_per_worker=2, min_segment_frames=100, overlap_frames=5)
+
+        assert len(segments) == 4
+        assert segments[0].start == 0 and segments[-1].end == 1000
+        assert all(a.end == b.start for a, b in zip(segments, segments[1:]))
+        assert [s.overlap for s in segments] == [5, 5, 5, 0]
+
+    def test_stitch_tracks_across_segments(self):
+        """Test a face keeps one global ID across a segment boundary."""
+        from src.core.video_batch import SegmentResult, TrackStitcher, VideoSegment
+        from src.data.models import FrameAnalysis
+
+        def frame(number, *faces):
+            return FrameAnalysis(number, [
+                FaceAnalysis(face_id, FaceRegion(x, 0, 40, 40), "neutral", 1.0)
+                for face_id, x in faces
+            ])
+
+        # Segment 0 owns frames 0-1 and reads frame 2 as overlap
+        first = SegmentResult(VideoSegment(0, 0, 2, 1), [
+            frame(0, (0, 0), (1, 300)), frame(1, (0, 2), (1, 302)), frame(2, (0, 4), (1, 304))
+        ])
+        # Segment 1 numbers the same faces differently, plus a new face
+        second = SegmentResult(VideoSegment(1, 2, 4), [
+            frame(2, (0, 304), (1, 4)), frame(3, (0, 306), (1, 6), (2, 600))
+        ])
+
+        stitcher = TrackStitcher(max_distance=50)
+        frames = stitcher.add(first) + stitcher.add(second) + stitcher.finish()
+
+        assert [f.frame_number for f in frames] == [0, 1, 2, 3]
+        ids_by_x = {face.region.x // 100: face.face_id for face in frames[3].faces}
+        assert ids_by_x == {0: 0, 3: 1, 6: 2}
+
+
+class TestCaptureRoi:
+    """Test window following and face-driven capture regions."""
+
+    def test_auto_roi_follows_faces_and_rescans(self):
+        """Test the region covers padded faces and clears for full scans."""
+        from src.core.roi import AutoRoi
+
+        roi = AutoRoi(margin=0.5, min_size=0, full_scan_interval=3)
+        faces = [FaceRegion(100, 100, 40, 40), FaceRegion(300, 120, 60, 60)]
+
+        assert roi.update(faces) == (80, 80, 310, 130)
+        assert roi.update(faces) is not None
+        assert roi.update(faces) is None  # Periodic full scan
+        assert roi.full_scans == 1
+        assert roi.update(faces) is not None
+        assert roi.update([]) is None  # Lost the faces: look everywhere
+
+    def test_auto_roi_min_size_is_centered(self):
+        """Test small regions grow around the face."""
+        from src.core.roi import AutoRoi
+
+        roi = AutoRoi(margin=0.0, min_size=100)
+        assert roi.update([FaceRegion(200, 200, 20, 20)]) == (160, 160, 100, 100)
+
+    def test_auto_roi_ignores_jitter(self):
+        """Test small box jitter keeps the region and real movement updates it."""
+        from src.core.roi import AutoRoi
+
+        roi = AutoRoi(margin=0.0, min_size=0, tolerance=4)
+        region = roi.update([FaceRegion(100, 100, 50, 50)])
+        assert roi.update([FaceRegion(102, 99, 51, 50)]) == region
+        assert roi.update([FaceRegion(120, 100, 50, 50)]) == (120, 100, 50, 50)
+
+    def test_window_follower_polls_at_interval(self):
+        """Test geometry is cached between polls and clipped regions intersect."""
+        from src.core.roi import WindowFollower, intersect_regions
+
+        calls = []
+
+        def lookup(title):
+            calls.append(title)
+            return (10, 20, 640, 480)
+
+        window = WindowFollower("Meeting", poll_interval=1.0, lookup=lookup)
+        assert window.geometry(now=0.0) == (10, 20, 640, 480)
+        window.geometry(now=0.5)
+        window.geometry(now=1.5)
+        assert calls == ["Meeting", "Meeting"]
+
+        assert intersect_regions((0, 0, 100, 100), (50, 50, 100, 100)) == (50, 50, 50, 50)
+        assert intersect_regions((0, 0, 10, 10), (20, 20, 5, 5)) is None
+
+
+class TestMultiMonitorCapture:
+    """Test parallel per-monitor capture and detection."""
+
+    def test_views_per_monitor_on_own_threads(self):
+        """Test every monitor is captured and detected by its own worker."""
+        import threading
+        import time
+        import numpy as np
+        from src.core.frame_sources import CapturedFrame, FrameSource
+        from src.core.multi_monitor import MultiMonitorCapture
+
+        threads = {}
+
+        class MonitorSource(FrameSource):
+            def __init__(self, index):
+                super().__init__()
+                self.index = index
+
+            def read(self):
+                threads.setdefault(self.index, set()).add(threading.current_thread().name)
+                return CapturedFrame(np.zeros((10, 20, 3), np.uint8), 0, time.monotonic_ns(),
+                                     origin=(self.index * 1920, 0))
+
+            def get_screen_dimensions(self):
+                return (20, 10)
+
+        class StubDetector:
+            detection_scale = 1.0
+
+            def initialize(self):
+                return True
+
+            def detect_faces(self, frame):
+                return [FaceRegion(1, 2, 3, 4)]
+
+            def shutdown(self):
+                pass
+
+        capture = MultiMonitorCapture([0, 1, 2], detector_factory=StubDetector, source_factory=MonitorSource)
+        assert capture.initialize()
+        try:
+            for _ in range(3):
+                views = capture.read()
+            assert [view.captured.origin for view in views] == [(0, 0), (1920, 0), (3840, 0)]
+            assert all(len(view.regions) == 1 for view in views)
+
+            # Each monitor stays on one thread, and no two monitors share one
+            assert all(len(names) == 1 for names in threads.values())
+            assert len(set.union(*threads.values())) == 3
+
+            capture.set_detection_scale(0.5)
+            assert all(w.detector.detection_scale == 0.5 for w in capture.workers)
+        finally:
+            capture.close()
+
+
+class TestTiledDetection:
+    """Test tiled face detection."""
+
+    def test_plan_tiles_cover_frame(self):
+        """Test tiles overlap, stay inside the frame and cover every pixel."""
+        import numpy as np
+        from src.core.face_detector import plan_tiles
+
+        tiles = plan_tiles(1000, 600, tile_size=400, overlap=100)
+        covered = np.zeros((600, 1000), dtype=bool)
+        for x, y, w, h in tiles:
+            assert x + w <= 1000 and y + h <= 600
+            covered[y:y + h, x:x + w] = True
+
+        assert covered.all()
+        assert len(tiles) == 3 * 2
+        assert plan_tiles(300, 200, tile_size=400, overlap=100) == [(0, 0, 300, 200)]
+
+    def test_faces_in_overlaps_are_fused(self):
+        """Test a face seen by several tiles is reported once, in frame coordinates."""
+        import numpy as np
+        from src.core.face_detector import FaceDetector
+
+        detector = FaceDetector(tiling=True, expected_face_size=40, tile_workers=2)
+        detector.is_initialized = True
+        face = (330, 150, 40, 40)
+
+        def detect_tile(frame, tile, upscale, max_face):
+            x, y, w, h = tile
+            inside = x <= face[0] and face[0] + face[2] <= x + w and y <= face[1] and face[1] + face[3] <= y + h
+            return [FaceRegion(*face, confidence=0.9)] if inside else []
+
+        detector._detect_tile = detect_tile
+        try:
+            faces = detector.detect_faces(np.zeros((720, 1280, 3), np.uint8))
+        finally:
+            detector.shutdown()
+
+        assert [f.to_tuple() for f in faces] == [face]
+
+    def test_large_faces_found_with_tiling(self):
+        """Test faces too large for the tiles are found on the downscaled frame."""
+        import numpy as np
+        from src.core.face_detector import FaceDetector
+
+        detector = FaceDetector(tiling=True, expected_face_size=40, tile_workers=2)
+        detector.is_initialized = True
+        face = (400, 100, 480, 480)
+        small_face = (1000, 600, 40, 40)
+
+        def detect_tile(frame, tile, upscale, max_face):
+            x, y, w, h = tile
+            inside = x <= small_face[0] and small_face[0] + 40 <= x + w and y <= small_face[1] and small_face[1] + 40 <= y + h
+            return [FaceRegion(*small_face, confidence=0.9)] if inside else []
+
+        def detect_opencv(image):
+            # The large face, in the coordinates of the (downscaled) image
+            scale = image.shape[1] / 1280
+            return [FaceRegion(*(int(round(v * scale)) for v in face), confidence=0.9)]
+
+        detector._detect_tile = detect_tile
+        detector._detect_opencv = detect_opencv
+        try:
+            faces = detector.detect_faces(np.zeros((720, 1280, 3), np.uint8))
+        finally:
+            detector.shutdown()
+
+        boxes = sorted(f.to_tuple() for f in faces)
+        assert len(boxes) == 2
+        assert boxes[0] == pytest.approx(face, abs=4)
+        assert boxes[1] == small_face
+
+    def test_detectors_share_tile_threads(self):
+        """Test detectors in one process (e.g. per monitor) share a tile pool."""
+        import threading
+        import numpy as np
+        from src.core.face_detector import FaceDetector
+
+        threads = set()
+
+        def detect_tile(frame, tile, upscale, max_face):
+            threads.add(threading.current_thread().name)
+            return []
+
+        for _ in range(3):
+            detector = FaceDetector(tiling=True, expected_face_size=40, tile_workers=2, cache_size=0)
+            detector.is_initialized = True
+            detector._detect_tile = detect_tile
+            detector.detect_faces(np.zeros((720, 1280, 3), np.uint8))
+            detector.shutdown()
+
+        assert 1 <= len(threads) <= 2
+
+
+class TestDetectorBackends:
+    """Test the pluggable face detector backend registry."""
+
+    @pytest.fixture
+    def stub_backend(self):
+        """Register a backend that finds one face with keypoints per image."""
+        import numpy as np
+        from src.core import detector_backends
+        from src.core.detector_backends import DetectorBackend, register_backend
+
+        @register_backend("stub")
+        class StubBackend(DetectorBackend):
+            batches = []
+
+            def initialize(self):
+                self.is_initialized = True
+                return True
+
+            def detect(self, frame):
+                return self.detect_batch([frame])[0]
+
+            def detect_batch(self, frames):
+                self.batches.append(len(frames))
+                return [
+                    [FaceRegion(10, 10, 20, 20, 0.75, keypoints=np.array([[15, 15]], np.float32))]
+                    for _ in frames
+                ]
+
+        yield StubBackend
+        del detector_backends._BACKENDS["stub"]
+
+    def test_backend_confidence_and_keypoints(self, stub_backend):
+        """Test a registered backend is selected by name and its output is rescaled."""
+        import numpy as np
+        from src.core.detector_backends import available_backends
+        from src.core.face_detector import FaceDetector
+
+        assert {"yunet", "onnx", "stub"} <= set(available_backends())
+
+        detector = FaceDetector(method="stub")
+        assert detector.initialize()
+        detector.detection_scale = 0.5
+        faces = detector.detect_faces(np.zeros((100, 100, 3), np.uint8))
+
+        assert [(f.to_tuple(), f.confidence) for f in faces] == [((20, 20, 40, 40), 0.75)]
+        assert faces[0].keypoints.tolist() == [[30, 30]]
+
+    def test_tiles_are_batched(self, stub_backend):
+        """Test tiled detection hands every tile to the backend in one call."""
+        import numpy as np
+        from src.core.face_detector import FaceDetector
+
+        detector = FaceDetector(method="stub", tiling=True, expected_face_size=40)
+        detector.initialize()
+        faces = detector.detect_faces(np.zeros((720, 1280, 3), np.uint8))
+        detector.shutdown()
+
+        # All tiles in one call, then the downscaled whole frame for large faces
+        assert len(stub_backend.batches) == 2 and stub_backend.batches[0] > 1
+        assert stub_backend.batches[1] == 1
+        # One distinct face per tile origin, plus the stub's face in the whole frame
+        assert len(faces) == stub_backend.batches[0] + 1
+
+    def test_cache_skips_backend(self, stub_backend):
+        """Test seen frames skip the backend and only changed tiles are detected again."""
+        import numpy as np
+        from src.core.face_detector import FaceDetector
+
+        detector = FaceDetector(method="stub", tiling=True, expected_face_size=40)
+        detector.initialize()
+        frame = np.zeros((720, 1280, 3), np.uint8)
+        first = detector.detect_faces(frame)
+        assert detector.detect_faces(frame.copy()) == first
+        assert len(stub_backend.batches) == 2  # Tiles and the whole-frame pass
+
+        changed = frame.copy()
+        changed[:100, :100] = 255  # Inside the first tile only
+        detector.detect_faces(changed)
+        detector.shutdown()
+
+        assert stub_backend.batches[2] == 1
+
+    def test_unknown_backend(self):
+        """Test unknown backend names are rejected."""
+        from src.core.detector_backends import create_backend
+
+        assert create_backend("no-such-backend") is None
+
+
+class TestDetectionCache:
+    """Test the detection cache."""
+
+    @staticmethod
+    def _image(seed):
+        import numpy as np
+        return np.random.default_rng(seed).integers(0, 256, (240, 320, 3), dtype=np.uint8)
+
+    def test_hit_tolerates_noise(self):
+        """Test capture noise still hits while a local change misses."""
+        import numpy as np
+        from src.core.detection_cache import DetectionCache
+
+        cache = DetectionCache()
+        image = self._image(0)
+        faces = [FaceRegion(1, 2, 30, 30, 0.9)]
+        cache.store(cache.signature(image), faces)
+
+        noisy = np.clip(image.astype(np.int16) + np.random.default_rng(1).integers(-3, 4, image.shape), 0, 255)
+        assert cache.lookup(cache.signature(noisy.astype(np.uint8))) == faces
+
+        moved = image.copy()
+        moved[100:160, 100:160] = 0
+        assert cache.lookup(cache.signature(moved)) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_hits_are_copies(self):
+        """Test callers moving returned regions (e.g. to screen coordinates) leave the cache intact."""
+        from src.core.detection_cache import DetectionCache
+
+        cache = DetectionCache()
+        signature = cache.signature(self._image(0))
+        faces = [FaceRegion(100, 50, 30, 30, 0.9)]
+        cache.store(signature, faces)
+        faces[0].x = 0
+
+        for _ in range(3):
+            hit = cache.lookup(signature)
+            assert hit[0].to_tuple() == (100, 50, 30, 30)
+            hit[0].x -= 1920
+
+    def test_lru_across_alternating_images(self):
+        """Test switching between a few images keeps hitting, oldest entries are evicted."""
+        from src.core.detection_cache import DetectionCache
+
+        cache = DetectionCache(capacity=2)
+        signatures = [cache.signature(self._image(seed)) for seed in range(3)]
+        for i, signature in enumerate(signatures[:2]):
+            cache.store(signature, [FaceRegion(i, i, 10, 10)])
+
+        for _ in range(3):
+            assert cache.lookup(signatures[0])[0].x == 0
+            assert cache.lookup(signatures[1])[0].x == 1
+
+        cache.store(signatures[2], [])  # Evicts image 0, the least recently used
+        assert cache.lookup(signatures[0]) is None
+        assert cache.lookup(signatures[2]) == []
+        assert cache.hit_rate == 7 / 8
+
+    def test_contexts_and_max_reuse(self):
+        """Test entries only match in their context and expire after max_reuse hits."""
+        from src.core.detection_cache import DetectionCache
+
+        cache = DetectionCache(max_reuse=2)
+        signature = cache.signature(self._image(0))
+        cache.store(signature, [], context=((240, 320, 3), 1.0))
+
+        assert cache.lookup(signature, context=((240, 320, 3), 0.5)) is None
+        assert cache.lookup(signature, context=((240, 320, 3), 1.0)) == []
+        assert cache.lookup(signature, context=((240, 320, 3), 1.0)) == []
+        assert cache.lookup(signature, context=((240, 320, 3), 1.0)) is None
+
+
+class TestMotionGating:
+    """Test motion-gated face detection."""
+
+    def test_gate_finds_moving_region(self):
+        """Test a static frame is idle and a local change yields one padded region."""
+        import numpy as np
+        from src.core.motion import MotionGate
+
+        gate = MotionGate(padding=20, full_refresh_interval=100)
+        frame = np.full((480, 640, 3), 90, np.uint8)
+        assert gate.update(frame) is None  # First frame: full pass
+        assert gate.update(frame.copy()) == []
+
+        moved = frame.copy()
+        moved[200:260, 300:360] = 250
+        [(x, y, w, h)] = gate.update(moved)
+        assert x <= 300 - 20 + 4 and y <= 200 - 20 + 4
+        assert x + w >= 360 + 20 - 4 and y + h >= 260 + 20 - 4
+        assert w < 200 and h < 200
+        assert (gate.full_refreshes, gate.gated_frames, gate.idle_frames) == (1, 1, 1)
+
+    def test_gate_full_refreshes(self):
+        """Test periodic, size-change and large-motion full passes."""
+        import numpy as np
+        from src.core.motion import MotionGate, merge_regions
+
+        gate = MotionGate(full_refresh_interval=3)
+        frame = np.zeros((240, 320, 3), np.uint8)
+        assert [gate.update(frame) for _ in range(4)] == [None, [], [], None]
+        assert gate.update(np.zeros((200, 320, 3), np.uint8)) is None
+        assert gate.update(np.full((200, 320, 3), 255, np.uint8)) is None
+
+        assert merge_regions([(0, 0, 10, 10), (5, 5, 10, 10), (30, 30, 5, 5)]) == [(0, 0, 15, 15), (30, 30, 5, 5)]
+
+    def test_static_faces_keep_boxes(self):
+        """Test only changed regions are detected and other faces are carried over."""
+        import numpy as np
+        from src.core.face_detector import FaceDetector
+        from src.core.motion import MotionGate
+
+        detector = FaceDetector(cache_size=0, motion_gate=MotionGate(padding=20, full_refresh_interval=100))
+        detector.is_initialized = True
+        calls = []
+
+        def detect(image):
+            calls.append(image.shape[:2])
+            # One face at the bright patch, if any
+            ys, xs = np.nonzero(image[:, :, 0] > 200)
+            return [FaceRegion(int(xs.min()), int(ys.min()), 60, 60, 0.9)] if len(xs) else []
+
+        detector._detect = detect
+        frame = np.full((480, 640, 3), 90, np.uint8)
+        frame[50:110, 50:110] = 250
+        assert [f.to_tuple() for f in detector.detect_faces(frame)] == [(50, 50, 60, 60)]
+
+        assert [f.to_tuple() for f in detector.detect_faces(frame.copy())] == [(50, 50, 60, 60)]
+        assert len(calls) == 1  # Nothing moved, nothing detected
+
+        moved = frame.copy()
+        moved[300:360, 400:460] = 250
+        faces = detector.detect_faces(moved)
+        assert sorted(f.to_tuple() for f in faces) == [(50, 50, 60, 60), (400, 300, 60, 60)]
+        assert len(calls) == 2 and calls[1][0] < 200 and calls[1][1] < 200
+
+    def test_large_face_with_local_motion(self):
+        """Test a face much larger than its moving part is detected whole and keeps its box."""
+        import numpy as np
+        from src.core.face_detector import FaceDetector
+        from src.core.motion import MotionGate
+
+        detector = FaceDetector(cache_size=0, motion_gate=MotionGate(padding=20, full_refresh_interval=100))
+        detector.is_initialized = True
+        face = (100, 50, 300, 300)
+
+        def detect(image):
+            # The face is found only when the crop contains all of it
+            height, width = image.shape[:2]
+            return [FaceRegion(*face, 0.9)] if (width, height) == (640, 480) else []
+
+        crops = []
+
+        def detect_crop(image):
+            crops.append(image.shape[:2])
+            return [FaceRegion(20, 20, 300, 300, 0.9)] if image.shape[0] >= 340 and image.shape[1] >= 340 else []
+
+        detector._detect = detect
+        frame = np.full((480, 640, 3), 90, np.uint8)
+        assert [f.to_tuple() for f in detector.detect_faces(frame)] == [face]
+
+        detector._detect = detect_crop
+        talking = frame.copy()
+        talking[260:280, 230:270] = 250  # The mouth moves
+        faces = detector.detect_faces(talking)
+
+        assert [f.to_tuple() for f in faces] == [face]
+        assert crops == [(340, 340)]  # The face plus padding, not just the mouth
+
+    def test_carried_faces_are_copies(self):
+        """Test callers modifying returned regions leave the carried-over faces intact."""
+        import numpy as np
+        from src.core.face_detector import FaceDetector
+        from src.core.motion import MotionGate
+
+        detector = FaceDetector(cache_size=0, motion_gate=MotionGate())
+        detector.is_initialized = True
+        detector._detect = lambda image: [FaceRegion(10, 10, 60, 60, 0.9)]
+        frame = np.zeros((240, 320, 3), np.uint8)
+
+        for _ in range(3):
+            faces = detector.detect_faces(frame)
+            assert faces[0].x == 10
+            faces[0].x += 1920
@@ -71,3 +71,132 @@ class TestFaceRegion:
         """Test center point calculation."""
         center = sample_face_region.center()
         assert center == (200, 200)  # (100 + 200/2, 100 + 200/2)
+
+    def test_scaled_maps_keypoints(self):
+        """Test scaling and offsetting moves the box and its keypoints together."""
+        region = FaceRegion(10, 20, 30, 40, 0.8, keypoints=np.array([[15, 30], [25, 30]], np.float32))
+        mapped = region.scaled(2.0, (100, 0))
+
+        assert mapped.to_tuple() == (120, 40, 60, 80)
+        assert mapped.confidence == 0.8
+        assert mapped.keypoints.tolist() == [[130, 60], [150, 60]]
+
+
+class TestEmotionPrediction:
+    """Test EmotionPrediction score vectors and timestamps."""
+
+    def test_scores_vector(self, sample_emotion_prediction):
+        """Test that score dicts are stored as vectors in label order."""
+        from src.data.models import EMOTION_LABELS
+
+        scores = sample_emotion_prediction.scores
+        assert scores.shape == (len(EMOTION_LABELS),)
+        assert scores[EMOTION_LABELS.index("happy")] == pytest.approx(0.85)
+        assert np.isnan(scores[EMOTION_LABELS.index("fear")])
+        assert sample_emotion_prediction.all_scores == pytest.approx({
+            "happy": 0.85, "sad": 0.05, "angry": 0.03, "neutral": 0.07
+        })
+
+    def test_timestamp_conversion(self, sample_emotion_prediction):
+        """Test monotonic timestamps convert to wall-clock datetimes."""
+        from datetime import datetime
+
+        delta = datetime.now() - sample_emotion_prediction.timestamp
+        assert abs(delta.total_seconds()) < 5
+
+    def test_all_scores_keyword_is_deprecated_alias(self):
+        """Test the old all_scores= keyword still sets the score vector."""
+        with pytest.warns(DeprecationWarning):
+            prediction = EmotionPrediction("Model", "sad", 0.6, all_scores={"sad": 0.6})
+
+        assert prediction.all_scores == pytest.approx({"sad": 0.6})
+
+    def test_frame_analysis_rejects_positional_timestamp(self):
+        """Test the old FrameAnalysis(n, timestamp, faces) order fails loudly."""
+        from datetime import datetime
+        from src.data.models import FrameAnalysis
+
+        with pytest.raises(TypeError):
+            FrameAnalysis(1, datetime.now(), [])
+
+    def test_weighted_voting_skips_unscored_emotions(self):
+        """Test that emotions no model scored are not chosen."""
+        voter = EnsembleVoter(method="weighted_voting", min_models_required=2)
+
+        predictions = [
+            EmotionPrediction("Model1", "sad", 0.6, {"sad": 0.6}),
+            EmotionPrediction("Model2", "sad", 0.4, {"sad": 0.4})
+        ]
+
+        result = voter.vote(predictions)
+        assert result.emotion == "sad"
+        assert set(result.all_scores) == {"sad"}
+
+
+class TestFrameBatch:
+    """Test the columnar FrameBatch and batched ensemble vote."""
+
+    def test_vote_batch_matches_vote(self):
+        """Test that the batched vote picks the same emotion as vote()."""
+        from src.data.batch import FrameBatch
+        from src.data.models import EMOTION_LABELS
+
+        voter = EnsembleVoter(method="weighted_voting", min_models_required=2)
+        faces = [
+            [
+                EmotionPrediction("Model1", "happy", 0.9, {"happy": 0.9, "sad": 0.1}),
+                EmotionPrediction("Model2", "sad", 0.6, {"happy": 0.4, "sad": 0.6})
+            ],
+            [
+                EmotionPrediction("Model1", "angry", 0.7, {"angry": 0.7, "fear": 0.3})
+            ]
+        ]
+
+        batch = FrameBatch.empty(0, ("Model1", "Model2"), len(faces))
+        for row, predictions in enumerate(faces):
+            for col, prediction in enumerate(predictions):
+                batch.set_prediction(row, col, prediction)
+
+        emotion, confidence, _, valid = voter.vote_batch(
+            batch.model_scores, batch.model_confidence, np.ones(2, dtype=np.float32)
+        )
+
+        expected = voter.vote(faces[0])
+        assert valid.tolist() == [True, False]
+        assert EMOTION_LABELS[emotion[0]] == expected.emotion
+        assert confidence[0] == pytest.approx(expected.confidence, rel=1e-5)
+
+    def test_views_roundtrip(self, sample_face_region):
+        """Test that face views read and write through to the batch arrays."""
+        from src.data.batch import FrameBatch
+
+        batch = FrameBatch.from_regions(7, [sample_face_region], ("Model1",))
+        batch.set_prediction(0, 0, EmotionPrediction("Model1", "happy", 0.9, {"happy": 0.9}))
+
+        view = batch.faces[0]
+        view.is_deceptive = True
+        view.deception_reason = "test"
+        assert batch.is_deceptive[0]
+        assert view.region.to_tuple() == (100, 100, 200, 200)
+        assert view.model_predictions[0].emotion == "happy"
+
+        restored = FrameBatch.from_frame_analysis(batch.to_frame_analysis())
+        assert restored.frame_number == 7
+        assert restored.deception_reasons == ["test"]
+        np.testing.assert_array_equal(restored.boxes, batch.boxes)
+
+    def test_model_disagreement_batch(self):
+        """Test the vectorized disagreement score against the per-face rule."""
+        from src.detection.deception import DeceptionDetector
+
+        detector = DeceptionDetector({})
+        model_emotion = np.array([
+            [0, 1, 2],     # all disagree
+            [3, 3, 4],     # 2 of 3 distinct
+            [5, -1, -1],   # single prediction
+        ], dtype=np.int16)
+
+        scores = detector.model_disagreement_batch(model_emotion)
+        assert scores[0] == pytest.approx(0.6)
+        assert scores[1] == pytest.approx(2 / 3 * 0.6)
+        assert scores[2] == 0.0
@@ -11,6 +11,7 @@ from src.utils.validators import (
     validate_emotion
 )
 from src.utils.performance import PerformanceMonitor
+from src.utils.instrumentation import Instrumentation, LatencyHistogram
 
 
 class TestValidators:
@@ -98,3 +99,338 @@ class TestPerformanceMonitor:
 
         new_fps = monitor.adapt_frame_rate()
         assert new_fps <= monitor.current_fps  # Should reduce FPS
+
+    def test_frame_times_bounded(self):
+        """Test that only the most recent frame times are kept."""
+        monitor = PerformanceMonitor()
+
+        for i in range(monitor.max_frame_time_samples + 10):
+            monitor.record_frame_time(i / 1000)
+
+        assert len(monitor.frame_times) == monitor.max_frame_time_samples
+        assert monitor.frame_times[0] == pytest.approx(0.01)
+
+
+class TestInstrumentation:
+    """Test latency histograms and stage timing."""
+
+    def test_histogram_percentiles(self):
+        """Test percentiles stay within the bucket resolution."""
+        histogram = LatencyHistogram()
+        for ms in range(1, 101):
+            histogram.record(ms * 1_000_000)
+
+        assert histogram.total_count == 100
+        assert histogram.percentile(50) == pytest.approx(50_000_000, rel=0.01)
+        assert histogram.percentile(99) == pytest.approx(99_000_000, rel=0.01)
+        assert histogram.percentile(100) == 100_000_000
+        assert histogram.to_dict()["mean_ms"] == pytest.approx(50.5)
+
+    def test_histogram_merge(self):
+        """Test merging histograms adds their samples."""
+        a, b = LatencyHistogram(), LatencyHistogram()
+        a.record(1_000)
+        b.record(5_000_000)
+        a.merge(b)
+
+        assert a.total_count == 2
+        assert a.min_ns == 1_000
+        assert a.max_ns == 5_000_000
+
+    def test_disabled_stage_records_nothing(self):
+        """Test that stages are no-ops while disabled."""
+        instrumentation = Instrumentation(enabled=False)
+
+        with instrumentation.stage("detect"):
+            pass
+
+        assert instrumentation.summary() == {}
+
+    def test_stage_and_timed(self):
+        """Test stage contexts and the timed decorator record latencies."""
+        instrumentation = Instrumentation(enabled=True)
+
+        @instrumentation.timed("work")
+        def work():
+            return 42
+
+        with instrumentation.stage("detect"):
+            pass
+        assert work() == 42
+
+        summary = instrumentation.summary()
+        assert summary["detect"]["count"] == 1
+        assert summary["work"]["count"] == 1
+
+
+class TestMetricsServer:
+    """Test the Prometheus metrics endpoint."""
+
+    def test_render_performance_metrics(self):
+        """Test exposition text for performance and stage metrics."""
+        from src.utils.metrics_server import render_metrics
+
+        monitor = PerformanceMonitor(
+            initial_fps=12, instrumentation=Instrumentation(enabled=True)
+        )
+        monitor.record_frame_time(0.05)
+        monitor.mark_dropped_frame()
+
+        text = render_metrics(monitor.collect_metrics("fd"))
+
+        assert "# TYPE fd_fps gauge" in text
+        assert "fd_fps 12" in text
+        assert "fd_dropped_frames_total 1" in text
+        assert 'fd_stage_latency_seconds{stage="frame",quantile="0.5"}' in text
+        assert 'fd_stage_latency_seconds_count{stage="frame"} 1' in text
+
+    def test_serves_metrics(self):
+        """Test the endpoint serves collector output over HTTP."""
+        from urllib.request import urlopen
+        from src.utils.metrics_server import MetricsServer, gauge
+
+        server = MetricsServer(port=0)
+        server.add_collector(lambda: [gauge("fd_queue_depth", "Queued frames", 3)])
+        assert server.start()
+        try:
+            with urlopen(server.url, timeout=5) as response:
+                body = response.read().decode("utf-8")
+                assert response.headers["Content-Type"].startswith("text/plain")
+        finally:
+            server.stop()
+
+        assert "fd_queue_depth 3" in body
+
+
+class TestAdaptiveController:
+    """Test the feedback frame-rate controller."""
+
+    def _run(self, monitor, frame_time, steps, start=0.0):
+        now = start
+        for _ in range(steps):
+            monitor.record_frame_time(frame_time)
+            monitor.adapt_frame_rate(now=now)
+            now += monitor.control_interval
+        return now
+
+    def test_never_below_min_fps(self):
+        """Test that a very slow pipeline bottoms out at min_fps, not 0."""
+        monitor = PerformanceMonitor(initial_fps=10, min_fps=5, target_cpu_percent=1000)
+        self._run(monitor, 2.0, 20)
+        assert monitor.current_fps == 5
+
+    def test_converges_to_setpoint(self):
+        """Test steady state holds utilization near the target without oscillating."""
+        monitor = PerformanceMonitor(
+            initial_fps=5, min_fps=1, max_fps=60, target_cpu_percent=1000, target_utilization=0.8
+        )
+        now = self._run(monitor, 0.04, 40)
+
+        history = []
+        for _ in range(10):
+            now = self._run(monitor, 0.04, 1, start=now)
+            history.append(monitor.current_fps)
+
+        assert max(history) - min(history) <= 1.0
+        assert 0.04 * history[-1] == pytest.approx(0.8, abs=0.1)
+
+    def _run_load(self, monitor, frame_time, steps, start):
+        """Run with a frame time that depends on the frame rate, as in a CPU-bound pipeline."""
+        now = start
+        history = []
+        for _ in range(steps):
+            for _ in range(max(int(monitor.current_fps * monitor.control_interval), 1)):
+                monitor.record_frame_time(frame_time(monitor.current_fps))
+            history.append(monitor.adapt_frame_rate(now=now))
+            now += monitor.control_interval
+        return history
+
+    def test_settles_when_utilization_follows_fps(self):
+        """Test the loop settles when frame time grows with the frame rate."""
+        monitor = PerformanceMonitor(
+            initial_fps=40, min_fps=1, max_fps=60, target_cpu_percent=1000, target_utilization=0.8
+        )
+        history = self._run_load(monitor, lambda fps: 0.02 + 0.002 * fps, 120, start=0.0)
+
+        assert max(history[-40:]) == min(history[-40:])
+        fps = history[-1]
+        utilization = (0.02 + 0.002 * fps) * fps
+        assert abs(utilization / 0.8 - 1.0) <= monitor.deadband
+
+    def test_settles_on_cpu_setpoint(self):
+        """Test the loop settles when CPU usage is proportional to the frame rate."""
+        monitor = PerformanceMonitor(
+            initial_fps=10, min_fps=1, max_fps=60, target_cpu_percent=70.0
+        )
+        monitor.process.cpu_percent = lambda: 5.0 * monitor.current_fps
+        start = monitor._last_cpu_sample + monitor.cpu_sample_interval
+        history = self._run_load(monitor, lambda fps: 0.01, 200, start=start)
+
+        assert max(history[-40:]) == min(history[-40:])
+        assert abs(5.0 * history[-1] / 70.0 - 1.0) <= monitor.deadband
+
+    def test_degradation_steps(self):
+        """Test overload at min_fps raises the degradation level, recovery lowers it."""
+        monitor = PerformanceMonitor(
+            initial_fps=5, min_fps=5, target_cpu_percent=1000,
+            max_degradation_level=2, degradation_hold=2
+        )
+        now = self._run(monitor, 0.5, 10)
+        assert monitor.degradation_level == 2
+
+        monitor.smoothed_frame_time = None
+        self._run(monitor, 0.01, 10, start=now)
+        assert monitor.degradation_level == 0
+
+
+class TestFrameClock:
+    """Test deadline-based frame scheduling."""
+
+    def test_ticks_on_deadlines(self):
+        """Test the clock keeps the target rate without drifting."""
+        import time
+        from src.utils.frame_clock import FrameClock
+
+        clock = FrameClock(lambda: 0.01)
+        start = time.monotonic()
+        for _ in range(21):
+            assert clock.wait_next()
+        elapsed = time.monotonic() - start
+
+        assert elapsed == pytest.approx(0.2, abs=0.05)
+        assert clock.to_dict()["count"] == 21
+
+    def test_overrun_skips_slots(self):
+        """Test slots missed by slow processing are counted, not replayed."""
+        import time
+        from src.utils.frame_clock import FrameClock
+
+        clock = FrameClock(lambda: 0.01)
+        clock.wait_next()
+        time.sleep(0.045)
+        clock.wait_next()
+
+        assert clock.missed_slots >= 3
+
+    def test_stop_releases_wait(self):
+        """Test stop releases a long wait and ends the schedule."""
+        import threading
+        import time
+        from src.utils.frame_clock import FrameClock
+
+        clock = FrameClock(lambda: 10.0)
+        clock.wait_next()
+
+        threading.Timer(0.05, clock.stop).start()
+        start = time.monotonic()
+        assert clock.wait_next() is False
+        assert time.monotonic() - start < 1.0
+        assert clock.wait_next() is False
+
+
+class TestLatestValueMailbox:
+    """Test the latest-value handoff between the worker and the GUI."""
+
+    def test_take_returns_newest_once(self):
+        """Test values not taken in time are coalesced into the newest one."""
+        from src.utils.mailbox import LatestValueMailbox
+
+        mailbox = LatestValueMailbox()
+        assert mailbox.take() is None
+
+        for value in range(5):
+            mailbox.publish(value)
+        assert mailbox.pending == 1
+
+        assert mailbox.take() == 4
+        assert mailbox.take() is None
+        assert mailbox.pending == 0
+        assert (mailbox.published, mailbox.delivered, mailbox.coalesced) == (5, 1, 4)
+        assert mailbox.age.total_count == 1
+
+    def test_metrics(self):
+        """Test queue depth and handoff counters are exported."""
+        from src.utils.mailbox import LatestValueMailbox
+        from src.utils.metrics_server import render_metrics
+
+        mailbox = LatestValueMailbox()
+        mailbox.publish("a")
+        mailbox.publish("b")
+
+        text = render_metrics(mailbox.collect_metrics("test"))
+        assert "test_ui_queue_depth 1" in text
+        assert "test_ui_coalesced_total 1" in text
+
+        mailbox.take()
+        text = render_metrics(mailbox.collect_metrics("test"))
+        assert "test_ui_queue_depth 0" in text
+        assert "test_ui_result_age_seconds_count 1" in text
+
+
+    def test_event_queue_keeps_every_event(self):
+        """Test events are delivered in order and the oldest dropped past maxlen."""
+        from src.utils.mailbox import EventQueue
+
+        events = EventQueue(maxlen=3)
+        assert events.drain() == []
+        for event in range(5):
+            events.put(event)
+
+        assert events.drain() == [2, 3, 4]
+        assert events.dropped == 2
+        assert events.drain() == []
+
+
+class TestBoxOps:
+    """Test vectorized box utilities."""
+
+    def test_iou_matrix(self):
+        """Test pairwise IoU against hand-computed values."""
+        from src.utils.box_ops import iou_matrix
+
+        a = np.array([[0, 0, 10, 10], [0, 0, 0, 0]])
+        b = np.array([[0, 0, 10, 10], [5, 0, 10, 10], [20, 20, 5, 5]])
+        iou = iou_matrix(a, b)
+
+        assert iou.shape == (2, 3)
+        assert iou[0].tolist() == pytest.approx([1.0, 50 / 150, 0.0])
+        assert iou[1].tolist() == [0.0, 0.0, 0.0]
+
+    def test_nms_and_soft_nms(self):
+        """Test duplicates are suppressed (hard) or down-weighted (soft)."""
+        from src.utils.box_ops import nms, soft_nms
+
+        boxes = np.array([[0, 0, 10, 10], [1, 1, 10, 10], [50, 50, 10, 10]])
+        scores = np.array([0.8, 0.9, 0.7])
+
+        assert nms(boxes, scores, iou_threshold=0.5).tolist() == [1, 2]
+        assert nms(boxes, scores, max_outputs=1).tolist() == [1]
+
+        kept, decayed = soft_nms(boxes, scores)
+        assert kept.tolist() == [1, 2, 0]
+        assert decayed[0] == pytest.approx(0.9)
+        assert decayed[2] < 0.8
+
+    def test_weighted_box_fusion(self):
+        """Test overlapping boxes are averaged by score."""
+        from src.utils.box_ops import weighted_box_fusion
+
+        boxes = np.array([[0, 0, 10, 10], [2, 0, 10, 10], [100, 100, 10, 10]])
+        scores = np.array([0.75, 0.25, 0.5])
+        fused, fused_scores = weighted_box_fusion(boxes, scores, iou_threshold=0.5, num_sources=2)
+
+        assert fused[0].tolist() == pytest.approx([0.5, 0, 10, 10])
+        assert fused_scores.tolist() == pytest.approx([0.5, 0.25])
+
+    def test_detector_merge_uses_nms(self):
+        """Test the 'both' mode merge keeps the most confident duplicate."""
+        from src.core.face_detector import FaceDetector
+        from src.data.models import FaceRegion
+
+        detector = FaceDetector()
+        merged = detector._merge_detections(
+            [FaceRegion(0, 0, 40, 40, 0.9), FaceRegion(200, 0, 40, 40, 0.9)],
+            [FaceRegion(2, 2, 40, 40, 0.95)]
+        )
+
+        assert [(f.x, f.confidence) for f in merged] == [(2, 0.95), (200, 0.9)]